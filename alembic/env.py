@@ -75,6 +75,8 @@ load_dotenv()
 from core.models.member import Members, MemberStatus
 from core.models.attendance import Attendance
 from core.models.donation import Donation
+from core.models.rollup import DonationDailyRollup, AttendanceDailyRollup
+from core.models.donation_import import UnmatchedDonation
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,55 @@
+"""chapter closure table
+
+Revision ID: 1d7e3a9b5c42
+Revises: f8b2d4a6c013
+Create Date: 2026-10-17 16:02:17.540931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d7e3a9b5c42'
+down_revision: Union[str, Sequence[str], None] = 'f8b2d4a6c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "chapter_closure",
+        sa.Column("ancestor_id", sa.Uuid(), nullable=False),
+        sa.Column("descendant_id", sa.Uuid(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["chapters.id"]),
+        sa.ForeignKeyConstraint(["descendant_id"], ["chapters.id"]),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index("ix_chapter_closure_descendant_depth", "chapter_closure", ["descendant_id", "depth"], unique=False)
+    op.create_index(op.f("ix_chapters_parent_id"), "chapters", ["parent_id"], unique=False)
+
+    # Seed from the existing parent_id links (same walk as `python -m core.cli rebuild-chapter-closure`)
+    op.execute(
+        """
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM chapters
+            UNION ALL
+            SELECT tree.ancestor_id, c.id, tree.depth + 1
+            FROM tree JOIN chapters c ON c.parent_id = tree.descendant_id
+            WHERE tree.depth < 32
+        )
+        INSERT INTO chapter_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_chapters_parent_id"), table_name="chapters")
+    op.drop_index("ix_chapter_closure_descendant_depth", table_name="chapter_closure")
+    op.drop_table("chapter_closure")
@@ -0,0 +1,30 @@
+"""statement transaction references on donations
+
+Revision ID: 3c6f9a1e8d24
+Revises: 6a4c8e2d0f17
+Create Date: 2026-10-18 10:12:37.406215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c6f9a1e8d24'
+down_revision: Union[str, Sequence[str], None] = '6a4c8e2d0f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("donations", sa.Column("reference", sa.String(length=100), nullable=True))
+    op.create_unique_constraint("uq_donations_reference", "donations", ["reference"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_donations_reference", "donations", type_="unique")
+    op.drop_column("donations", "reference")
@@ -0,0 +1,43 @@
+"""attendance unique member/session/date
+
+Revision ID: 4b7e2a9c1d3f
+Revises: c1d65463f046
+Create Date: 2026-10-17 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2a9c1d3f'
+down_revision: Union[str, Sequence[str], None] = 'c1d65463f046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop duplicate marks first, keeping the most recently written row
+    op.execute(
+        """
+        DELETE FROM attendance a
+        USING attendance b
+        WHERE a.member_id = b.member_id
+          AND a.session_id = b.session_id
+          AND a.attendance_date = b.attendance_date
+          AND a.ctid < b.ctid
+        """
+    )
+    op.create_unique_constraint(
+        "uq_attendance_member_session_date",
+        "attendance",
+        ["member_id", "session_id", "attendance_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_attendance_member_session_date", "attendance", type_="unique")
@@ -0,0 +1,81 @@
+"""chapter rollup tables
+
+Revision ID: 6a4c8e2d0f17
+Revises: 1d7e3a9b5c42
+Create Date: 2026-10-17 16:48:03.227615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a4c8e2d0f17'
+down_revision: Union[str, Sequence[str], None] = '1d7e3a9b5c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "chapter_member_rollup",
+        sa.Column("chapter_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("chapter_id", "status"),
+    )
+    op.create_table(
+        "chapter_donation_rollup",
+        sa.Column("chapter_id", sa.Uuid(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("donation_type", sa.String(length=50), nullable=False),
+        sa.Column("total_amount", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("donation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("chapter_id", "month", "donation_type"),
+    )
+    op.create_table(
+        "chapter_attendance_rollup",
+        sa.Column("chapter_id", sa.Uuid(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attendance_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("chapter_id", "month", "status"),
+    )
+
+    # Backfill from existing rows (same aggregation as core.crud.rollup)
+    op.execute(
+        """
+        INSERT INTO chapter_member_rollup (chapter_id, status, member_count)
+        SELECT chapter_id, status, count(*)
+        FROM members WHERE chapter_id IS NOT NULL
+        GROUP BY chapter_id, status
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO chapter_donation_rollup (chapter_id, month, donation_type, total_amount, donation_count)
+        SELECT m.chapter_id, date_trunc('month', d.date)::date, d.donation_type, sum(d.amount), count(*)
+        FROM donations d JOIN members m ON m.id = d.member_id
+        WHERE m.chapter_id IS NOT NULL AND d.date IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO chapter_attendance_rollup (chapter_id, month, status, attendance_count)
+        SELECT m.chapter_id, date_trunc('month', a.attendance_date)::date, lower(coalesce(a.status, '')), count(*)
+        FROM attendance a JOIN members m ON m.id = a.member_id
+        WHERE m.chapter_id IS NOT NULL AND a.attendance_date IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("chapter_attendance_rollup")
+    op.drop_table("chapter_donation_rollup")
+    op.drop_table("chapter_member_rollup")
@@ -0,0 +1,42 @@
+"""attendance status index on lower(status)
+
+Revision ID: 7e2b5c9d4a18
+Revises: 3c6f9a1e8d24
+Create Date: 2026-10-18 14:05:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2b5c9d4a18'
+down_revision: Union[str, Sequence[str], None] = '3c6f9a1e8d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Status filters compare lower(status), which the plain column index cannot serve
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attendance_lower_status_date", "attendance",
+            [sa.text("lower(status)"), "attendance_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_attendance_status_date", table_name="attendance", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_attendance_status_date", "attendance", ["status", "attendance_date", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_attendance_lower_status_date", table_name="attendance", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,36 @@
+"""members trigram search index
+
+Revision ID: 8e3d5f0a7c21
+Revises: 4b7e2a9c1d3f
+Create Date: 2026-10-17 10:03:17.482911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3d5f0a7c21'
+down_revision: Union[str, Sequence[str], None] = '4b7e2a9c1d3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Expression index over the search document CRUDMember queries; this is
+    # core.crud.member.SEARCH_DOCUMENT_SQL as of this revision, frozen here
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_members_search_trgm ON members USING gin (("
+        "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+        "coalesce(member_code, '') || ' ' || coalesce(email, '') || ' ' || coalesce(phone, ''))"
+        ") gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_members_search_trgm")
@@ -0,0 +1,42 @@
+"""member code sequence
+
+Revision ID: a7c4e2f19b30
+Revises: d2a94c6b8e10
+Create Date: 2026-10-17 12:31:40.518822
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e2f19b30'
+down_revision: Union[str, Sequence[str], None] = 'd2a94c6b8e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SEQUENCE IF NOT EXISTS member_code_seq")
+    # Continue after the highest existing MEMnnnn code
+    op.execute(
+        """
+        SELECT setval(
+            'member_code_seq',
+            COALESCE(
+                (SELECT MAX(CAST(SUBSTRING(member_code FROM 4) AS BIGINT))
+                 FROM members WHERE member_code ~ '^MEM[0-9]+$'),
+                0
+            ) + 1,
+            false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP SEQUENCE IF EXISTS member_code_seq")
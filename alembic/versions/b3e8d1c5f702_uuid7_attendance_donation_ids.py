@@ -0,0 +1,52 @@
+"""uuid7 attendance and donation ids
+
+Revision ID: b3e8d1c5f702
+Revises: a7c4e2f19b30
+Create Date: 2026-10-17 12:58:03.771940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d1c5f702'
+down_revision: Union[str, Sequence[str], None] = 'a7c4e2f19b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# UUIDv7 built in SQL: the 48-bit ms timestamp of {ts} over a random v4 uuid,
+# with the version nibble flipped from 4 to 7.
+UUID7_SQL = (
+    "encode(set_bit(set_bit(overlay(uuid_send(gen_random_uuid()) placing "
+    "substring(int8send(floor(extract(epoch from {ts}) * 1000)::bigint) from 3) "
+    "from 1 for 6), 52, 1), 53, 1), 'hex')::uuid"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nothing references attendance.id or donations.id, so existing rows can be
+    # re-keyed in place, ordered by their own date. members.id and users.id are
+    # referenced by foreign keys and keep their uuid4 values; only new rows get
+    # time-ordered ids there.
+    op.execute(
+        "UPDATE attendance SET id = "
+        + UUID7_SQL.format(ts="coalesce(attendance_date::timestamp, now())")
+    )
+    op.execute(
+        "UPDATE donations SET id = "
+        + UUID7_SQL.format(ts="coalesce(date::timestamp, now())")
+    )
+    # The updates leave every old tuple dead; rebuild the primary key indexes
+    op.execute("REINDEX TABLE attendance")
+    op.execute("REINDEX TABLE donations")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # UUIDv7 values are valid uuids; there is nothing to convert back.
+    pass
@@ -0,0 +1,64 @@
+"""query pattern indexes
+
+Revision ID: c9f2a6e4d815
+Revises: b3e8d1c5f702
+Create Date: 2026-10-17 13:22:47.106395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f2a6e4d815'
+down_revision: Union[str, Sequence[str], None] = 'b3e8d1c5f702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, include) - keep in sync with the models' __table_args__
+INDEXES = [
+    ("ix_members_created_at_id", "members", ["created_at", "id"], None),
+    ("ix_members_status_created_at", "members", ["status", "created_at", "id"], None),
+    ("ix_members_chapter_created_at", "members", ["chapter_id", "created_at", "id"], None),
+    ("ix_members_user_id", "members", ["user_id"], None),
+    ("ix_donations_date_id", "donations", ["date", "id"], None),
+    ("ix_donations_type_date", "donations", ["donation_type", "date", "id"], None),
+    ("ix_donations_member_date", "donations", ["member_id", "date", "id"], ["amount", "donation_type"]),
+    ("ix_attendance_date_id", "attendance", ["attendance_date", "id"], ["session_id", "status"]),
+    ("ix_attendance_status_date", "attendance", ["status", "attendance_date", "id"], None),
+    ("ix_attendance_member_date", "attendance", ["member_id", "attendance_date", "id"], ["status"]),
+    ("ix_attendance_session_date", "attendance", ["session_id", "attendance_date"], None),
+]
+
+# Single-column indexes made redundant by the composites above
+REPLACED = [
+    ("ix_donations_member_id", "donations", ["member_id"]),
+    ("ix_attendance_attendance_date", "attendance", ["attendance_date"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction; writes keep flowing while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_include=include or [],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,63 @@
+"""daily rollup tables
+
+Revision ID: d2a94c6b8e10
+Revises: 8e3d5f0a7c21
+Create Date: 2026-10-17 11:26:52.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a94c6b8e10'
+down_revision: Union[str, Sequence[str], None] = '8e3d5f0a7c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "donation_daily_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("donation_type", sa.String(length=50), nullable=False),
+        sa.Column("total_amount", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("donation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "donation_type"),
+    )
+    op.create_table(
+        "attendance_daily_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("session_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attendance_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("day", "session_id", "status"),
+    )
+
+    # Backfill from existing rows (same aggregation as core.crud.rollup)
+    op.execute(
+        """
+        INSERT INTO donation_daily_rollup (day, donation_type, total_amount, donation_count)
+        SELECT date, donation_type, sum(amount), count(id)
+        FROM donations
+        WHERE date IS NOT NULL
+        GROUP BY date, donation_type
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO attendance_daily_rollup (day, session_id, status, attendance_count)
+        SELECT attendance_date, session_id, lower(coalesce(status, '')), count(id)
+        FROM attendance
+        GROUP BY attendance_date, session_id, lower(coalesce(status, ''))
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("attendance_daily_rollup")
+    op.drop_table("donation_daily_rollup")
@@ -0,0 +1,29 @@
+"""members user_id nullable
+
+Revision ID: e5a1f7c3b926
+Revises: c9f2a6e4d815
+Create Date: 2026-10-17 14:08:55.392017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1f7c3b926'
+down_revision: Union[str, Sequence[str], None] = 'c9f2a6e4d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Imported and staff-created members have no user account yet
+    op.alter_column("members", "user_id", existing_type=sa.Uuid(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("members", "user_id", existing_type=sa.Uuid(), nullable=False)
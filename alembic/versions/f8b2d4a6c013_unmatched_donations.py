@@ -0,0 +1,53 @@
+"""unmatched donations review queue
+
+Revision ID: f8b2d4a6c013
+Revises: e5a1f7c3b926
+Create Date: 2026-10-17 15:21:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b2d4a6c013'
+down_revision: Union[str, Sequence[str], None] = 'e5a1f7c3b926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "unmatched_donations",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("import_id", sa.Uuid(), nullable=False),
+        sa.Column("line", sa.Integer(), nullable=False),
+        sa.Column("donation_date", sa.Date(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("donation_type", sa.String(length=50), nullable=False),
+        sa.Column("payer_phone", sa.String(length=30), nullable=True),
+        sa.Column("payer_national_id", sa.String(length=50), nullable=True),
+        sa.Column("payer_code", sa.String(length=50), nullable=True),
+        sa.Column("payer_name", sa.String(length=200), nullable=True),
+        sa.Column("reference", sa.String(length=100), nullable=True),
+        sa.Column("narration", sa.String(length=200), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("resolved_member_id", sa.Uuid(), nullable=True),
+        sa.Column("resolved_donation_id", sa.Uuid(), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["resolved_member_id"], ["members.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("reference", name="uq_unmatched_donations_reference"),
+    )
+    op.create_index(op.f("ix_unmatched_donations_import_id"), "unmatched_donations", ["import_id"], unique=False)
+    op.create_index(op.f("ix_unmatched_donations_resolved_at"), "unmatched_donations", ["resolved_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_unmatched_donations_resolved_at"), table_name="unmatched_donations")
+    op.drop_index(op.f("ix_unmatched_donations_import_id"), table_name="unmatched_donations")
+    op.drop_table("unmatched_donations")
@@ -2,21 +2,30 @@ from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
-import os
 from dotenv import load_dotenv
+from app.db_settings import EngineSettings, install_slow_query_log
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+engine_settings = EngineSettings.from_env()
+DATABASE_URL = engine_settings.url
 
-# Async engine
-engine = create_async_engine(DATABASE_URL, echo=True)
+# Async engine (pool, echo and statement cache come from the DB_* env vars)
+engine = create_async_engine(DATABASE_URL, **engine_settings.engine_kwargs())
+install_slow_query_log(engine, engine_settings.slow_query_ms)
 
 # Async session
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Request-scoped session, shared by every router and auth dependency.
+# FastAPI caches dependencies per request, so all Depends(get_session) in one
+# request get this same session; it only checks out a connection on first use.
+async def get_session() -> AsyncSession:
+    async with async_session() as session:
+        yield session
+
 # Utility to create tables
 async def init_db():
     async with engine.begin() as conn:
@@ -0,0 +1,158 @@
+# app/db_settings.py
+# Engine profile for the async database engine: pool sizing, timeouts, asyncpg
+# statement cache, SQL echo and the slow-query log, all driven by env vars.
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+slow_query_logger = logging.getLogger("app.db.slow")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    val = os.getenv(name)
+    if val is None:
+        return default
+    return val.strip().lower() in ("1", "true", "yes", "on")
+
+
+# ---------------------------
+# Settings
+# ---------------------------
+@dataclass(frozen=True)
+class EngineSettings:
+    url: str
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    echo: bool = False
+    slow_query_ms: float = 500.0
+
+    @classmethod
+    def from_env(cls) -> "EngineSettings":
+        return cls(
+            url=os.getenv("DATABASE_URL"),
+            pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", 30)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", True),
+            # 0 disables prepared statement caching (needed behind pgbouncer in transaction mode)
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100)),
+            echo=_env_bool("DB_ECHO", False),
+            slow_query_ms=float(os.getenv("DB_SLOW_QUERY_MS", 500)),
+        )
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "echo": self.echo,
+            "poolclass": InstrumentedPool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        if self.url and self.url.startswith("postgresql+asyncpg"):
+            # SQLAlchemy's prepared statement cache plus asyncpg's own one
+            kwargs["connect_args"] = {
+                "prepared_statement_cache_size": self.statement_cache_size,
+                "statement_cache_size": self.statement_cache_size,
+            }
+        return kwargs
+
+
+# ---------------------------
+# Pool metrics
+# Kept outside the pool, which is replaced on engine.dispose().
+# ---------------------------
+class PoolMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.slow_queries = 0
+
+    def record_checkout(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that times how long each checkout waits for a free connection."""
+
+    def _do_get(self):
+        started = time.monotonic()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.record_checkout(time.monotonic() - started)
+        return conn
+
+
+def pool_stats(engine, settings: EngineSettings) -> Dict[str, Any]:
+    pool = engine.pool
+    done = pool_metrics.checkouts or 1
+    stats: Dict[str, Any] = {
+        "checkouts": pool_metrics.checkouts,
+        "timeouts": pool_metrics.timeouts,
+        "avg_wait_ms": round(pool_metrics.total_wait / done * 1000, 2),
+        "max_wait_ms": round(pool_metrics.max_wait * 1000, 2),
+        "slow_queries": pool_metrics.slow_queries,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        # max_overflow = -1 means no cap on overflow connections, so no utilization ratio
+        unbounded = settings.max_overflow < 0
+        capacity = pool.size() + settings.max_overflow
+        checked_out = pool.checkedout()
+        stats.update({
+            "pool_size": pool.size(),
+            "max_overflow": None if unbounded else settings.max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "utilization": round(checked_out / capacity, 3) if not unbounded and capacity > 0 else None,
+        })
+    return stats
+
+
+# ---------------------------
+# Slow-query log
+# Only statements slower than slow_query_ms are logged, instead of echoing everything.
+# ---------------------------
+def install_slow_query_log(engine, threshold_ms: float) -> None:
+    if threshold_ms <= 0:
+        return
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.monotonic())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _log_slow(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.monotonic() - conn.info["query_start"].pop()) * 1000
+        if elapsed_ms >= threshold_ms:
+            pool_metrics.slow_queries += 1
+            slow_query_logger.warning("slow query (%.1f ms): %s", elapsed_ms, statement)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _drop_timer(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
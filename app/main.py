@@ -1,7 +1,7 @@
 # main.py
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, JSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 # --- Import database and models ---
@@ -13,16 +13,15 @@ from core.models.donation import Donation
 
 # --- Import routers ---
 from app.core.routers import auth_ui
-from core.routers import events
 from core.auth.routers import router_ui, router_api
 from core.routers.ui import members_ui, donation_ui, attendance_ui, dashboard_ui
-from core.routers.api import members_api, donations_api, attendance_api, dashboard_api
+from core.routers.api import members_api, donations_api, attendance_api, dashboard_api, metrics_api
 import os
 # from starlette.middleware.base import BaseHTTPMiddleware
 from core.auth.deps import get_current_user
 
-# --- Import JWT handler for auth ---   
-from core.auth.jwt_handler import decode_access_token
+# --- Import request auth context ---   
+from core.auth.context import resolve_auth
 app = FastAPI(title="FFWPU-UG ERP Core System")
 
 """
@@ -34,42 +33,30 @@ class UserContextMiddleware(BaseHTTPMiddleware):
 """
 
 SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkey") 
-app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
 # app.add_middleware(UserContextMiddleware)
 # --- Mount static files ---
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 @app.middleware("http")
 async def hybrid_auth_middleware(request: Request, call_next):
-    request.state.user = None
-    request.state.is_authenticated = False
-
-    token = None
-
-    # 1️⃣ Try UI session
-    if "session" in request.scope:
-        token = request.session.get("token")
-
-    # 2️⃣ Try API header
-    if not token and "authorization" in request.headers:
-        auth_header = request.headers.get("authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-
-    # 3️⃣ Decode if available
-    if token:
-        try:
-            payload = decode_access_token(token)
-            request.state.user = payload
-            request.state.is_authenticated = True
-        except Exception:
-            if "session" in request.scope:
-                request.session.clear()
-            request.state.user = None
-            request.state.is_authenticated = False
+    # Decode the token once; dependencies read request.state.auth
+    ctx = resolve_auth(request)
+
+    if ctx.error:
+        # A bad API token is rejected here, before any route or DB session runs
+        if ctx.source == "bearer":
+            return JSONResponse({"detail": ctx.error}, status_code=401)
+        if "session" in request.scope:
+            request.session.clear()
+
+    request.state.user = ctx.payload
+    request.state.is_authenticated = ctx.is_authenticated
 
     return await call_next(request)
 
+# Added last so it wraps the auth middleware and request.session is set there
+app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
+
 # Force root "/" → login screen
 @app.get("/", include_in_schema=False)
 async def root(request: Request):
@@ -91,6 +78,7 @@ app.include_router(members_api.router, prefix="/api/members", tags=["Members-API
 app.include_router(donations_api.router, prefix="/api/donations", tags=["Donations-API"])
 app.include_router(attendance_api.router, prefix="/api/attendance", tags=["Attendance-API"])
 app.include_router(dashboard_api.router, prefix="/api/dashboard", tags=["Dashboard-API"])
+app.include_router(metrics_api.router, prefix="/api/metrics", tags=["Metrics-API"])
 
 # --- Database initialization ---
 @app.on_event("startup")
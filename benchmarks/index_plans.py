@@ -0,0 +1,66 @@
+# benchmarks/index_plans.py
+"""
+Before/after plans for the query-pattern index pack (migration c9f2a6e4d815).
+
+    python -m benchmarks.index_plans [--analyze]
+
+"Before" drops the pack and restores the single-column indexes it replaced,
+inside a transaction that is rolled back; "after" runs against the live
+schema. Dropping takes an exclusive lock, so BENCH_DATABASE_URL must point at a
+local or staging database (see benchmarks.seed). ANALYZE executes every statement.
+"""
+import argparse
+import asyncio
+
+from benchmarks.plans import bench_engine, explain, summary
+from benchmarks.queries import catalogue, compile_sql, load_samples
+
+INDEX_PACK = {
+    "members": ["ix_members_created_at_id", "ix_members_status_created_at", "ix_members_chapter_created_at", "ix_members_user_id"],
+    "donations": ["ix_donations_date_id", "ix_donations_type_date", "ix_donations_member_date"],
+    "attendance": ["ix_attendance_date_id", "ix_attendance_lower_status_date", "ix_attendance_member_date", "ix_attendance_session_date"],
+}
+REPLACED = [
+    "CREATE INDEX ix_donations_member_id ON donations (member_id)",
+    "CREATE INDEX ix_attendance_attendance_date ON attendance (attendance_date)",
+]
+
+
+async def _plans(conn, cases, analyze: bool) -> dict:
+    return {case.name: await explain(conn, compile_sql(case.stmt), analyze) for case in cases}
+
+
+async def run(analyze: bool) -> None:
+    engine = bench_engine()
+    async with engine.connect() as conn:
+        queries = catalogue(await load_samples(conn))
+        await conn.rollback()
+
+        trans = await conn.begin()
+        for indexes in INDEX_PACK.values():
+            for name in indexes:
+                await conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        for ddl in REPLACED:
+            await conn.exec_driver_sql(ddl.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS"))
+        before = await _plans(conn, queries, analyze)
+        await trans.rollback()
+
+        async with conn.begin():
+            after = await _plans(conn, queries, analyze)
+    await engine.dispose()
+
+    for case in queries:
+        print(case.name)
+        print(f"  before: {summary(before[case.name])}")
+        print(f"  after:  {summary(after[case.name])}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.index_plans")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE (executes the statements)")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.analyze))
+
+
+if __name__ == "__main__":
+    main()
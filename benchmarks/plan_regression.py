@@ -0,0 +1,65 @@
+# benchmarks/plan_regression.py
+"""
+Plan-regression check over a seeded database (run benchmarks.seed first).
+
+    python -m benchmarks.plan_regression [--analyze] [--only members.] [--save plans.json]
+
+Every Case in benchmarks.queries is EXPLAINed. A case fails when its plan
+reads a table with a Seq Scan it is not allowed to, or when its total cost
+exceeds its budget. Exits 1 on any failure, so it can gate CI or a deploy.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from benchmarks.plans import bench_engine, explain, summary, walk
+from benchmarks.queries import catalogue, compile_sql, load_samples
+
+
+def check(case, plan) -> list:
+    problems = []
+    for node in walk(plan):
+        table = node.get("Relation Name")
+        if node["Node Type"] == "Seq Scan" and table not in case.allow_seq_scan:
+            problems.append(f"Seq Scan on {table}")
+    if plan["Total Cost"] > case.max_cost:
+        problems.append(f"cost {plan['Total Cost']:.0f} > budget {case.max_cost:.0f}")
+    return problems
+
+
+async def run(args) -> int:
+    engine = bench_engine()
+    plans, failures = {}, 0
+    async with engine.connect() as conn:
+        cases = catalogue(await load_samples(conn))
+        if args.only:
+            cases = [c for c in cases if c.name.startswith(args.only)]
+        for case in cases:
+            plan = await explain(conn, compile_sql(case.stmt), args.analyze)
+            plans[case.name] = plan
+            problems = check(case, plan)
+            failures += bool(problems)
+            print(f"{'FAIL' if problems else 'ok  '} {case.name}: {summary(plan)}")
+            for problem in problems:
+                print(f"       {problem}")
+    await engine.dispose()
+
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump(plans, fh, indent=2, default=str)
+
+    print(f"\n{len(plans) - failures}/{len(plans)} plans within budget")
+    return 1 if failures else 0
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.plan_regression")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE (executes the statements)")
+    parser.add_argument("--only", help="run cases whose name starts with this prefix")
+    parser.add_argument("--save", help="write the JSON plans to this file")
+    sys.exit(asyncio.run(run(parser.parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
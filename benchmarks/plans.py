@@ -0,0 +1,50 @@
+# benchmarks/plans.py
+import json
+import os
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+def bench_engine():
+    """Engine for the benchmark database. Seeding and index drops are destructive, so
+    this reads BENCH_DATABASE_URL and never falls back to the app's DATABASE_URL."""
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Set BENCH_DATABASE_URL to a local/staging database (postgresql+asyncpg://...)")
+    return create_async_engine(url)
+
+
+async def explain(conn, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    """Top plan node of EXPLAIN (FORMAT JSON); ANALYZE executes the statement."""
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    plan = (await conn.exec_driver_sql(f"EXPLAIN ({options}) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def scans(node: Dict[str, Any]) -> List[str]:
+    """'Seq Scan on members', 'Index Scan using ix_... on donations', ... for every scan node."""
+    out = []
+    for n in walk(node):
+        if "Relation Name" not in n:
+            continue
+        label = n["Node Type"]
+        if n.get("Index Name"):
+            label += f" using {n['Index Name']}"
+        out.append(f"{label} on {n['Relation Name']}")
+    return out
+
+
+def summary(node: Dict[str, Any]) -> str:
+    text = f"cost={node['Total Cost']:.1f}"
+    if "Actual Total Time" in node:
+        text += f" time={node['Actual Total Time']:.2f}ms"
+    return f"{text} | {'; '.join(scans(node)) or node['Node Type']}"
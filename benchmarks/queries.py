@@ -0,0 +1,126 @@
+# benchmarks/queries.py
+"""
+The list, count, search and dashboard statements the UI and API issue, built
+with the app's own CRUD/KPI helpers so the plans are for the SQL that runs.
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, FrozenSet, List, Optional
+
+from sqlalchemy import desc, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.future import select
+
+from core.crud.base import encode_cursor
+from core.crud.member import member_crud
+from core.crud.donation import donation_crud
+from core.crud.attendance import attendance_crud
+from core.crud.kpi import dashboard_kpis_stmt, activity_summary_stmt, daily_trends_stmt, chapter_rollups_stmt, chapter_tree_stmts, month_window_start
+from core.models.member import Members, MemberStatus
+from core.models.donation import Donation, DonationType
+from core.models.attendance import Attendance, AttendanceStatus
+
+# Placeholder keys for plain EXPLAIN; load_samples() swaps in real ones
+SAMPLE_IDS = {
+    "member_id": uuid.UUID(int=1),
+    "user_id": uuid.UUID(int=2),
+    "chapter_id": uuid.UUID(int=3),
+    "session_id": uuid.UUID(int=4),
+}
+
+# Default cost budget (planner units) for cases without their own
+DEFAULT_MAX_COST = 5000.0
+
+
+@dataclass
+class Case:
+    name: str
+    stmt: object
+    # Tables this statement may read with a Seq Scan (whole-table aggregates, small tables)
+    allow_seq_scan: FrozenSet[str] = field(default_factory=frozenset)
+    max_cost: float = DEFAULT_MAX_COST
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+async def load_samples(conn) -> Dict[str, uuid.UUID]:
+    """Real keys from a seeded database: a member with history, its user, chapter and a busy session."""
+    member = (await conn.execute(
+        select(Members.id, Members.user_id, Members.chapter_id)
+        .where(Members.chapter_id.is_not(None))
+        .order_by(Members.created_at.desc()).limit(1)
+    )).first()
+    session_id = (await conn.execute(select(Attendance.session_id).limit(1))).scalar()
+    samples = {}
+    if member:
+        samples.update(member_id=member.id, user_id=member.user_id, chapter_id=member.chapter_id)
+    if session_id:
+        samples["session_id"] = session_id
+    return samples
+
+
+def catalogue(samples: Optional[Dict[str, uuid.UUID]] = None, today: Optional[date] = None) -> List[Case]:
+    ids = {**SAMPLE_IDS, **(samples or {})}
+    today = today or date.today()
+    since = today - timedelta(days=30)
+    cursor = encode_cursor(since, ids["member_id"])
+    whole_table = 1e9  # full aggregates are budgeted by the seq-scan rule, not cost
+
+    return [
+        # members_ui / members_api
+        Case("members.list", member_crud.select_stmt(order_by="created_at")),
+        Case("members.list_keyset", member_crud.select_stmt(order_by="created_at", cursor=encode_cursor(datetime.combine(since, time()), ids["member_id"]))),
+        Case("members.list_by_status", member_crud.select_stmt(filters={"status": MemberStatus.active.value}, order_by="created_at")),
+        Case("members.list_by_chapter", member_crud.select_stmt(filters={"chapter_id": ids["chapter_id"]}, order_by="created_at")),
+        Case("members.count_by_chapter", member_crud.count_stmt(filters={"chapter_id": ids["chapter_id"]})),
+        Case("members.by_user", select(Members).where(Members.user_id == ids["user_id"])),
+        # Ranked trigram search sorts every match before LIMIT; common names match thousands
+        Case("members.search", member_crud.search_stmt("john"), max_cost=20000.0),
+        # Exact unfiltered count: only runs while reltuples is under COUNT_ESTIMATE_THRESHOLD
+        Case("members.count_all", member_crud.count_stmt(), allow_seq_scan=frozenset({"members"})),
+        # Below the estimate threshold the list page counts with count(*) OVER (), reading every match
+        Case("members.page_with_total_by_chapter", member_crud.page_with_total_stmt(filters={"chapter_id": ids["chapter_id"]}, order_by="created_at")),
+        # members_api: keyset page, search as a plain condition
+        Case("members.api_search", member_crud.keyset_page_stmt(order_by="created_at", conditions=[member_crud.search_condition("john")])[0], max_cost=20000.0),
+        # dashboard_ui (admin)
+        Case("members.recent", select(Members).order_by(desc(Members.created_at)).limit(5)),
+        Case("donations.recent", select(Donation).order_by(desc(Donation.donation_date)).limit(7)),
+        Case("attendance.recent", select(Attendance).order_by(desc(Attendance.id)).limit(10)),
+        Case("dashboard.kpis", dashboard_kpis_stmt(today), allow_seq_scan=frozenset({"members", "donation_daily_rollup", "attendance_daily_rollup"}), max_cost=whole_table),
+        # dashboard_ui (staff window, member history)
+        Case("dashboard.activity", activity_summary_stmt(since=since)),
+        Case("dashboard.member_activity", activity_summary_stmt(member_id=ids["member_id"])),
+        Case("dashboard.trends", daily_trends_stmt(30)),
+        # Staff dashboard detail lists: the window count reads the whole period
+        Case("dashboard.staff_donations", donation_crud.page_with_total_stmt(order_by="donation_date", conditions=[Donation.donation_date >= since])),
+        Case("dashboard.staff_attendance", attendance_crud.page_with_total_stmt(order_by="attendance_date", conditions=[Attendance.attendance_date >= since])),
+        # Region rollups and the chapter tree: small per-chapter rollups summed over chapter_closure
+        Case("dashboard.regions", chapter_rollups_stmt("region", month_window_start(1, today)), allow_seq_scan=frozenset({"chapters", "chapter_closure", "chapter_member_rollup", "chapter_donation_rollup", "chapter_attendance_rollup"}), max_cost=whole_table),
+        *[
+            Case(f"dashboard.chapter_tree.{part}", stmt, allow_seq_scan=frozenset({"chapter_closure", f"chapter_{part}_rollup"}), max_cost=whole_table)
+            for part, stmt in zip(("member", "donation", "attendance"), chapter_tree_stmts(month_window_start(12, today)))
+        ],
+        # donation_ui / donations_api
+        Case("donations.list", donation_crud.select_stmt(order_by="donation_date")),
+        Case("donations.list_keyset", donation_crud.select_stmt(order_by="donation_date", cursor=cursor)),
+        Case("donations.list_by_type", donation_crud.select_stmt(filters={"donation_type": DonationType.tithe.value}, order_by="donation_date")),
+        Case("donations.window", donation_crud.select_stmt(order_by="donation_date", conditions=[Donation.donation_date >= since])),
+        Case("donations.count_window", donation_crud.count_stmt(conditions=[Donation.donation_date >= since])),
+        Case("donations.by_member", donation_crud.select_stmt(filters={"member_id": ids["member_id"]}, order_by="donation_date")),
+        Case("donations.by_chapter", donation_crud.select_stmt(filters={"chapter_id": ids["chapter_id"]}, order_by="donation_date")),
+        Case("donations.api_by_member", donation_crud.keyset_page_stmt(filters={"member_id": ids["member_id"]}, order_by="donation_date")[0]),
+        # attendance_ui / attendance_api
+        Case("attendance.list", attendance_crud.select_stmt(order_by="attendance_date")),
+        Case("attendance.list_keyset", attendance_crud.select_stmt(order_by="attendance_date", cursor=cursor)),
+        Case("attendance.list_by_status", attendance_crud.select_stmt(filters={"status": AttendanceStatus.present.value}, order_by="attendance_date")),
+        Case("attendance.window", attendance_crud.select_stmt(order_by="attendance_date", conditions=[Attendance.attendance_date >= since])),
+        Case("attendance.count_window", attendance_crud.count_stmt(conditions=[Attendance.attendance_date >= since])),
+        Case("attendance.by_member", attendance_crud.select_stmt(filters={"member_id": ids["member_id"]}, order_by="attendance_date")),
+        Case("attendance.by_chapter", attendance_crud.select_stmt(filters={"chapter_id": ids["chapter_id"]}, order_by="attendance_date")),
+        # attendance_api: keyset page filtered on lower(status)
+        Case("attendance.api_by_status", attendance_crud.keyset_page_stmt(filters={"status": AttendanceStatus.present.value}, order_by="attendance_date")[0]),
+        Case("attendance.session_day", select(Attendance).where(Attendance.session_id == ids["session_id"], Attendance.attendance_date == today)),
+    ]
@@ -0,0 +1,166 @@
+# benchmarks/seed.py
+"""
+Seed BENCH_DATABASE_URL with a realistic volume of chapters, users, members,
+sessions, donations and attendance, then rebuild the rollups and ANALYZE.
+
+    python -m benchmarks.seed [--members 50000] [--donations 500000] [--attendance 1000000] [--reset]
+
+Rows are generated server-side with generate_series. Nothing calls random():
+keys come from md5(prefix || n), and amounts, dates and the random half of the
+uuid7 ids are arithmetic on n, so a rerun on the same day produces the same
+rows (and the same plans and costs).
+"""
+import argparse
+import asyncio
+import time
+
+from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.plans import bench_engine
+from core.crud.member import SEARCH_DOCUMENT_SQL
+from core.crud.rollup import rebuild_rollups
+from core.crud.chapter import chapter_crud
+from core.models import user, chapter, event, event_session, member, donation, attendance, rollup  # noqa: F401 (register tables)
+from core.models.attendance import AttendanceStatus
+from core.models.donation import DonationType
+from core.models.member import MemberStatus
+
+HISTORY_DAYS = 730
+FIRST_NAMES = ["John", "Mary", "Peter", "Grace", "Joseph", "Sarah", "David", "Esther", "Moses", "Ruth", "Paul", "Agnes", "Isaac", "Joan", "Samuel", "Rose"]
+LAST_NAMES = ["Okello", "Namubiru", "Mugisha", "Achieng", "Kato", "Nakato", "Ssempala", "Auma", "Tumusiime", "Nabirye", "Opio", "Kyomuhendo"]
+
+
+def _uuid7_sql(ts: str, random_uuid: str = "gen_random_uuid()") -> str:
+    """SQL for a UUIDv7 at timestamp expression `ts`: the 48-bit ms prefix laid over
+    the uuid `random_uuid`, then the version (0111) and variant (10) bits forced.
+    The seed passes md5(...)::uuid so its ids repeat between runs."""
+    # set_bit numbers bits from the low end of each byte: 52-55 are byte 6's
+    # high nibble, 70-71 the top of byte 8
+    value = (
+        f"overlay(uuid_send({random_uuid}) placing "
+        f"substring(int8send(floor(extract(epoch from {ts}) * 1000)::bigint) from 3) from 1 for 6)"
+    )
+    for bit, on in ((52, 1), (53, 1), (54, 1), (55, 0), (70, 0), (71, 1)):
+        value = f"set_bit({value}, {bit}, {on})"
+    return f"encode({value}, 'hex')::uuid"
+
+
+def _sql_array(values) -> str:
+    return "ARRAY[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+
+def _statements(args) -> list:
+    member_statuses = [MemberStatus.active.value] * 7 + [MemberStatus.inactive.value, MemberStatus.alumni.value, MemberStatus.guest.value]
+    return [
+        ("chapters", f"""
+            INSERT INTO chapters (id, name, parent_id, type, active)
+            SELECT md5('c' || n)::uuid, 'Chapter ' || n,
+                   CASE WHEN n > 1 THEN md5('c' || (1 + (n - 2) / 5))::uuid END,
+                   CASE WHEN n = 1 THEN 'national' WHEN n <= 6 THEN 'region' ELSE 'center' END,
+                   true
+            FROM generate_series(1, {args.chapters}) AS n
+            ON CONFLICT DO NOTHING"""),
+        ("users", f"""
+            INSERT INTO users (id, username, email, password_hash, status, created_at)
+            SELECT md5('u' || n)::uuid, 'user' || n, 'user' || n || '@bench.local', 'x', 'active',
+                   now() - make_interval(days => ({HISTORY_DAYS} * n / {args.members})::int)
+            FROM generate_series(1, {args.members}) AS n
+            ON CONFLICT DO NOTHING"""),
+        ("members", f"""
+            INSERT INTO members (id, user_id, member_code, first_name, last_name, gender, phone, email,
+                                 chapter_id, status, join_date, created_at, updated_at)
+            SELECT md5('m' || n)::uuid, md5('u' || n)::uuid, 'MEM' || lpad(n::text, 6, '0'),
+                   ({_sql_array(FIRST_NAMES)})[1 + n % {len(FIRST_NAMES)}],
+                   ({_sql_array(LAST_NAMES)})[1 + (n / {len(FIRST_NAMES)}) % {len(LAST_NAMES)}],
+                   CASE WHEN n % 2 = 0 THEN 'male' ELSE 'female' END,
+                   '+2567' || lpad(n::text, 8, '0'), 'member' || n || '@bench.local',
+                   CASE WHEN n % 10 <> 0 THEN md5('c' || (1 + n % {args.chapters}))::uuid END,
+                   ({_sql_array(member_statuses)})[1 + n % {len(member_statuses)}],
+                   current_date - ({HISTORY_DAYS} - {HISTORY_DAYS} * n / {args.members}),
+                   now() - make_interval(days => ({HISTORY_DAYS} - {HISTORY_DAYS} * n / {args.members})::int),
+                   now()
+            FROM generate_series(1, {args.members}) AS n
+            ON CONFLICT DO NOTHING"""),
+        ("events", """
+            INSERT INTO events (id, title) VALUES (md5('e1')::uuid, 'Sunday Service') ON CONFLICT DO NOTHING"""),
+        ("event_sessions", f"""
+            INSERT INTO event_sessions (id, event_id, title)
+            SELECT md5('s' || n)::uuid, md5('e1')::uuid, 'Session ' || n
+            FROM generate_series(0, {args.sessions - 1}) AS n
+            ON CONFLICT DO NOTHING"""),
+        # One session per day; each day's attendees are a slice of the member list
+        ("attendance", f"""
+            INSERT INTO attendance (id, member_id, session_id, attendance_date, status)
+            SELECT {_uuid7_sql("d.day::timestamp", "md5('a' || i)::uuid")},
+                   md5('m' || (1 + (i / {HISTORY_DAYS}) % {args.members}))::uuid,
+                   md5('s' || ((i % {HISTORY_DAYS}) % {args.sessions}))::uuid,
+                   d.day,
+                   ({_sql_array([s.value for s in AttendanceStatus] + [AttendanceStatus.present.value] * 4)})[1 + i % 8]
+            FROM generate_series(0, {args.attendance - 1}) AS i,
+                 LATERAL (SELECT current_date - (i % {HISTORY_DAYS}) AS day) AS d
+            ON CONFLICT DO NOTHING"""),
+        ("donations", f"""
+            INSERT INTO donations (id, member_id, amount, donation_type, date)
+            SELECT {_uuid7_sql("d.day::timestamp", "md5('d' || i)::uuid")},
+                   md5('m' || (1 + (i::bigint * 7919) % {args.members}))::uuid,
+                   5000 + ((i::bigint * 7907) % 1951) * 100,
+                   ({_sql_array([t.value for t in DonationType])})[1 + i % {len(DonationType)}],
+                   d.day
+            FROM generate_series(0, {args.donations - 1}) AS i,
+                 LATERAL (SELECT current_date - ((i::bigint * 104729) % {HISTORY_DAYS})::int AS day) AS d
+            ON CONFLICT DO NOTHING"""),
+    ]
+
+
+async def run(args) -> None:
+    engine = bench_engine()
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_members_search_trgm ON members "
+            f"USING gin (({SEARCH_DOCUMENT_SQL.format(t='')}) gin_trgm_ops)"
+        )
+        if args.reset:
+            await conn.exec_driver_sql(
+                "TRUNCATE attendance, donations, members, users, event_sessions, events, chapters, "
+                "chapter_closure, donation_daily_rollup, attendance_daily_rollup, "
+                "chapter_member_rollup, chapter_donation_rollup, chapter_attendance_rollup CASCADE"
+            )
+
+    for table, sql in _statements(args):
+        started = time.monotonic()
+        async with engine.begin() as conn:
+            result = await conn.exec_driver_sql(sql)
+        print(f"{table}: {result.rowcount} rows in {time.monotonic() - started:.1f}s")
+
+    async with AsyncSession(engine) as session:
+        await rebuild_rollups(session)
+        await chapter_crud.rebuild_closure(session)
+        await session.commit()
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("SELECT setval('member_code_seq', (SELECT count(*) FROM members) + 1, false)")
+    # VACUUM cannot run in a transaction; it also sets the visibility map for index-only scans
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM ANALYZE")
+    await engine.dispose()
+    print("Seeded and analyzed.")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed")
+    parser.add_argument("--chapters", type=int, default=60)
+    parser.add_argument("--members", type=int, default=50_000)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--donations", type=int, default=500_000)
+    parser.add_argument("--attendance", type=int, default=1_000_000)
+    parser.add_argument("--reset", action="store_true", help="truncate the seeded tables first")
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
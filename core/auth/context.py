@@ -0,0 +1,57 @@
+# core/auth/context.py
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from fastapi import HTTPException, Request
+from core.auth.jwt_handler import decode_access_token
+
+
+@dataclass
+class AuthContext:
+    """The request's token, decoded once by hybrid_auth_middleware and shared by every auth dependency."""
+    token: Optional[str] = None
+    source: Optional[str] = None  # "session" or "bearer"
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self.payload is not None
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.payload.get("sub") if self.payload else None
+
+
+def resolve_auth(request: Request) -> AuthContext:
+    ctx = AuthContext()
+
+    # 1️⃣ Try UI session
+    if "session" in request.scope:
+        ctx.token = request.session.get("token")
+        if ctx.token:
+            ctx.source = "session"
+
+    # 2️⃣ Try API header
+    if not ctx.token:
+        auth_header = request.headers.get("authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            ctx.token = auth_header.split(" ", 1)[1]
+            ctx.source = "bearer"
+
+    # 3️⃣ Decode if available
+    if ctx.token:
+        try:
+            ctx.payload = decode_access_token(ctx.token)
+        except HTTPException as e:
+            ctx.error = e.detail
+        except Exception:
+            ctx.error = "Invalid token"
+
+    request.state.auth = ctx
+    return ctx
+
+
+def get_auth_context(request: Request) -> AuthContext:
+    """The context filled by the middleware; resolved here only if the middleware did not run."""
+    ctx = getattr(request.state, "auth", None)
+    return ctx if ctx is not None else resolve_auth(request)
@@ -3,19 +3,21 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from core.auth.jwt_handler import decode_access_token
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import async_session
+from app.database import get_session
 from core.models.user import User, Role, UserRole
 from core.schemas.user import UserRead
+from core.auth.principal_cache import principal_cache
+from core.auth.context import get_auth_context
+from core.auth.roles import compile_requirement, role_mask
 from sqlmodel import select
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
-# Dependency
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
-async def get_current_user_api(token: str = Depends(oauth2_scheme)):
+async def get_current_user_api(request: Request, token: str = Depends(oauth2_scheme)):
+    # Reuse the middleware's decode when it saw the same header token
+    ctx = get_auth_context(request)
+    if ctx.source == "bearer" and ctx.token == token and ctx.payload:
+        return ctx.payload
     try:
         payload = decode_access_token(token)
         return payload  # or lookup user in DB
@@ -28,45 +30,25 @@ async def require_login(request: Request):
     if user_id:
         return {"sub": user_id}  # mimic token payload
 
-    # ✅ Fallback to API auth
-    token = request.headers.get("Authorization")
-    if token:
-        return await get_current_user_api(token.split(" ")[1])
+    # ✅ Fallback to the token decoded by the middleware
+    ctx = get_auth_context(request)
+    if ctx.payload:
+        return ctx.payload
 
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
 async def get_current_user_ui(
     request: Request, session: AsyncSession = Depends(get_session)
 ):
-    token = request.session.get("token")
-    payload = decode_access_token(token) if token else None
-    if not payload:
+    ctx = get_auth_context(request)
+    if ctx.source != "session" or not ctx.payload:
         return None
-    return await session.get(User, payload.get("sub"))
-
-async def get_current_user(request: Request, db: AsyncSession = Depends(get_session)) -> User:
-    # Get token from session
-    token = request.session.get("token")
-    user = None
-
-    if token:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if user_id:
-            user = await db.get(User, user_id)
+    return await session.get(User, ctx.user_id)
 
-    # Fallback to API Bearer token
+async def _load_principal(db: AsyncSession, user_id) -> UserRead | None:
+    user = await db.get(User, user_id)
     if not user:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            payload = decode_access_token(token)
-            user_id = payload.get("sub")
-            if user_id:
-                user = await db.get(User, user_id)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+        return None
 
     result = await db.execute(
         select(Role.name).join(UserRole, UserRole.role_id == Role.id)
@@ -74,15 +56,26 @@ async def get_current_user(request: Request, db: AsyncSession = Depends(get_sess
     )
     roles = result.scalars().all()
 
-    user_out = UserRead(
+    return UserRead(
         id=user.id,
         username=user.username,
         email=user.email,
         status=user.status,
         last_login_at=user.last_login_at,
         created_at=user.created_at,
-        role_names=roles
+        role_names=roles,
     )
+
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_session)) -> User:
+    # Session or Bearer token, already decoded once by the middleware
+    user_id = get_auth_context(request).user_id
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    # User + roles come from the principal cache; the DB is only hit on a miss
+    user_out = await principal_cache.get_or_set(str(user_id), lambda: _load_principal(db, user_id))
+    if not user_out:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     return user_out
 """
 def require_roles(*allowed_roles: str):
@@ -140,51 +133,19 @@ def _extract_roles_from_obj(obj: any) -> list | None:
 def require_roles(*allowed_roles: str):
     """
     Role dependency that:
-      - reads roles from the user object if present
-      - otherwise loads the user row from DB and inspects it
+      - compiles the role hierarchy into a bitmask once, when the dependency is created
+      - checks it against the roles on the principal (principal cache; DB only on a miss)
       - supports role hierarchy: staff/admin can access member routes, admin can access staff routes, etc.
+    The principal is needed anyway (handlers and templates use it), so the
+    roles are read from it rather than trusted from the token.
     Usage: Depends(require_roles("member")), Depends(require_roles("staff")), etc.
     """
-    async def dependency(
-        user: any = Depends(get_current_user),
-        session: AsyncSession = Depends(get_session),
-    ):
-        # 1) Try to get roles directly from the user object returned by get_current_user
-        roles = _extract_roles_from_obj(user)
-
-        # 2) Fallback: load from DB (UserModel) and try again
-        if roles is None:
-            # Make sure user.id exists
-            user_id = getattr(user, "id", None)
-            if user_id is None:
-                raise HTTPException(status_code=401, detail="Invalid user object")
-
-            # load DB user row
-            result = await session.execute(select(UserModel).where(UserModel.id == user_id))
-            user_row = result.scalar_one_or_none()
-            if user_row:
-                roles = _extract_roles_from_obj(user_row)
-
-        # 3) If still None -> no role info available -> deny
-        if not roles:
-            raise HTTPException(status_code=403, detail="You do not have permission")
-
-        # Normalize roles set
-        user_roles_set: Set[str] = {r.lower() for r in roles}
-
-        # Role hierarchy mapping (adjust if you have different names)
-        hierarchy = {
-            "member": {"member", "staff", "admin"},
-            "staff": {"staff", "admin"},
-            "admin": {"admin"},
-        }
+    required = compile_requirement(*allowed_roles)
 
-        # Check allowed_roles against hierarchy
-        for role in allowed_roles:
-            allowed_set = hierarchy.get(role, {role})
-            if user_roles_set & {r.lower() for r in allowed_set}:
-                return user
+    async def dependency(user: any = Depends(get_current_user)):
+        if role_mask(_extract_roles_from_obj(user) or ()) & required:
+            return user
 
         raise HTTPException(status_code=403, detail="You do not have permission")
 
-    return dependency
\ No newline at end of file
+    return dependency
@@ -1,4 +1,9 @@
 from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import asyncio
+import os
+import time
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -10,3 +15,77 @@ def verify_password(plain_password, hashed_password):
 
 def get_password_hash(password):
     return pwd_context.hash(password)
+
+
+# ---------------------------
+# Async hashing
+# bcrypt is deliberately slow (~100ms+). Running it inline blocks the event
+# loop, so async handlers hand it to a small thread pool (bcrypt releases
+# the GIL). At most PASSWORD_HASH_CONCURRENCY hashes run at once; the rest
+# wait their turn and show up as queue depth.
+# ---------------------------
+PASSWORD_HASH_CONCURRENCY = int(os.getenv("PASSWORD_HASH_CONCURRENCY", 4))
+
+
+class PasswordHasher:
+    def __init__(self, concurrency: int = PASSWORD_HASH_CONCURRENCY):
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="password-hash")
+        self._slots: asyncio.Semaphore | None = None  # created on first use, inside the running loop
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        started = time.monotonic()
+        wait = started - queued_at
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.total_run += time.monotonic() - started
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    def metrics(self) -> Dict[str, Any]:
+        done = self.completed or 1
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.waiting,
+            "in_flight": self.running,
+            "completed": self.completed,
+            "avg_wait_ms": round(self.total_wait / done * 1000, 2),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "avg_hash_ms": round(self.total_run / done * 1000, 2),
+        }
+
+
+password_hasher = PasswordHasher()
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.hash(password)
@@ -0,0 +1,18 @@
+# core/auth/principal_cache.py
+import os
+from typing import Any
+from utils.cache import TTLCache
+
+# ---------------------------
+# Principal cache
+# user id -> UserRead (with role_names). Short TTL and an LRU bound keep
+# it small; role or status changes invalidate the user's entry at once.
+# ---------------------------
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", 60))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", 1024))
+
+principal_cache = TTLCache(ttl=PRINCIPAL_CACHE_TTL, name="principals", maxsize=PRINCIPAL_CACHE_SIZE, per_key_stats=False)
+
+
+def invalidate_principal(user_id: Any) -> None:
+    principal_cache.invalidate(str(user_id))
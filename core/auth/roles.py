@@ -0,0 +1,48 @@
+# core/auth/roles.py
+from typing import Iterable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from core.models.user import Role, UserRole
+
+# One bit per role; requirements compile to a mask of the roles that satisfy them
+ROLE_BITS = {
+    "member": 1 << 0,
+    "staff": 1 << 1,
+    "admin": 1 << 2,
+}
+
+# Roles that satisfy a requirement (staff/admin can access member routes, etc.)
+ROLE_HIERARCHY = {
+    "member": ("member", "staff", "admin"),
+    "staff": ("staff", "admin"),
+    "admin": ("admin",),
+}
+
+
+def role_mask(role_names: Iterable[str]) -> int:
+    mask = 0
+    for name in role_names or ():
+        mask |= ROLE_BITS.get(str(name).lower(), 0)
+    return mask
+
+
+def compile_requirement(*allowed_roles: str) -> int:
+    """Bitmask of every role that passes a check for any of allowed_roles; computed once per dependency."""
+    mask = 0
+    for role in allowed_roles:
+        role = role.lower()
+        if role not in ROLE_HIERARCHY:
+            raise ValueError(f"Unknown role: {role}")
+        mask |= role_mask(ROLE_HIERARCHY[role])
+    return mask
+
+
+# -------------------------
+# Role lookup
+# -------------------------
+async def load_role_names(session: AsyncSession, user_id) -> List[str]:
+    result = await session.execute(
+        select(Role.name).join(UserRole, UserRole.role_id == Role.id)
+        .where(UserRole.user_id == user_id)
+    )
+    return list(result.scalars().all())
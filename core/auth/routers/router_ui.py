@@ -4,21 +4,19 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 from datetime import date, datetime
-from app.database import async_session
+from app.database import get_session
 from core.models.user import User  # ✅ change this import to match your project
 from core.auth.jwt_handler import create_access_token, decode_access_token
-from core.auth.password_utils import verify_password, get_password_hash
+from core.auth.password_utils import verify_password_async, get_password_hash_async
 from utils.templates import templates
 from core.models.user import User, Role, UserRole  # ✅ change this import to match your project
 from core.models.member import MemberStatus
+from core.crud.user import UserCRUD
+from core.auth.roles import load_role_names
 import uuid
 
 router = APIRouter(include_in_schema=False)
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # -----------------------------
 # LOGIN (UI)
 # -----------------------------
@@ -59,25 +57,20 @@ async def login_user(request: Request, email: str = Form(...), password: str = F
     result = await session.execute(query)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await verify_password_async(password, user.password_hash):
         return templates.TemplateResponse(
             "/admin/auth/login.html",
             {"request": request, "error": "Invalid credentials"},
             status_code=400,
         )
 
+    # ✅ Get user roles
+    user_roles = await load_role_names(session, user.id)
+
     # ✅ Create JWT + store session
     access_token = create_access_token({"sub": str(user.id)})
     request.session["user_id"] = str(user.id)
     request.session["token"] = access_token
-
-    # ✅ Get user roles
-    roles_query = await session.execute(
-        select(Role.name)
-        .join(UserRole, UserRole.role_id == Role.id)
-        .where(UserRole.user_id == user.id)
-    )
-    user_roles = [r[0] for r in roles_query.fetchall()]
     
     # ✅ Redirect based on role
     if "admin" in user_roles:
@@ -130,11 +123,10 @@ async def register_user(
         )
 
     new_user = User(
-        id=uuid.uuid4(),
         email=email,
         username=username,
         status=MemberStatus.active,
-        password_hash=get_password_hash(password),
+        password_hash=await get_password_hash_async(password),
         role="member",   # 👈 default role set here
         created_at=datetime.utcnow(),
     )
@@ -146,9 +138,7 @@ async def register_user(
     member_role = await get_or_create_role(session, "member")
 
     # Create user-role link
-    user_role = UserRole(user_id=new_user.id, role_id=member_role.id)
-    session.add(user_role)
-    await session.commit()
+    await UserCRUD.assign_role(session, new_user.id, member_role.id)
 
     # ✅ auto-login after register
     access_token = create_access_token({"sub": str(new_user.id)})
@@ -0,0 +1,47 @@
+# core/cli.py
+"""
+Maintenance commands.
+
+    python -m core.cli rebuild-rollups
+    python -m core.cli rebuild-chapter-closure
+"""
+import argparse
+import asyncio
+
+from app.database import async_session
+
+
+async def _rebuild_rollups(args) -> None:
+    from core.crud.rollup import rebuild_rollups
+
+    async with async_session() as session:
+        await rebuild_rollups(session)
+        await session.commit()
+    print("Rollups rebuilt.")
+
+
+async def _rebuild_chapter_closure(args) -> None:
+    from core.crud.chapter import chapter_crud
+
+    async with async_session() as session:
+        rows = await chapter_crud.rebuild_closure(session)
+        await session.commit()
+    print(f"Chapter closure rebuilt ({rows} rows).")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m core.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-rollups", help="Recompute the daily and per-chapter rollups from raw rows")
+    rebuild.set_defaults(handler=_rebuild_rollups)
+
+    closure = commands.add_parser("rebuild-chapter-closure", help="Recompute chapter_closure from chapters.parent_id")
+    closure.set_defaults(handler=_rebuild_chapter_closure)
+
+    args = parser.parse_args(argv)
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -29,10 +29,57 @@ async def create_attendance(session: AsyncSession, session_id, member_ids, atten
 """
 
 from core.crud.base import CRUDBase
+from core.crud.chapter import member_in_chapter_subtree
+from core.crud.rollup import refresh_attendance_days, refresh_chapter_attendance, chapters_of_members
 from core.models.attendance import Attendance
+from sqlalchemy import func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+import uuid
 
 class CRUDAttendance(CRUDBase):
     model = Attendance
 
+    def _filter_clause(self, field: str, value: Any):
+        # No chapter column here; filter through the members of the chapter subtree
+        if field == "chapter_id" and value is not None:
+            return member_in_chapter_subtree(Attendance.member_id, value)
+        # Stored casing varies ("present" / "Present"); matches ix_attendance_lower_status_date
+        if field == "status" and value is not None:
+            return func.lower(Attendance.status) == str(getattr(value, "value", value)).lower()
+        return super()._filter_clause(field, value)
+
+    async def _before_commit(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        # Keep attendance_daily_rollup in step for every day this write touched,
+        # and the chapter rollup for those months in the members' chapters
+        days = [row.get("attendance_date") for row in rows]
+        await refresh_attendance_days(session, days)
+        await refresh_chapter_attendance(session, await chapters_of_members(session, [row.get("member_id") for row in rows]), days)
+
+    # ------------------------
+    # Mark a roster
+    # Idempotent: re-marking a session/date updates status and remarks in
+    # place via uq_attendance_member_session_date instead of duplicating.
+    # ------------------------
+    async def mark_roster(self, session: AsyncSession, session_id: uuid.UUID, member_ids: Iterable[uuid.UUID], attendance_date: date, status: str, remarks: Optional[str] = None, return_ids: bool = False):
+        rows = [
+            {
+                "member_id": member_id,
+                "session_id": session_id,
+                "attendance_date": attendance_date,
+                "status": status,
+                "remarks": remarks,
+            }
+            for member_id in member_ids
+        ]
+        return await self.upsert_many(
+            session,
+            rows,
+            conflict_fields=["member_id", "session_id", "attendance_date"],
+            update_fields=["status", "remarks"],
+            return_ids=return_ids,
+        )
+
 attendance_crud = CRUDAttendance(Attendance)
 
@@ -1,27 +1,252 @@
 from sqlmodel import SQLModel, select
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, and_, tuple_, text, insert, inspect as sa_inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import Type, TypeVar, Generic, Optional, Dict, Any
+from typing import Type, TypeVar, Generic, Optional, Dict, Any, List, Callable, AsyncIterator
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+import base64
+import json
+import os
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+# Below this many (estimated) rows an exact count is cheap enough to always run
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", 10000))
+
+# Rows fetched per server-side cursor round trip when streaming
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", 1000))
+
+
+def _copy_value(value: Any) -> Any:
+    # COPY binds raw values; str-enums must go in as their plain value
+    return value.value if isinstance(value, Enum) else value
+
+
+@dataclass
+class PageResult:
+    items: List[Any] = field(default_factory=list)
+    total: int = 0
+    exact: bool = True
+
+
+# ------------------------
+# Keyset cursor tokens
+# A cursor is an opaque, url-safe token holding the sort key and id of the
+# row a page ended (or started) on, plus the direction to continue in.
+# ------------------------
+def _dump_key(value: Any) -> list:
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, Decimal):
+        return ["n", str(value)]
+    return ["v", value]
+
+
+def _load_key(packed: list) -> Any:
+    tag, raw = packed
+    if raw is None:
+        return None
+    if tag == "dt":
+        return datetime.fromisoformat(raw)
+    if tag == "d":
+        return date.fromisoformat(raw)
+    if tag == "u":
+        return UUID(raw)
+    if tag == "n":
+        return Decimal(raw)
+    return raw
+
+
+def encode_cursor(sort_value: Any, row_id: Any, direction: str = "next") -> str:
+    payload = {"k": _dump_key(sort_value), "id": _dump_key(row_id), "d": direction}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, Any, str]:
+    """Returns (sort_value, row_id, direction). Raises ValueError on a bad token."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        direction = payload.get("d", "next")
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return _load_key(payload["k"]), _load_key(payload["id"]), direction
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
 class CRUDBase(Generic[ModelType]):
+    # model -> callbacks run after any committed write through a CRUDBase
+    _write_listeners: Dict[type, List[Callable[[type], None]]] = {}
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
+    # ------------------------
+    # Write hooks (cache invalidation etc.)
+    # ------------------------
+    @classmethod
+    def on_write(cls, model: type, listener: Callable[[type], None]) -> None:
+        cls._write_listeners.setdefault(model, []).append(listener)
+
+    def _notify_write(self) -> None:
+        for listener in CRUDBase._write_listeners.get(self.model, []):
+            listener(self.model)
+
+    async def _before_commit(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        Runs inside the write's transaction, just before COMMIT, so derived
+        tables stay consistent with it. `rows` are column snapshots of every
+        row the write touched (both old and new values on update).
+        """
+        return None
+
     # ------------------------
     # Create
     # ------------------------
     async def create(self, session: AsyncSession, obj_in: dict | ModelType) -> ModelType:
         obj = obj_in if isinstance(obj_in, self.model) else self.model(**obj_in)
         session.add(obj)
+        await self._before_commit(session, [self._row_values(obj)])
         await session.commit()
+        self._notify_write()
         await session.refresh(obj)
         return obj
 
+    # ------------------------
+    # Bulk create
+    # One INSERT executed over all rows (SQLAlchemy batches them into
+    # multi-row VALUES) and a single COMMIT; no per-row refresh.
+    # ------------------------
+    def _row_values(self, obj_in: dict | ModelType) -> Dict[str, Any]:
+        obj = obj_in if isinstance(obj_in, self.model) else self.model(**obj_in)  # applies default factories (ids, dates)
+        return {attr.key: getattr(obj, attr.key) for attr in sa_inspect(self.model).column_attrs}
+
+    async def create_many(self, session: AsyncSession, objs_in: List[dict | ModelType], return_ids: bool = False) -> List[Any] | int:
+        """Insert all rows in one transaction. Returns the new ids if return_ids, else the row count."""
+        if not objs_in:
+            return [] if return_ids else 0
+
+        rows = [self._row_values(obj_in) for obj_in in objs_in]
+        stmt = insert(self.model)
+        if return_ids:
+            result = await session.execute(stmt.returning(self.model.id, sort_by_parameter_order=True), rows)
+            ids = list(result.scalars().all())
+        else:
+            await session.execute(stmt, rows)
+        await self._before_commit(session, rows)
+        await session.commit()
+        self._notify_write()
+        return ids if return_ids else len(rows)
+
+    # ------------------------
+    # Bulk insert skipping conflicts (INSERT ... ON CONFLICT DO NOTHING)
+    # A row that hits any unique constraint is dropped instead of failing
+    # the batch; the hooks see only the rows actually inserted.
+    # ------------------------
+    async def insert_many(self, session: AsyncSession, objs_in: List[dict | ModelType], on_conflict: Optional[str] = "nothing", return_ids: bool = True) -> List[Any] | int:
+        """Returns the inserted ids (in input order) if return_ids, else the inserted row count."""
+        if on_conflict not in ("nothing", None):
+            raise ValueError(f"Unsupported on_conflict: {on_conflict}")
+        if not objs_in:
+            return [] if return_ids else 0
+
+        rows = [self._row_values(obj_in) for obj_in in objs_in]
+        stmt = pg_insert(self.model)
+        if on_conflict == "nothing":
+            stmt = stmt.on_conflict_do_nothing()
+        inserted = set((await session.execute(stmt.returning(self.model.id), rows)).scalars().all())
+        written = [row for row in rows if row["id"] in inserted]
+        await self._before_commit(session, written)
+        await session.commit()
+        self._notify_write()
+        return [row["id"] for row in written] if return_ids else len(written)
+
+    # ------------------------
+    # Bulk load (COPY)
+    # asyncpg's binary COPY on the session's own connection, so it joins the
+    # session's transaction and the same hooks run as for create_many. Other
+    # drivers fall back to create_many.
+    # ------------------------
+    async def copy_many(self, session: AsyncSession, objs_in: List[dict | ModelType]) -> int:
+        if not objs_in:
+            return 0
+
+        conn = await session.connection()
+        driver = (await conn.get_raw_connection()).driver_connection
+        if not hasattr(driver, "copy_records_to_table"):
+            return await self.create_many(session, objs_in)
+
+        rows = [self._row_values(obj_in) for obj_in in objs_in]
+        attrs = sa_inspect(self.model).column_attrs
+        keys = [attr.key for attr in attrs]
+        table = self.model.__table__
+        await driver.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=[attr.columns[0].name for attr in attrs],
+            records=[tuple(_copy_value(row[k]) for k in keys) for row in rows],
+        )
+        await self._before_commit(session, rows)
+        await session.commit()
+        self._notify_write()
+        return len(rows)
+
+    # ------------------------
+    # Bulk upsert (INSERT ... ON CONFLICT DO UPDATE)
+    # conflict_fields must match a unique constraint. Rows repeating a key
+    # are collapsed first (last wins): Postgres refuses to update the same
+    # row twice in one statement.
+    # ------------------------
+    async def upsert_many(self, session: AsyncSession, objs_in: List[dict | ModelType], conflict_fields: List[str], update_fields: Optional[List[str]] = None, return_ids: bool = False) -> List[Any] | int:
+        if not objs_in:
+            return [] if return_ids else 0
+
+        rows = {}
+        for obj_in in objs_in:
+            row = self._row_values(obj_in)
+            rows[tuple(row[f] for f in conflict_fields)] = row
+        rows = list(rows.values())
+
+        attrs = sa_inspect(self.model).attrs
+
+        def column_name(f: str) -> str:
+            return attrs[f].columns[0].name
+
+        if update_fields is None:
+            update_fields = [f for f in rows[0] if f not in conflict_fields and f != "id"]
+
+        stmt = pg_insert(self.model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[column_name(f) for f in conflict_fields],
+            set_={column_name(f): stmt.excluded[column_name(f)] for f in update_fields},
+        )
+        if return_ids:
+            # No sort_by_parameter_order: an updated row returns its existing id,
+            # which matches no client-side id, so the sentinel match would fail.
+            # The ids come back in no particular order.
+            result = await session.execute(stmt.returning(self.model.id), rows)
+            ids = list(result.scalars().all())
+        else:
+            await session.execute(stmt, rows)
+        await self._before_commit(session, rows)
+        await session.commit()
+        self._notify_write()
+        return ids if return_ids else len(rows)
+
     # ------------------------
     # Get by ID
     # ------------------------
@@ -40,10 +265,13 @@ class CRUDBase(Generic[ModelType]):
     # Update
     # ------------------------
     async def update(self, session: AsyncSession, db_obj: ModelType, obj_in: dict) -> ModelType:
+        before = self._row_values(db_obj)
         for field, value in obj_in.items():
             setattr(db_obj, field, value)
         session.add(db_obj)
+        await self._before_commit(session, [before, self._row_values(db_obj)])
         await session.commit()
+        self._notify_write()
         await session.refresh(db_obj)
         return db_obj
 
@@ -51,77 +279,273 @@ class CRUDBase(Generic[ModelType]):
     # Delete
     # ------------------------
     async def delete(self, session: AsyncSession, db_obj: ModelType):
+        before = self._row_values(db_obj)
         await session.delete(db_obj)
+        await self._before_commit(session, [before])
         await session.commit()
+        self._notify_write()
 
     # ------------------------
-    # Count filtered rows (generic)
-    # filters: dict of field -> value
-    # ------------------------   
-    async def count_filtered(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None,) -> int:
-        from sqlalchemy import or_, func
-
-        stmt = select(func.count()).select_from(self.model)
-
+    # Shared search / filter clauses
+    # ------------------------
+    def _apply_filters(self, stmt, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, conditions: Optional[list] = None):
         # Apply search filter
         if q and search_fields:
             like = f"%{q}%"
-            conditions = [
+            search_terms = [
                 func.lower(getattr(self.model, f)).like(func.lower(like))
                 for f in search_fields
                 if hasattr(self.model, f)
             ]
-            if conditions:
-                stmt = stmt.where(or_(*conditions))
+            if search_terms:
+                stmt = stmt.where(or_(*search_terms))
 
         # Apply other filters
         if filters:
             for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
+                clause = self._filter_clause(field, value)
+                if clause is not None:
+                    stmt = stmt.where(clause)
+
+        # Raw SQLAlchemy clauses (date ranges etc.)
+        if conditions:
+            stmt = stmt.where(*conditions)
+
+        return stmt
+
+    def _filter_clause(self, field: str, value: Any):
+        """WHERE clause for one `filters` entry, or None to ignore it. Subclasses map extra keys here."""
+        if hasattr(self.model, field):
+            return getattr(self.model, field) == value
+        return None
+
+    def _sort_attr(self, order_by: Optional[str] = None):
+        if order_by and hasattr(self.model, order_by):
+            return getattr(self.model, order_by)
+        # Fallback: use the first column in the model
+        first_column = next(iter(self.model.__table__.columns), None)
+        if first_column is not None:
+            return getattr(self.model, first_column.name)
+        return None
+
+    # ------------------------
+    # Count filtered rows (generic)
+    # filters: dict of field -> value
+    # ------------------------   
+    def count_stmt(self, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, conditions: Optional[list] = None,):
+        stmt = select(func.count()).select_from(self.model)
+        return self._apply_filters(stmt, q, filters, search_fields, conditions)
+
+    async def count_filtered(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, conditions: Optional[list] = None,) -> int:
+        stmt = self.count_stmt(q, filters, search_fields, conditions)
 
         result = await session.execute(stmt)
         total = result.scalar_one()  # returns int
         return total
 
     # ------------------------
-    # Select statement for list pages (generic)
+    # Estimated counts
+    # Unfiltered: pg_class.reltuples. Equality filters only: the planner's
+    # row estimate for the filtered scan. Text search (leading-wildcard
+    # LIKE) has no useful estimate, so it returns None and callers count.
     # ------------------------
-    def select_stmt(self, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page: int = 1, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True,):
-        from sqlalchemy import or_, func
+    async def estimate_count(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None,) -> Optional[int]:
+        if q and search_fields:
+            return None
+        # A failed EXPLAIN aborts the transaction; the savepoint keeps the
+        # request's session usable for the exact count that follows.
+        try:
+            async with session.begin_nested():
+                if not filters:
+                    result = await session.execute(
+                        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                        {"table": self.model.__table__.name},
+                    )
+                    estimate = result.scalar()
+                else:
+                    stmt = self._apply_filters(select(self.model), filters=filters)
+                    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+                    conn = await session.connection()
+                    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    estimate = plan[0]["Plan"]["Plan Rows"]
+        except Exception:
+            return None
 
-        stmt = select(self.model)
+        # reltuples is -1 (or 0 on older servers) until the table is analyzed
+        if estimate is None or estimate <= 0:
+            return None
+        return int(estimate)
 
-        # Apply search filter
-        if q and search_fields:
-            like = f"%{q}%"
-            conditions = [
-                func.lower(getattr(self.model, f)).like(func.lower(like))
-                for f in search_fields
-                if hasattr(self.model, f)
-            ]
-            if conditions:
-                stmt = stmt.where(or_(*conditions))
+    async def count_with_estimate(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, threshold: int = COUNT_ESTIMATE_THRESHOLD,) -> tuple[int, bool]:
+        """Returns (total, exact). Counts exactly when the estimate is missing or under threshold."""
+        estimate = await self.estimate_count(session, q=q, filters=filters, search_fields=search_fields)
+        if estimate is not None and estimate >= threshold:
+            return estimate, False
+        return await self.count_filtered(session, q=q, filters=filters, search_fields=search_fields), True
 
-        # Apply other filters
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
+    # ------------------------
+    # Select statement for list pages (generic)
+    # Passing a cursor switches from LIMIT/OFFSET to keyset pagination.
+    # ------------------------
+    def select_stmt(self, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page: int = 1, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True, cursor: Optional[str] = None, conditions: Optional[list] = None,):
+        if cursor:
+            stmt, _ = self._keyset_stmt(q, filters, search_fields, page_size, order_by, descending, cursor)
+            return stmt.where(*conditions) if conditions else stmt
+
+        stmt = select(self.model)
+        stmt = self._apply_filters(stmt, q, filters, search_fields, conditions)
 
         # Apply ordering if valid
-        if order_by and hasattr(self.model, order_by):
-            field_attr = getattr(self.model, order_by)
+        field_attr = self._sort_attr(order_by)
+        if field_attr is not None:
             stmt = stmt.order_by(field_attr.desc() if descending else field_attr.asc())
-        else:
-            # Fallback: use the first column in the model (optional)
-            # first_column = next(iter(self.model.__fields__.values()), None)
-            first_column = next(iter(self.model.__table__.columns), None)
-            if first_column is not None:
-                field_attr = getattr(self.model, first_column.name)
-                stmt = stmt.order_by(field_attr.desc() if descending else field_attr.asc())
 
         # Pagination
         stmt = stmt.limit(page_size).offset((page - 1) * page_size)
 
         return stmt
+
+    # ------------------------
+    # One page plus the filtered total in a single round trip.
+    # count(*) OVER () is evaluated after WHERE but before LIMIT, so every
+    # returned row carries the full filtered count (and every filtered row
+    # is read to produce it).
+    # ------------------------
+    def page_with_total_stmt(self, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page: int = 1, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True, conditions: Optional[list] = None,):
+        return self._with_total(self.select_stmt(q=q, filters=filters, search_fields=search_fields, page=page, page_size=page_size, order_by=order_by, descending=descending, conditions=conditions))
+
+    @staticmethod
+    def _with_total(stmt):
+        return stmt.add_columns(func.count().over().label("total_count"))
+
+    async def select_page_with_total(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page: int = 1, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True, options: Optional[list] = None, estimate: bool = False, conditions: Optional[list] = None,) -> PageResult:
+        stmt = self.select_stmt(q=q, filters=filters, search_fields=search_fields, page=page, page_size=page_size, order_by=order_by, descending=descending, conditions=conditions)
+        if options:
+            stmt = stmt.options(*options)
+
+        # Large tables: skip the window count and report the planner's figure
+        if estimate and not conditions:
+            estimated = await self.estimate_count(session, q=q, filters=filters, search_fields=search_fields)
+            if estimated is not None and estimated >= COUNT_ESTIMATE_THRESHOLD:
+                items = (await session.execute(stmt)).scalars().all()
+                return PageResult(items=items, total=estimated, exact=False)
+
+        stmt = self._with_total(stmt)
+
+        rows = (await session.execute(stmt)).all()
+        if rows:
+            return PageResult(items=[row[0] for row in rows], total=rows[0][1])
+
+        # Past the last page there is no row to carry the window count
+        total = await self.count_filtered(session, q=q, filters=filters, search_fields=search_fields, conditions=conditions) if page > 1 else 0
+        return PageResult(items=[], total=total)
+
+    # ------------------------
+    # Streaming (exports)
+    # Same filters as select_stmt, read through a server-side cursor
+    # batch_size rows at a time. Rows come back as plain column dicts (no
+    # ORM identity map), so memory stays flat however many rows match.
+    # ------------------------
+    def column_keys(self) -> List[str]:
+        return [attr.key for attr in sa_inspect(self.model).column_attrs]
+
+    async def stream(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, order_by: Optional[str] = None, descending: bool = True, conditions: Optional[list] = None, columns: Optional[List[str]] = None, batch_size: int = STREAM_BATCH_SIZE,) -> AsyncIterator[Dict[str, Any]]:
+        keys = columns or self.column_keys()
+        stmt = select(*[getattr(self.model, k).label(k) for k in keys]).select_from(self.model)
+        stmt = self._apply_filters(stmt, q, filters, search_fields, conditions)
+
+        sort_attr = self._sort_attr(order_by) if order_by else None
+        if sort_attr is not None:
+            id_attr = self.model.id
+            stmt = stmt.order_by(*(a.desc() if descending else a.asc() for a in (sort_attr, id_attr)))
+
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            for row in partition:
+                yield dict(row)
+
+    # ------------------------
+    # Keyset (cursor) pagination
+    # Rows are ordered by (sort column, id) so ties never reorder between
+    # pages, and each page seeks straight to its starting key instead of
+    # skipping OFFSET rows.
+    # ------------------------
+    def _keyset_stmt(self, q, filters, search_fields, page_size, order_by, descending, cursor, offset: int = 0):
+        sort_attr = self._sort_attr(order_by)
+        id_attr = self.model.id
+        direction = "next"
+
+        stmt = select(self.model)
+        stmt = self._apply_filters(stmt, q, filters, search_fields)
+
+        if cursor:
+            last_value, last_id, direction = decode_cursor(cursor)
+            # Walking backwards is walking forwards over the reversed order
+            ascending = descending if direction == "prev" else not descending
+            stmt = stmt.where(self._after_key(sort_attr, id_attr, last_value, last_id, ascending))
+        else:
+            ascending = not descending
+
+        if sort_attr is id_attr:
+            ordering = [id_attr.asc() if ascending else id_attr.desc()]
+        elif ascending:
+            ordering = [sort_attr.asc(), id_attr.asc()]
+        else:
+            ordering = [sort_attr.desc(), id_attr.desc()]
+
+        stmt = stmt.order_by(*ordering).limit(page_size)
+        if offset and not cursor:
+            stmt = stmt.offset(offset)
+        return stmt, direction
+
+    @staticmethod
+    def _after_key(sort_attr, id_attr, last_value, last_id, ascending: bool):
+        """Rows strictly after (last_value, last_id) in scan order.
+        Follows Postgres defaults: NULLs sort last ascending, first descending."""
+        if sort_attr is id_attr:
+            return id_attr > last_id if ascending else id_attr < last_id
+        if ascending:
+            if last_value is None:
+                return and_(sort_attr.is_(None), id_attr > last_id)
+            return or_(tuple_(sort_attr, id_attr) > tuple_(last_value, last_id), sort_attr.is_(None))
+        if last_value is None:
+            return or_(and_(sort_attr.is_(None), id_attr < last_id), sort_attr.is_not(None))
+        return tuple_(sort_attr, id_attr) < tuple_(last_value, last_id)
+
+    def keyset_page_stmt(self, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True, cursor: Optional[str] = None, page: int = 1, conditions: Optional[list] = None,):
+        """The statement paginate_keyset runs (one extra row to detect a further page), and its direction."""
+        stmt, direction = self._keyset_stmt(q, filters, search_fields, page_size + 1, order_by, descending, cursor, offset=(page - 1) * page_size)
+        if conditions:
+            stmt = stmt.where(*conditions)
+        return stmt, direction
+
+    async def paginate_keyset(self, session: AsyncSession, q: Optional[str] = None, filters: Optional[Dict[str, Any]] = None, search_fields: Optional[list] = None, page_size: int = 10, order_by: Optional[str] = None, descending: bool = True, cursor: Optional[str] = None, page: int = 1, options: Optional[list] = None, conditions: Optional[list] = None,) -> Dict[str, Any]:
+        """
+        Returns {"items": [...], "next_cursor": str | None, "prev_cursor": str | None}.
+        `page` is only honoured when no cursor is given, so old page-number
+        links keep working and hand over to cursors from there.
+        """
+        stmt, direction = self.keyset_page_stmt(q, filters, search_fields, page_size, order_by, descending, cursor, page, conditions)
+        if options:
+            stmt = stmt.options(*options)
+
+        rows = list((await session.execute(stmt)).scalars().all())
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if direction == "prev":
+            rows.reverse()
+            has_prev, has_next = has_more, True
+        else:
+            has_prev, has_next = bool(cursor) or page > 1, has_more
+
+        sort_name = self._sort_attr(order_by).key
+        next_cursor = prev_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(getattr(rows[-1], sort_name), rows[-1].id, "next")
+        if rows and has_prev:
+            prev_cursor = encode_cursor(getattr(rows[0], sort_name), rows[0].id, "prev")
+
+        return {"items": rows, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
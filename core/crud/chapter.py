@@ -0,0 +1,165 @@
+# core/crud/chapter.py
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import delete, insert, literal, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from typing import Any, Dict, List, Optional
+import uuid
+from core.models.chapter import Chapters, ChapterClosure
+from core.models.member import Members
+from core.crud.base import CRUDBase
+
+# Guards the recursive rebuild against a parent_id cycle already in the data
+MAX_CHAPTER_DEPTH = 32
+
+
+# ------------------------
+# Subtree filters
+# Clauses for WHERE; each is a semi-join on the closure primary key
+# (ancestor_id, descendant_id), so "everything under a region" costs one
+# index range scan whatever the depth of the tree.
+# ------------------------
+def subtree_ids(root_id: uuid.UUID):
+    return select(ChapterClosure.descendant_id).where(ChapterClosure.ancestor_id == root_id)
+
+
+def in_chapter_subtree(chapter_column, root_id: uuid.UUID):
+    return chapter_column.in_(subtree_ids(root_id))
+
+
+def member_in_chapter_subtree(member_column, root_id: uuid.UUID):
+    """For tables keyed by member (donations, attendance): members of any chapter under root."""
+    members = (
+        select(Members.id)
+        .join(ChapterClosure, ChapterClosure.descendant_id == Members.chapter_id)
+        .where(ChapterClosure.ancestor_id == root_id)
+    )
+    return member_column.in_(members)
+
+
+class CRUDChapter(CRUDBase):
+    model = Chapters
+
+    # ------------------------
+    # Closure maintenance
+    # Runs in the write's transaction. A new chapter gets its self row and
+    # its parent's ancestors; a move detaches the whole subtree from its old
+    # ancestors and re-attaches it under the new parent.
+    # ------------------------
+    async def _before_commit(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        deleted = {obj.id for obj in session.deleted if isinstance(obj, Chapters)}
+        snapshots: Dict[uuid.UUID, List[Dict[str, Any]]] = {}
+        for row in rows:
+            snapshots.setdefault(row["id"], []).append(row)
+
+        # One snapshot is an insert; two are the before/after of an update
+        pending = {
+            chapter_id: snaps[-1]["parent_id"]
+            for chapter_id, snaps in snapshots.items()
+            if chapter_id not in deleted and (len(snaps) == 1 or snaps[0]["parent_id"] != snaps[-1]["parent_id"])
+        }
+        if not pending:
+            return
+
+        await session.flush()
+        # Parents created in the same write are linked before their children
+        while pending:
+            ready = [c for c, parent in pending.items() if parent not in pending]
+            if not ready:
+                raise ValueError("Chapter parents form a cycle")
+            for chapter_id in ready:
+                await self._link(session, chapter_id, pending.pop(chapter_id))
+
+    async def _link(self, session: AsyncSession, chapter_id: uuid.UUID, parent_id: Optional[uuid.UUID]) -> None:
+        await session.execute(
+            pg_insert(ChapterClosure)
+            .values(ancestor_id=chapter_id, descendant_id=chapter_id, depth=0)
+            .on_conflict_do_nothing()
+        )
+
+        if parent_id is not None:
+            under_self = select(
+                exists().where(ChapterClosure.ancestor_id == chapter_id, ChapterClosure.descendant_id == parent_id)
+            )
+            if (await session.execute(under_self)).scalar():
+                raise ValueError("A chapter cannot be moved under itself or one of its descendants")
+
+        subtree = select(ChapterClosure.descendant_id).where(ChapterClosure.ancestor_id == chapter_id)
+        await session.execute(
+            delete(ChapterClosure).where(
+                ChapterClosure.descendant_id.in_(subtree),
+                ChapterClosure.ancestor_id.not_in(subtree),
+            )
+        )
+        if parent_id is None:
+            return
+
+        above, below = aliased(ChapterClosure), aliased(ChapterClosure)
+        paths = (
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+            .select_from(above)
+            .join(below, literal(True))
+            .where(above.descendant_id == parent_id, below.ancestor_id == chapter_id)
+        )
+        await session.execute(insert(ChapterClosure).from_select(["ancestor_id", "descendant_id", "depth"], paths))
+
+    async def move(self, session: AsyncSession, chapter: Chapters, parent_id: Optional[uuid.UUID]) -> Chapters:
+        return await self.update(session, chapter, {"parent_id": parent_id})
+
+    async def delete(self, session: AsyncSession, db_obj: Chapters):
+        # Only leaves can go (children still reference it through parent_id)
+        await session.execute(delete(ChapterClosure).where(ChapterClosure.descendant_id == db_obj.id))
+        return await super().delete(session, db_obj)
+
+    async def rebuild_closure(self, session: AsyncSession) -> int:
+        """Recompute the whole closure from parent_id. Does not commit; returns the row count."""
+        child = aliased(Chapters)
+        tree = select(
+            Chapters.id.label("ancestor_id"),
+            Chapters.id.label("descendant_id"),
+            literal(0).label("depth"),
+        ).cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(tree.c.ancestor_id, child.id, tree.c.depth + 1)
+            .join(child, child.parent_id == tree.c.descendant_id)
+            .where(tree.c.depth < MAX_CHAPTER_DEPTH)
+        )
+        await session.execute(delete(ChapterClosure))
+        result = await session.execute(
+            insert(ChapterClosure).from_select(["ancestor_id", "descendant_id", "depth"], select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth))
+        )
+        return result.rowcount
+
+    # ------------------------
+    # Tree reads
+    # ------------------------
+    async def ancestors(self, session: AsyncSession, chapter_id: uuid.UUID) -> List[Chapters]:
+        """Root first, ending with the chapter itself."""
+        stmt = (
+            select(Chapters)
+            .join(ChapterClosure, ChapterClosure.ancestor_id == Chapters.id)
+            .where(ChapterClosure.descendant_id == chapter_id)
+            .order_by(ChapterClosure.depth.desc())
+        )
+        return list((await session.execute(stmt)).scalars().all())
+
+    async def descendants(self, session: AsyncSession, chapter_id: uuid.UUID, include_self: bool = True) -> List[Chapters]:
+        stmt = (
+            select(Chapters)
+            .join(ChapterClosure, ChapterClosure.descendant_id == Chapters.id)
+            .where(ChapterClosure.ancestor_id == chapter_id)
+            .order_by(ChapterClosure.depth, Chapters.name)
+        )
+        if not include_self:
+            stmt = stmt.where(ChapterClosure.depth > 0)
+        return list((await session.execute(stmt)).scalars().all())
+
+    async def list_by_type(self, session: AsyncSession, chapter_type: Optional[str] = None) -> List[Chapters]:
+        stmt = select(Chapters).where(Chapters.active.is_(True)).order_by(Chapters.name)
+        if chapter_type:
+            stmt = stmt.where(Chapters.type == chapter_type)
+        return list((await session.execute(stmt)).scalars().all())
+
+
+chapter_crud = CRUDChapter(Chapters)
@@ -1,4 +1,26 @@
 from core.models.donation import Donation, DonationType
 from core.crud.base import CRUDBase
+from core.crud.chapter import member_in_chapter_subtree
+from core.crud.rollup import refresh_donation_days, refresh_chapter_donations, chapters_of_members
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Dict, List
 
-donation_crud = CRUDBase(Donation)
+
+class CRUDDonation(CRUDBase):
+    model = Donation
+
+    def _filter_clause(self, field: str, value: Any):
+        # No chapter column here; filter through the members of the chapter subtree
+        if field == "chapter_id" and value is not None:
+            return member_in_chapter_subtree(Donation.member_id, value)
+        return super()._filter_clause(field, value)
+
+    async def _before_commit(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        # Keep donation_daily_rollup in step for every day this write touched,
+        # and the chapter rollup for those months in the members' chapters
+        days = [row.get("donation_date") for row in rows]
+        await refresh_donation_days(session, days)
+        await refresh_chapter_donations(session, await chapters_of_members(session, [row.get("member_id") for row in rows]), days)
+
+
+donation_crud = CRUDDonation(Donation)
@@ -0,0 +1,355 @@
+# core/crud/kpi.py
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import func, tuple_
+from sqlalchemy.future import select
+from datetime import date, timedelta
+from typing import List, Optional
+import os
+import uuid
+from core.models.member import Members, MemberStatus
+from core.models.donation import Donation, DonationType
+from core.models.attendance import Attendance
+from core.models.rollup import DonationDailyRollup, AttendanceDailyRollup, ChapterMemberRollup, ChapterDonationRollup, ChapterAttendanceRollup
+from core.models.chapter import Chapters, ChapterClosure
+from core.schemas.dashboard import DashboardKPIs, ActivitySummary, ChapterRollup, ChapterMetrics, ChapterTreeNode
+from core.crud.base import CRUDBase
+from utils.cache import TTLCache
+
+
+# ------------------------
+# KPI cache
+# Global aggregates change a few times an hour; recompute at most once per
+# TTL, and drop everything as soon as a tracked model is written.
+# ------------------------
+KPI_CACHE_TTL = float(os.getenv("KPI_CACHE_TTL", 300))
+kpi_cache = TTLCache(ttl=KPI_CACHE_TTL, name="dashboard_kpis")
+
+for _model in (Donation, Members, Attendance, Chapters):
+    CRUDBase.on_write(_model, lambda model: kpi_cache.invalidate())
+
+
+# ------------------------
+# Aggregate statements
+# Each is a single scan with conditional aggregates (FILTER) in place of
+# one query per KPI. Donation and attendance totals read the daily rollup
+# tables, so their cost grows with days, not rows; the raw-table versions
+# remain for per-member figures, which the rollups do not carry.
+# ------------------------
+def _donation_totals(*conditions):
+    amount = func.sum(Donation.amount)
+    stmt = select(
+        func.coalesce(amount, 0).label("total_donations"),
+        func.coalesce(amount.filter(Donation.donation_type == DonationType.tithe.value), 0).label("total_tithe"),
+        func.coalesce(amount.filter(Donation.donation_type == DonationType.sunday_donation.value), 0).label("total_sunday"),
+        func.coalesce(amount.filter(Donation.donation_type == DonationType.pledge.value), 0).label("total_pledge"),
+        func.coalesce(amount.filter(Donation.donation_type == DonationType.other_offering.value), 0).label("total_other"),
+        func.count(Donation.id).label("donation_count"),
+    )
+    return stmt.where(*conditions) if conditions else stmt
+
+
+def _rollup_donation_totals(*conditions):
+    amount = func.sum(DonationDailyRollup.total_amount)
+    kind = DonationDailyRollup.donation_type
+    stmt = select(
+        func.coalesce(amount, 0).label("total_donations"),
+        func.coalesce(amount.filter(kind == DonationType.tithe.value), 0).label("total_tithe"),
+        func.coalesce(amount.filter(kind == DonationType.sunday_donation.value), 0).label("total_sunday"),
+        func.coalesce(amount.filter(kind == DonationType.pledge.value), 0).label("total_pledge"),
+        func.coalesce(amount.filter(kind == DonationType.other_offering.value), 0).label("total_other"),
+        func.coalesce(func.sum(DonationDailyRollup.donation_count), 0).label("donation_count"),
+    )
+    return stmt.where(*conditions) if conditions else stmt
+
+
+def _member_totals():
+    return select(
+        func.count(Members.id).label("total_members"),
+        func.count(Members.id).filter(Members.status == MemberStatus.active.value).label("active_members"),
+        func.count(Members.id).filter(Members.status == MemberStatus.inactive.value).label("inactive_members"),
+        func.count(Members.id).filter(Members.status == MemberStatus.alumni.value).label("alumni_members"),
+        func.count(Members.id).filter(Members.status == MemberStatus.guest.value).label("guest_members"),
+    )
+
+
+def _rollup_attendance_totals(today: date):
+    count = func.sum(AttendanceDailyRollup.attendance_count)
+    status = AttendanceDailyRollup.status  # stored lower-cased
+    is_today = AttendanceDailyRollup.day == today
+    return select(
+        func.coalesce(count, 0).label("total_attendance"),
+        func.coalesce(count.filter(status == "present"), 0).label("total_present"),
+        func.coalesce(count.filter(status == "absent"), 0).label("total_absent"),
+        func.coalesce(count.filter(is_today), 0).label("attendance_today"),
+        func.coalesce(count.filter(is_today, status == "present"), 0).label("present_today"),
+        func.coalesce(count.filter(is_today, status == "absent"), 0).label("absent_today"),
+    )
+
+
+def _attendance_by_status(*conditions):
+    status = func.lower(Attendance.status)
+    stmt = select(
+        func.count(Attendance.id).label("total_attendance"),
+        func.count(Attendance.id).filter(status == "present").label("total_present"),
+        func.count(Attendance.id).filter(status == "absent").label("total_absent"),
+        func.count(Attendance.id).filter(status == "excused").label("total_excused"),
+        func.count(Attendance.id).filter(status == "online").label("total_online"),
+    )
+    return stmt.where(*conditions) if conditions else stmt
+
+
+def _rollup_attendance_by_status(*conditions):
+    count = func.sum(AttendanceDailyRollup.attendance_count)
+    status = AttendanceDailyRollup.status
+    stmt = select(
+        func.coalesce(count, 0).label("total_attendance"),
+        func.coalesce(count.filter(status == "present"), 0).label("total_present"),
+        func.coalesce(count.filter(status == "absent"), 0).label("total_absent"),
+        func.coalesce(count.filter(status == "excused"), 0).label("total_excused"),
+        func.coalesce(count.filter(status == "online"), 0).label("total_online"),
+    )
+    return stmt.where(*conditions) if conditions else stmt
+
+
+def dashboard_kpis_stmt(today: date):
+    """All dashboard KPIs in one round trip: the three single-row aggregates cross-joined."""
+    return select(
+        _rollup_donation_totals().subquery(),
+        _member_totals().subquery(),
+        _rollup_attendance_totals(today).subquery(),
+    )
+
+
+def activity_summary_stmt(since: Optional[date] = None, member_id: Optional[uuid.UUID] = None):
+    """Windowed donation/attendance totals, aggregated in the database rather than over loaded rows."""
+    if member_id:
+        donation_where = [Donation.member_id == member_id]
+        attendance_where = [Attendance.member_id == member_id]
+        if since:
+            donation_where.append(Donation.donation_date >= since)
+            attendance_where.append(Attendance.attendance_date >= since)
+        donations = _donation_totals(*donation_where)
+        attendance = _attendance_by_status(*attendance_where)
+    else:
+        donations = _rollup_donation_totals(*([DonationDailyRollup.day >= since] if since else []))
+        attendance = _rollup_attendance_by_status(*([AttendanceDailyRollup.day >= since] if since else []))
+
+    return select(donations.subquery(), attendance.subquery())
+
+
+async def get_dashboard_kpis(session: AsyncSession, today: Optional[date] = None) -> DashboardKPIs:
+    row = (await session.execute(dashboard_kpis_stmt(today or date.today()))).mappings().one()
+    return DashboardKPIs(**row)
+
+
+async def get_activity_summary(session: AsyncSession, since: Optional[date] = None, member_id: Optional[uuid.UUID] = None) -> ActivitySummary:
+    row = (await session.execute(activity_summary_stmt(since, member_id))).mappings().one()
+    return ActivitySummary(since=since, **row)
+
+
+async def get_cached_dashboard_kpis(session: AsyncSession) -> DashboardKPIs:
+    today = date.today()  # part of the key so "today" figures roll over at midnight
+    return await kpi_cache.get_or_set(("dashboard", today.isoformat()), lambda: get_dashboard_kpis(session, today))
+
+
+def daily_trends_stmt(days: int = 30):
+    """Per-day donation total and attendance counts for the last `days` days, from the rollups."""
+    since = date.today() - timedelta(days=days - 1)
+    donations = (
+        select(DonationDailyRollup.day, func.sum(DonationDailyRollup.total_amount).label("donations"))
+        .where(DonationDailyRollup.day >= since)
+        .group_by(DonationDailyRollup.day)
+        .subquery()
+    )
+    count = func.sum(AttendanceDailyRollup.attendance_count)
+    attendance = (
+        select(
+            AttendanceDailyRollup.day,
+            count.label("attendance"),
+            count.filter(AttendanceDailyRollup.status == "present").label("present"),
+        )
+        .where(AttendanceDailyRollup.day >= since)
+        .group_by(AttendanceDailyRollup.day)
+        .subquery()
+    )
+    day = func.coalesce(donations.c.day, attendance.c.day).label("day")
+    return (
+        select(
+            day,
+            func.coalesce(donations.c.donations, 0).label("donations"),
+            func.coalesce(attendance.c.attendance, 0).label("attendance"),
+            func.coalesce(attendance.c.present, 0).label("present"),
+        )
+        .select_from(donations.join(attendance, donations.c.day == attendance.c.day, full=True))
+        .order_by(day)
+    )
+
+
+async def get_daily_trends(session: AsyncSession, days: int = 30) -> List[dict]:
+    return [dict(row) for row in (await session.execute(daily_trends_stmt(days))).mappings().all()]
+
+
+# ------------------------
+# Per-chapter rollups (e.g. one row per region)
+# Sums the per-chapter rollup tables (kept current by the member, donation
+# and attendance CRUD hooks) over each chosen chapter's subtree through
+# chapter_closure. The period is whole months, the rollups' granularity.
+# ------------------------
+def month_window_start(months: int, today: Optional[date] = None) -> date:
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - (months - 1)
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def chapter_rollups_stmt(chapter_type: str = "region", since_month: Optional[date] = None):
+    chosen = select(Chapters.id).where(Chapters.type == chapter_type, Chapters.active.is_(True))
+
+    def under(rollup, *columns):
+        return (
+            select(ChapterClosure.ancestor_id.label("chapter_id"), *columns)
+            .join(rollup, rollup.chapter_id == ChapterClosure.descendant_id)
+            .where(ChapterClosure.ancestor_id.in_(chosen))
+            .group_by(ChapterClosure.ancestor_id)
+        )
+
+    member_count = func.sum(ChapterMemberRollup.member_count)
+    members = under(
+        ChapterMemberRollup,
+        member_count.label("total_members"),
+        member_count.filter(ChapterMemberRollup.status == MemberStatus.active.value).label("active_members"),
+    ).subquery()
+
+    donations = under(
+        ChapterDonationRollup,
+        func.sum(ChapterDonationRollup.total_amount).label("total_donations"),
+        func.sum(ChapterDonationRollup.donation_count).label("donation_count"),
+    )
+    if since_month:
+        donations = donations.where(ChapterDonationRollup.month >= since_month)
+    donations = donations.subquery()
+
+    attendance_count = func.sum(ChapterAttendanceRollup.attendance_count)
+    attendance = under(
+        ChapterAttendanceRollup,
+        attendance_count.label("total_attendance"),
+        attendance_count.filter(ChapterAttendanceRollup.status == "present").label("total_present"),
+    )
+    if since_month:
+        attendance = attendance.where(ChapterAttendanceRollup.month >= since_month)
+    attendance = attendance.subquery()
+
+    return (
+        select(
+            Chapters.id.label("chapter_id"),
+            Chapters.name,
+            Chapters.type,
+            func.coalesce(members.c.total_members, 0).label("total_members"),
+            func.coalesce(members.c.active_members, 0).label("active_members"),
+            func.coalesce(donations.c.total_donations, 0).label("total_donations"),
+            func.coalesce(donations.c.donation_count, 0).label("donation_count"),
+            func.coalesce(attendance.c.total_attendance, 0).label("total_attendance"),
+            func.coalesce(attendance.c.total_present, 0).label("total_present"),
+        )
+        .outerjoin(members, members.c.chapter_id == Chapters.id)
+        .outerjoin(donations, donations.c.chapter_id == Chapters.id)
+        .outerjoin(attendance, attendance.c.chapter_id == Chapters.id)
+        .where(Chapters.type == chapter_type, Chapters.active.is_(True))
+        .order_by(Chapters.name)
+    )
+
+
+async def get_chapter_rollups(session: AsyncSession, chapter_type: str = "region", months: int = 1) -> List[ChapterRollup]:
+    """Chapters of `chapter_type` with subtree totals for the last `months` months (1 = this month)."""
+    since_month = month_window_start(months)
+
+    async def load():
+        rows = (await session.execute(chapter_rollups_stmt(chapter_type, since_month))).mappings().all()
+        return [ChapterRollup(**row) for row in rows]
+
+    return await kpi_cache.get_or_set(("chapters", chapter_type, since_month.isoformat()), load)
+
+
+# ------------------------
+# Chapter tree with metrics
+# Reads the per-chapter rollups (kept current by the member, donation and
+# attendance CRUD hooks) and sums them over each chapter's subtree through
+# chapter_closure: three grouped scans of small tables, whatever the raw
+# row counts. The tree itself is assembled in Python.
+# ------------------------
+def chapter_tree_stmts(since_month: date):
+    ancestor = ChapterClosure.ancestor_id
+    members = (
+        select(ancestor, ChapterMemberRollup.status, func.sum(ChapterMemberRollup.member_count).label("members"))
+        .join(ChapterMemberRollup, ChapterMemberRollup.chapter_id == ChapterClosure.descendant_id)
+        .group_by(ancestor, ChapterMemberRollup.status)
+    )
+    # One pass, two groupings: rows with month NULL are per type, rows with type NULL per month
+    donations = (
+        select(
+            ancestor,
+            ChapterDonationRollup.donation_type,
+            ChapterDonationRollup.month,
+            func.sum(ChapterDonationRollup.total_amount).label("amount"),
+            func.sum(ChapterDonationRollup.donation_count).label("count"),
+        )
+        .join(ChapterDonationRollup, ChapterDonationRollup.chapter_id == ChapterClosure.descendant_id)
+        .where(ChapterDonationRollup.month >= since_month)
+        .group_by(func.grouping_sets(
+            tuple_(ancestor, ChapterDonationRollup.donation_type),
+            tuple_(ancestor, ChapterDonationRollup.month),
+        ))
+    )
+    count = func.sum(ChapterAttendanceRollup.attendance_count)
+    attendance = (
+        select(
+            ancestor,
+            count.label("total"),
+            count.filter(ChapterAttendanceRollup.status == "present").label("present"),
+        )
+        .join(ChapterAttendanceRollup, ChapterAttendanceRollup.chapter_id == ChapterClosure.descendant_id)
+        .where(ChapterAttendanceRollup.month >= since_month)
+        .group_by(ancestor)
+    )
+    return members, donations, attendance
+
+
+async def get_chapter_tree(session: AsyncSession, months: int = 12) -> List[ChapterTreeNode]:
+    """Root chapters, each with nested children and subtree metrics for the last `months` months."""
+    since_month = month_window_start(months)
+
+    async def load():
+        chapters = (await session.execute(select(Chapters).order_by(Chapters.name))).scalars().all()
+        metrics = {c.id: ChapterMetrics() for c in chapters}
+        members, donations, attendance = chapter_tree_stmts(since_month)
+
+        for chapter_id, status, count in (await session.execute(members)).all():
+            if m := metrics.get(chapter_id):
+                m.members_by_status[status] = int(count)
+                m.total_members += int(count)
+
+        for chapter_id, donation_type, month, amount, count in (await session.execute(donations)).all():
+            if not (m := metrics.get(chapter_id)):
+                continue
+            if month is None:
+                m.donations_by_type[donation_type] = float(amount or 0)
+                m.total_donations += float(amount or 0)
+                m.donation_count += int(count or 0)
+            else:
+                m.donations_by_month[month.strftime("%Y-%m")] = float(amount or 0)
+
+        for chapter_id, total, present in (await session.execute(attendance)).all():
+            if m := metrics.get(chapter_id):
+                m.total_attendance, m.total_present = int(total or 0), int(present or 0)
+                m.attendance_rate = round(m.total_present / m.total_attendance, 4) if m.total_attendance else None
+
+        nodes = {
+            c.id: ChapterTreeNode(id=c.id, name=c.name, type=c.type, parent_id=c.parent_id, metrics=metrics[c.id])
+            for c in chapters
+        }
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node.parent_id) if node.parent_id else None
+            (parent.children if parent else roots).append(node)
+        return roots
+
+    return await kpi_cache.get_or_set(("chapter_tree", since_month.isoformat()), load)
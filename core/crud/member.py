@@ -1,4 +1,132 @@
-from core.models.member import Members, MemberStatus
-from core.crud.base import CRUDBase
+from core.models.member import Members, MemberStatus, member_code_seq
+from core.crud.base import CRUDBase, PageResult
+from core.crud.chapter import in_chapter_subtree
+from core.crud.rollup import refresh_chapter_members, refresh_chapter_donations, refresh_chapter_attendance
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import func, or_, literal, literal_column, String
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from typing import Any, Dict, List, Optional
+import os
 
-member_crud = CRUDBase(Members)
+# Hard cap on how many ranked matches any member search will return
+MEMBER_SEARCH_LIMIT = int(os.getenv("MEMBER_SEARCH_LIMIT", 200))
+
+# Must stay identical to the ix_members_search_trgm expression (see the
+# pg_trgm Alembic migration) or Postgres will not use the index.
+SEARCH_DOCUMENT_SQL = (
+    "lower(coalesce({t}first_name, '') || ' ' || coalesce({t}last_name, '') || ' ' || "
+    "coalesce({t}member_code, '') || ' ' || coalesce({t}email, '') || ' ' || coalesce({t}phone, ''))"
+)
+
+
+def search_document():
+    return literal_column(SEARCH_DOCUMENT_SQL.format(t="members."))
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class CRUDMember(CRUDBase):
+    model = Members
+
+    def _filter_clause(self, field: str, value: Any):
+        # A chapter filter covers every chapter beneath it
+        if field == "chapter_id" and value is not None:
+            return in_chapter_subtree(Members.chapter_id, value)
+        return super()._filter_clause(field, value)
+
+    async def _before_commit(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        # Member counts for every chapter touched (old and new on update)
+        await refresh_chapter_members(session, [row.get("chapter_id") for row in rows])
+
+        # A member changing chapter carries their donation/attendance history along
+        chapters: Dict[Any, set] = {}
+        for row in rows:
+            chapters.setdefault(row["id"], set()).add(row.get("chapter_id"))
+        moved = set().union(*(c for c in chapters.values() if len(c) > 1))
+        if moved:
+            await refresh_chapter_donations(session, moved)
+            await refresh_chapter_attendance(session, moved)
+
+    # ------------------------
+    # Trigram search
+    # Substring match (LIKE) or fuzzy word match (<%), both served by the
+    # GIN trigram index, ranked by word_similarity and capped at `limit`.
+    # ------------------------
+    def _search_clauses(self, q: str):
+        term = q.strip().lower()
+        doc = search_document()
+        match = or_(
+            doc.like(f"%{_like_escape(term)}%", escape="\\"),
+            literal(term, String).op("<%")(doc),
+        )
+        rank = func.word_similarity(literal(term, String), doc).label("rank")
+        return match, rank
+
+    def search_condition(self, q: str):
+        """The trigram match alone, as a WHERE clause for unranked lists (keyset pages, exports)."""
+        return self._search_clauses(q)[0]
+
+    def search_stmt(self, q: str, filters: Optional[Dict[str, Any]] = None, limit: int = MEMBER_SEARCH_LIMIT):
+        match, rank = self._search_clauses(q)
+        stmt = select(Members).where(match)
+        stmt = self._apply_filters(stmt, filters=filters)
+        return stmt.order_by(rank.desc(), Members.id).limit(min(limit, MEMBER_SEARCH_LIMIT))
+
+    async def search(self, session: AsyncSession, q: str, filters: Optional[Dict[str, Any]] = None, limit: int = 20) -> List[Members]:
+        return (await session.execute(self.search_stmt(q, filters=filters, limit=limit))).scalars().all()
+
+    async def search_page(self, session: AsyncSession, q: str, filters: Optional[Dict[str, Any]] = None, page: int = 1, page_size: int = 10) -> PageResult:
+        """A page of ranked matches from the top MEMBER_SEARCH_LIMIT; total is exact only below the cap."""
+        match, rank = self._search_clauses(q)
+        capped = self._apply_filters(select(Members, rank).where(match), filters=filters)
+        capped = capped.order_by(rank.desc(), Members.id).limit(MEMBER_SEARCH_LIMIT).subquery()
+
+        member = aliased(Members, capped)
+        stmt = (
+            select(member, func.count().over())
+            .order_by(capped.c.rank.desc(), capped.c.id)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return PageResult(items=[], total=0)
+        total = rows[0][1]
+        return PageResult(items=[row[0] for row in rows], total=total, exact=total < MEMBER_SEARCH_LIMIT)
+
+
+member_crud = CRUDMember(Members)
+
+
+# ------------------------
+# Member codes
+# MEMnnnn codes come from the member_code_seq sequence: nextval never blocks
+# or rolls back, so concurrent signups get distinct codes without scanning
+# members or retrying on unique violations. Gaps are expected.
+# ------------------------
+class MemberCodeAllocator:
+    def __init__(self, sequence=member_code_seq, prefix: str = "MEM", width: int = 4):
+        self.sequence = sequence
+        self.prefix = prefix
+        self.width = width
+
+    def format(self, number: int) -> str:
+        return f"{self.prefix}{number:0{self.width}d}"
+
+    async def allocate(self, session: AsyncSession) -> str:
+        number = (await session.execute(select(self.sequence.next_value()))).scalar_one()
+        return self.format(number)
+
+    async def allocate_many(self, session: AsyncSession, count: int) -> List[str]:
+        """Reserve `count` codes in one round trip."""
+        if count <= 0:
+            return []
+        stmt = select(self.sequence.next_value()).select_from(func.generate_series(1, count))
+        numbers = (await session.execute(stmt)).scalars().all()
+        return [self.format(n) for n in numbers]
+
+
+member_code_allocator = MemberCodeAllocator()
@@ -0,0 +1,196 @@
+# core/crud/rollup.py
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import func, delete, insert, text, cast, Date
+from sqlalchemy.future import select
+from datetime import date
+from typing import Iterable, Optional
+from uuid import UUID
+from core.models.donation import Donation
+from core.models.attendance import Attendance
+from core.models.member import Members
+from core.models.rollup import DonationDailyRollup, AttendanceDailyRollup, ChapterMemberRollup, ChapterDonationRollup, ChapterAttendanceRollup
+
+
+# ------------------------
+# Rollup maintenance
+# A write only touches the days it changed: those days are deleted from
+# the rollup and re-aggregated from raw rows (one day's rows, via the date
+# indexes). Passing days=None rebuilds the whole table.
+# Nothing here commits; callers run it inside their own transaction.
+# ------------------------
+def _keys(keys: Optional[Iterable]):
+    # Days or chapter ids: deduplicated and sorted, None meaning "all"
+    return None if keys is None else sorted({k for k in keys if k is not None})
+
+
+async def _lock_keys(session: AsyncSession, table: str, keys: Optional[list]) -> None:
+    # Two writers refreshing the same day (or chapter) would both delete and
+    # then both insert it; serialize per (table, key). Sorted order avoids deadlocks.
+    keys = [f"{table}:*"] if keys is None else [f"{table}:{k}" for k in keys]
+    for key in keys:
+        await session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": key})
+
+
+async def refresh_donation_days(session: AsyncSession, days: Optional[Iterable[date]] = None) -> None:
+    days = _keys(days)
+    if days == []:
+        return
+
+    await _lock_keys(session, "donation_daily_rollup", days)
+    clear = delete(DonationDailyRollup)
+    source = (
+        select(
+            Donation.donation_date,
+            Donation.donation_type,
+            func.sum(Donation.amount),
+            func.count(Donation.id),
+        )
+        .where(Donation.donation_date.is_not(None))
+        .group_by(Donation.donation_date, Donation.donation_type)
+    )
+    if days is not None:
+        clear = clear.where(DonationDailyRollup.day.in_(days))
+        source = source.where(Donation.donation_date.in_(days))
+
+    await session.execute(clear)
+    await session.execute(
+        insert(DonationDailyRollup).from_select(["day", "donation_type", "total_amount", "donation_count"], source)
+    )
+
+
+async def refresh_attendance_days(session: AsyncSession, days: Optional[Iterable[date]] = None) -> None:
+    days = _keys(days)
+    if days == []:
+        return
+
+    await _lock_keys(session, "attendance_daily_rollup", days)
+    status = func.lower(func.coalesce(Attendance.status, ""))
+    clear = delete(AttendanceDailyRollup)
+    source = (
+        select(
+            Attendance.attendance_date,
+            Attendance.session_id,
+            status,
+            func.count(Attendance.id),
+        )
+        .group_by(Attendance.attendance_date, Attendance.session_id, status)
+    )
+    if days is not None:
+        clear = clear.where(AttendanceDailyRollup.day.in_(days))
+        source = source.where(Attendance.attendance_date.in_(days))
+
+    await session.execute(clear)
+    await session.execute(
+        insert(AttendanceDailyRollup).from_select(["day", "session_id", "status", "attendance_count"], source)
+    )
+
+
+# ------------------------
+# Chapter rollups
+# Same delete-and-reaggregate scheme, keyed by chapter (and month for
+# donations/attendance). Writes refresh only the chapters they touched; a
+# member changing chapter refreshes both chapters' whole history.
+# ------------------------
+def _month(column):
+    return cast(func.date_trunc("month", column), Date)
+
+
+def _month_starts(days: Iterable[Optional[date]]):
+    return sorted({d.replace(day=1) for d in days if d is not None})
+
+
+async def chapters_of_members(session: AsyncSession, member_ids: Iterable[Optional[UUID]]) -> list:
+    member_ids = {m for m in member_ids if m is not None}
+    if not member_ids:
+        return []
+    stmt = select(Members.chapter_id).where(Members.id.in_(member_ids), Members.chapter_id.is_not(None)).distinct()
+    return list((await session.execute(stmt)).scalars().all())
+
+
+async def refresh_chapter_members(session: AsyncSession, chapter_ids: Optional[Iterable[UUID]] = None) -> None:
+    chapters = _keys(chapter_ids)
+    if chapters == []:
+        return
+
+    await _lock_keys(session, "chapter_member_rollup", chapters)
+    clear = delete(ChapterMemberRollup)
+    source = (
+        select(Members.chapter_id, Members.status, func.count(Members.id))
+        .where(Members.chapter_id.is_not(None))
+        .group_by(Members.chapter_id, Members.status)
+    )
+    if chapters is not None:
+        clear = clear.where(ChapterMemberRollup.chapter_id.in_(chapters))
+        source = source.where(Members.chapter_id.in_(chapters))
+
+    await session.execute(clear)
+    await session.execute(
+        insert(ChapterMemberRollup).from_select(["chapter_id", "status", "member_count"], source)
+    )
+
+
+async def refresh_chapter_donations(session: AsyncSession, chapter_ids: Optional[Iterable[UUID]] = None, days: Optional[Iterable[date]] = None) -> None:
+    """Recompute the given chapters (all when None) for the months containing `days` (all months when None)."""
+    chapters = _keys(chapter_ids)
+    months = None if days is None else _month_starts(days)
+    if chapters == [] or months == []:
+        return
+
+    await _lock_keys(session, "chapter_donation_rollup", chapters)
+    month = _month(Donation.donation_date)
+    clear = delete(ChapterDonationRollup)
+    source = (
+        select(Members.chapter_id, month, Donation.donation_type, func.sum(Donation.amount), func.count(Donation.id))
+        .join(Members, Members.id == Donation.member_id)
+        .where(Members.chapter_id.is_not(None), Donation.donation_date.is_not(None))
+        .group_by(Members.chapter_id, month, Donation.donation_type)
+    )
+    if chapters is not None:
+        clear = clear.where(ChapterDonationRollup.chapter_id.in_(chapters))
+        source = source.where(Members.chapter_id.in_(chapters))
+    if months is not None:
+        clear = clear.where(ChapterDonationRollup.month.in_(months))
+        # Range first so (member_id, date) index scans stay bounded
+        source = source.where(Donation.donation_date >= months[0], month.in_(months))
+
+    await session.execute(clear)
+    await session.execute(
+        insert(ChapterDonationRollup).from_select(["chapter_id", "month", "donation_type", "total_amount", "donation_count"], source)
+    )
+
+
+async def refresh_chapter_attendance(session: AsyncSession, chapter_ids: Optional[Iterable[UUID]] = None, days: Optional[Iterable[date]] = None) -> None:
+    chapters = _keys(chapter_ids)
+    months = None if days is None else _month_starts(days)
+    if chapters == [] or months == []:
+        return
+
+    await _lock_keys(session, "chapter_attendance_rollup", chapters)
+    month = _month(Attendance.attendance_date)
+    status = func.lower(func.coalesce(Attendance.status, ""))
+    clear = delete(ChapterAttendanceRollup)
+    source = (
+        select(Members.chapter_id, month, status, func.count(Attendance.id))
+        .join(Members, Members.id == Attendance.member_id)
+        .where(Members.chapter_id.is_not(None), Attendance.attendance_date.is_not(None))
+        .group_by(Members.chapter_id, month, status)
+    )
+    if chapters is not None:
+        clear = clear.where(ChapterAttendanceRollup.chapter_id.in_(chapters))
+        source = source.where(Members.chapter_id.in_(chapters))
+    if months is not None:
+        clear = clear.where(ChapterAttendanceRollup.month.in_(months))
+        source = source.where(Attendance.attendance_date >= months[0], month.in_(months))
+
+    await session.execute(clear)
+    await session.execute(
+        insert(ChapterAttendanceRollup).from_select(["chapter_id", "month", "status", "attendance_count"], source)
+    )
+
+
+async def rebuild_rollups(session: AsyncSession) -> None:
+    await refresh_donation_days(session)
+    await refresh_attendance_days(session)
+    await refresh_chapter_members(session)
+    await refresh_chapter_donations(session)
+    await refresh_chapter_attendance(session)
@@ -1,7 +1,8 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.future import select
-from core.models.user import User
+from core.models.user import User, UserRole
 from core.models.member import Members
+from core.auth.principal_cache import invalidate_principal
 
 
 class UserCRUD:
@@ -17,6 +18,30 @@ class UserCRUD:
         await db.refresh(user)
         return user
 
+    # Role and status changes must drop the cached principal, or the old
+    # roles would keep authorizing requests until the TTL runs out.
+    @staticmethod
+    async def assign_role(db: AsyncSession, user_id, role_id):
+        db.add(UserRole(user_id=user_id, role_id=role_id))
+        await db.commit()
+        invalidate_principal(user_id)
+
+    @staticmethod
+    async def remove_role(db: AsyncSession, user_id, role_id):
+        link = await db.get(UserRole, (user_id, role_id))
+        if link:
+            await db.delete(link)
+            await db.commit()
+        invalidate_principal(user_id)
+
+    @staticmethod
+    async def set_status(db: AsyncSession, user: User, status: str):
+        user.status = status
+        db.add(user)
+        await db.commit()
+        invalidate_principal(user.id)
+        return user
+
     @staticmethod
     async def get_user_with_member(user_id: int, db: AsyncSession):
         statement = select(User, Members).join(Members, Members.user_id == User.id).where(User.id == user_id)
@@ -0,0 +1,274 @@
+# core/imports/donations.py
+import os
+import re
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import union, update
+from sqlalchemy.future import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.crud.base import CRUDBase
+from core.crud.donation import donation_crud
+from core.crud.member import member_crud
+from core.imports.errors import unique_violation
+from core.imports.normalize import clean, normalize_code, normalize_phone
+from core.imports.readers import Row, batched
+from core.imports.report import ImportReport, RowError, record_import
+from core.models.donation import Donation, DonationType
+from core.models.donation_import import UnmatchedDonation
+from utils.ids import uuid7
+
+# Statement lines parsed, matched and loaded per chunk
+STATEMENT_BATCH_SIZE = int(os.getenv("STATEMENT_BATCH_SIZE", 5000))
+REFERENCE_MAX_LENGTH = 100
+REFERENCE_CONSTRAINTS = ("uq_donations_reference", "uq_unmatched_donations_reference")
+REFERENCE_RETRIES = 3
+
+STATEMENT_HEADER_ALIASES = {
+    "transaction_date": "date",
+    "value_date": "date",
+    "txn_date": "date",
+    "credit": "amount",
+    "amount_(ugx)": "amount",
+    "msisdn": "phone",
+    "phone_number": "phone",
+    "sender_phone": "phone",
+    "payer_phone": "phone",
+    "nin": "national_id",
+    "id_number": "national_id",
+    "code": "member_code",
+    "description": "narration",
+    "details": "narration",
+    "sender_name": "name",
+    "payer": "name",
+    "payer_name": "name",
+    "transaction_id": "reference",
+    "ref": "reference",
+    "type": "donation_type",
+}
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%Y/%m/%d", "%d %b %Y", "%d-%b-%Y")
+_AMOUNT_JUNK = re.compile(r"[^\d.\-]")
+_MEMBER_CODE_IN_TEXT = re.compile(r"\bMEM\s?-?\d+\b", re.IGNORECASE)
+
+unmatched_donation_crud = CRUDBase(UnmatchedDonation)
+
+
+def parse_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    raw = clean(value)
+    if raw:
+        raw = raw.split(" ")[0] if ":" in raw else raw  # drop a trailing time
+        for fmt in DATE_FORMATS:
+            try:
+                return datetime.strptime(raw, fmt).date()
+            except ValueError:
+                continue
+    raise ValueError(f"unrecognised date {value!r}")
+
+
+def parse_amount(value) -> float:
+    if isinstance(value, (int, float)):
+        amount = float(value)
+    else:
+        raw = _AMOUNT_JUNK.sub("", clean(value) or "")
+        if not raw:
+            raise ValueError("missing amount")
+        amount = float(raw)
+    if amount <= 0:
+        raise ValueError("amount must be positive")
+    return amount
+
+
+def parse_type(value, default: DonationType) -> str:
+    raw = (clean(value) or "").lower()
+    for t in DonationType:
+        if raw in (t.value, t.name):
+            return t.value
+    return default.value
+
+
+# ------------------------
+# Member matching
+# One pass over members builds hash maps keyed by normalized member_code,
+# national_id and phone; each statement line is then matched with dict
+# lookups instead of a query per line.
+# ------------------------
+class MemberIndex:
+    def __init__(self):
+        self.by_code: Dict[str, UUID] = {}
+        self.by_national_id: Dict[str, UUID] = {}
+        self.by_phone: Dict[str, UUID] = {}
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> "MemberIndex":
+        index = cls()
+        async for m in member_crud.stream(session, columns=["id", "member_code", "national_id", "phone"]):
+            if code := normalize_code(m["member_code"]):
+                index.by_code[code] = m["id"]
+            if nid := normalize_code(m["national_id"]):
+                index.by_national_id[nid] = m["id"]
+            if phone := normalize_phone(m["phone"]):
+                index.by_phone[phone] = m["id"]
+        return index
+
+    def match(self, code: Optional[str], national_id: Optional[str], phone: Optional[str], narration: Optional[str] = None) -> Optional[UUID]:
+        # Most specific key first; a member code typed into the narration counts too
+        if code and code in self.by_code:
+            return self.by_code[code]
+        if national_id and national_id in self.by_national_id:
+            return self.by_national_id[national_id]
+        if phone and phone in self.by_phone:
+            return self.by_phone[phone]
+        if narration:
+            for token in _MEMBER_CODE_IN_TEXT.findall(narration):
+                code = re.sub(r"[\s\-]", "", token).upper()
+                if code in self.by_code:
+                    return self.by_code[code]
+        return None
+
+
+async def _known_references(session: AsyncSession, references: List[str]) -> Set[str]:
+    if not references:
+        return set()
+    stmt = union(
+        select(Donation.reference).where(Donation.reference.in_(references)),
+        select(UnmatchedDonation.reference).where(UnmatchedDonation.reference.in_(references)),
+    )
+    return set((await session.execute(stmt)).scalars().all())
+
+
+async def _copy_new(session: AsyncSession, crud: CRUDBase, rows: List[Dict[str, Any]], report: ImportReport) -> int:
+    # Drop lines whose reference is already loaded (as a donation or a queued
+    # line), then COPY the rest. A concurrent import of the same statement makes
+    # the COPY hit the reference constraint; re-check against what it committed.
+    # Any other violation, or one that keeps recurring, is raised.
+    for attempt in range(1, REFERENCE_RETRIES + 1):
+        known = await _known_references(session, [r["reference"] for r in rows if r["reference"]])
+        fresh = [r for r in rows if r["reference"] not in known]
+        try:
+            copied = await crud.copy_many(session, fresh)
+        except Exception as e:
+            await session.rollback()
+            if attempt == REFERENCE_RETRIES or not unique_violation(e, REFERENCE_CONSTRAINTS):
+                raise
+            continue
+        report.skipped += len(rows) - len(fresh)
+        return copied
+
+
+async def import_statement(session: AsyncSession, rows: Iterable[Row], default_type: DonationType = DonationType.tithe, batch_size: int = STATEMENT_BATCH_SIZE) -> ImportReport:
+    """
+    Load a bank / mobile-money statement: each valid line becomes a donation
+    when its payer matches a member, otherwise it is queued in
+    unmatched_donations for review. Lines with a bad date or amount are reported.
+    The statement reference (transaction id) is the idempotency key: lines
+    already loaded are skipped, so re-uploading a statement adds nothing.
+    """
+    report = ImportReport()
+    started = time.monotonic()
+    index = await MemberIndex.load(session)
+    await session.rollback()  # end the read; each chunk commits on its own
+    import_id = uuid7()
+    seen: Set[str] = set()
+
+    for chunk in batched(rows, batch_size):
+        matched, unmatched = [], []
+        for line, raw in chunk:
+            report.total += 1
+            try:
+                donation_date = parse_date(raw.get("date"))
+                amount = parse_amount(raw.get("amount"))
+            except ValueError as e:
+                report.errors.append(RowError(line, "date/amount", str(e)))
+                continue
+
+            reference = clean(raw.get("reference"))
+            if reference:
+                if len(reference) > REFERENCE_MAX_LENGTH:
+                    report.errors.append(RowError(line, "reference", f"longer than {REFERENCE_MAX_LENGTH} characters"))
+                    continue
+                if reference in seen:
+                    report.errors.append(RowError(line, "reference", f"{reference} is repeated in this file"))
+                    continue
+                seen.add(reference)
+
+            donation_type = parse_type(raw.get("donation_type"), default_type)
+            code = normalize_code(raw.get("member_code"))
+            national_id = normalize_code(raw.get("national_id"))
+            phone = normalize_phone(raw.get("phone"))
+            narration = clean(raw.get("narration"))
+
+            member_id = index.match(code, national_id, phone, narration)
+            if member_id:
+                matched.append({
+                    "member_id": member_id,
+                    "amount": amount,
+                    "donation_type": donation_type,
+                    "donation_date": donation_date,
+                    "remarks": (narration or "")[:500] or None,
+                    "reference": reference,
+                })
+            else:
+                unmatched.append({
+                    "import_id": import_id,
+                    "line": line,
+                    "donation_date": donation_date,
+                    "amount": amount,
+                    "donation_type": donation_type,
+                    "payer_phone": phone,
+                    "payer_national_id": national_id,
+                    "payer_code": code,
+                    "payer_name": (clean(raw.get("name")) or "")[:200] or None,
+                    "reference": reference,
+                    "narration": (narration or "")[:200] or None,
+                })
+
+        report.imported += await _copy_new(session, donation_crud, matched, report)
+        report.queued += await _copy_new(session, unmatched_donation_crud, unmatched, report)
+
+    report.seconds = time.monotonic() - started
+    record_import("donation_statement", report)
+    return report
+
+
+async def resolve_unmatched(session: AsyncSession, line_id: UUID, member_id: UUID) -> Optional[Donation]:
+    """
+    Create the donation for a reviewed statement line and mark the line resolved,
+    in one transaction. The line is claimed with a conditional UPDATE, so when two
+    reviewers assign it at once the second waits on the row lock, matches nothing
+    and gets None instead of a second donation.
+    """
+    donation_id = uuid7()
+    claimed = await session.execute(
+        update(UnmatchedDonation)
+        .where(UnmatchedDonation.id == line_id, UnmatchedDonation.resolved_at.is_(None))
+        .values(resolved_member_id=member_id, resolved_donation_id=donation_id, resolved_at=datetime.utcnow())
+        .returning(
+            UnmatchedDonation.amount,
+            UnmatchedDonation.donation_type,
+            UnmatchedDonation.donation_date,
+            UnmatchedDonation.narration,
+            UnmatchedDonation.reference,
+        )
+    )
+    line = claimed.first()
+    if line is None:
+        await session.rollback()
+        return None
+    # create() commits the claim and the donation together
+    return await donation_crud.create(session, {
+        "id": donation_id,
+        "member_id": member_id,
+        "amount": line.amount,
+        "donation_type": line.donation_type,
+        "donation_date": line.donation_date,
+        "remarks": line.narration,
+        "reference": line.reference,
+    })
@@ -0,0 +1,20 @@
+# core/imports/errors.py
+from typing import Any, Iterable, List, Optional
+
+
+def _chain(exc: Exception) -> List[Any]:
+    # Raised by asyncpg directly (COPY) or wrapped by SQLAlchemy (INSERT), whose
+    # adapted DBAPI error in turn wraps the asyncpg one
+    orig = getattr(exc, "orig", None)
+    return [e for e in (exc, orig, getattr(orig, "__cause__", None)) if e is not None]
+
+
+def unique_violation(exc: Exception, constraints: Optional[Iterable[str]] = None) -> bool:
+    """True for a unique violation; with `constraints`, only on one of those named constraints."""
+    chain = _chain(exc)
+    if not any(getattr(e, "sqlstate", None) == "23505" for e in chain):
+        return False
+    if constraints is None:
+        return True
+    names = set(constraints)
+    return any(getattr(e, "constraint_name", None) in names for e in chain)
@@ -0,0 +1,150 @@
+# core/imports/members.py
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.future import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.crud.member import member_crud, member_code_allocator
+from core.imports.errors import unique_violation
+from core.imports.normalize import clean, normalize_code, normalize_email, normalize_phone
+from core.imports.readers import Row, batched
+from core.imports.report import ImportReport, RowError, record_import
+from core.models.member import Members
+from core.schemas.member import MemberCreate
+from utils.ids import uuid7
+
+# Rows validated, checked and loaded (one COPY + one commit) per chunk
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+
+# Spreadsheet headings people actually use -> MemberCreate fields
+MEMBER_HEADER_ALIASES = {
+    "firstname": "first_name",
+    "surname": "last_name",
+    "lastname": "last_name",
+    "middle_name": "other_names",
+    "other_name": "other_names",
+    "phone_number": "phone",
+    "mobile": "phone",
+    "telephone": "phone",
+    "email_address": "email",
+    "nin": "national_id",
+    "id_number": "national_id",
+    "date_of_birth": "dob",
+    "code": "member_code",
+    "sex": "gender",
+}
+
+
+def _normalize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    row = {k: clean(v) for k, v in raw.items() if k in MemberCreate.model_fields}
+    row["phone"] = normalize_phone(raw.get("phone"))
+    row["email"] = normalize_email(raw.get("email"))
+    row["member_code"] = normalize_code(raw.get("member_code"))
+    row["national_id"] = normalize_code(raw.get("national_id"))
+    if row.get("gender"):
+        row["gender"] = row["gender"].lower()
+    if row.get("status"):
+        row["status"] = row["status"].lower()
+    return {k: v for k, v in row.items() if v is not None}
+
+
+async def _existing(session: AsyncSession, column, values) -> set:
+    values = [v for v in values if v]
+    if not values:
+        return set()
+    return set((await session.execute(select(column).where(column.in_(values)))).scalars().all())
+
+
+class _Batch:
+    """One chunk: normalize, validate, de-duplicate (within the file and against the DB), load."""
+
+    UNIQUE = ("member_code", "phone", "email")
+
+    def __init__(self, report: ImportReport, seen: Dict[str, set]):
+        self.report = report
+        self.seen = seen
+
+    def _fail(self, line: int, field: str, message: str) -> None:
+        self.report.errors.append(RowError(line, field, message))
+
+    def validate(self, lines: List[int], raws: List[Dict[str, Any]], codes: List[str], defaults: Dict[str, Any]) -> List[tuple]:
+        valid, codes = [], iter(codes)
+        for line, raw in zip(lines, raws):
+            row = {**defaults, **_normalize(raw)}
+            if "member_code" not in row:
+                row["member_code"] = next(codes)
+            try:
+                member = MemberCreate(**row)
+            except ValidationError as e:
+                for err in e.errors():
+                    self._fail(line, ".".join(str(p) for p in err["loc"]) or "row", err["msg"])
+                continue
+            valid.append((line, member.model_dump(exclude_none=True)))
+        return valid
+
+    async def dedupe(self, session: AsyncSession, valid: List[tuple]) -> List[tuple]:
+        taken = {f: await _existing(session, getattr(Members, f), [r.get(f) for _, r in valid]) for f in self.UNIQUE}
+        out = []
+        for line, row in valid:
+            clash = next((f for f in self.UNIQUE if row.get(f) and (row[f] in taken[f] or row[f] in self.seen[f])), None)
+            if clash:
+                where = "already registered" if row[clash] in taken[clash] else "repeated in this file"
+                self._fail(line, clash, f"{row[clash]} is {where}")
+                continue
+            for f in self.UNIQUE:
+                if row.get(f):
+                    self.seen[f].add(row[f])
+            out.append((line, row))
+        return out
+
+
+async def _insert_skipping_conflicts(session: AsyncSession, batch: _Batch, rows: List[tuple]) -> int:
+    # Slow path for a chunk whose COPY hit a unique violation (a concurrent
+    # signup took a phone/email): insert what still fits, report the rest.
+    values = [{**row, "id": uuid7()} for _, row in rows]  # ids up front, to tell which rows went in
+    inserted = set(await member_crud.insert_many(session, values, on_conflict="nothing", return_ids=True))
+    for (line, _), v in zip(rows, values):
+        if v["id"] not in inserted:
+            batch._fail(line, "row", "conflicts with a member registered during the import")
+    return len(inserted)
+
+
+async def import_members(session: AsyncSession, rows: Iterable[Row], chapter_id: Optional[uuid.UUID] = None, batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """
+    Load member rows ((line, dict) pairs from read_rows, keyed by MemberCreate
+    field names) in chunks: validate, de-duplicate, allocate missing member
+    codes in one round trip, then COPY and commit each chunk. Bad rows are reported, never loaded.
+    """
+    report = ImportReport()
+    started = time.monotonic()
+    batch = _Batch(report, {f: set() for f in _Batch.UNIQUE})
+    defaults = {"chapter_id": chapter_id} if chapter_id else {}
+
+    for chunk in batched(rows, batch_size):
+        lines = [line for line, _ in chunk]
+        raws = [raw for _, raw in chunk]
+        report.total += len(raws)
+
+        missing = sum(1 for r in raws if not normalize_code(r.get("member_code")))
+        codes = await member_code_allocator.allocate_many(session, missing)
+        valid = await batch.dedupe(session, batch.validate(lines, raws, codes, defaults))
+        if not valid:
+            await session.rollback()
+            continue
+
+        try:
+            report.imported += await member_crud.copy_many(session, [row for _, row in valid])
+        except Exception as e:
+            await session.rollback()
+            if not unique_violation(e):
+                raise
+            report.imported += await _insert_skipping_conflicts(session, batch, valid)
+
+    report.seconds = time.monotonic() - started
+    report.errors.sort(key=lambda e: e.row)
+    record_import("members", report)
+    return report
@@ -0,0 +1,52 @@
+# core/imports/normalize.py
+import os
+import re
+from typing import Optional
+
+# Country code assumed for local numbers (0772 123456 -> +256772123456)
+DEFAULT_COUNTRY_CODE = os.getenv("DEFAULT_COUNTRY_CODE", "256")
+
+_NON_DIGITS = re.compile(r"\D+")
+_SPACES = re.compile(r"\s+")
+
+
+def clean(value) -> Optional[str]:
+    """Stripped string, or None for blanks (CSV cells are never None, XLSX cells often are)."""
+    if value is None:
+        return None
+    value = _SPACES.sub(" ", str(value)).strip()
+    return value or None
+
+
+def normalize_phone(value, country_code: str = DEFAULT_COUNTRY_CODE) -> Optional[str]:
+    """E.164-style +<country><number>; None when there are too few digits to be a phone."""
+    raw = clean(value)
+    if not raw:
+        return None
+    if isinstance(value, float) and value.is_integer():  # XLSX stores 772123456 as a number
+        raw = str(int(value))
+    digits = _NON_DIGITS.sub("", raw)
+    if raw.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0"):
+        digits = country_code + digits[1:]
+    elif not digits.startswith(country_code):
+        digits = country_code + digits
+    return f"+{digits}" if len(digits) >= 9 else None
+
+
+def normalize_email(value) -> Optional[str]:
+    raw = clean(value)
+    return raw.lower() if raw else None
+
+
+def normalize_code(value) -> Optional[str]:
+    """Member codes / national ids: upper-case, no inner spaces."""
+    raw = clean(value)
+    return raw.replace(" ", "").upper() if raw else None
+
+
+def normalize_header(value) -> str:
+    return _SPACES.sub("_", (clean(value) or "").lower())
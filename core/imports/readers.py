@@ -0,0 +1,76 @@
+# core/imports/readers.py
+import codecs
+import csv
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.imports.normalize import normalize_header
+
+try:  # optional: only needed for .xlsx uploads
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+
+class UnsupportedFile(ValueError):
+    pass
+
+
+Row = Tuple[int, Dict[str, Any]]
+
+
+def _rows_from(header: List[Any], rows: Iterable[Tuple[int, Iterable[Any]]], aliases: Dict[str, str]) -> Iterator[Row]:
+    keys = [aliases.get(normalize_header(h), normalize_header(h)) for h in header]
+    for line, values in rows:
+        row = dict(zip(keys, values))
+        if any(v not in (None, "") for v in row.values()):  # skip blank lines
+            yield line, row
+
+
+def _csv_lines(reader) -> Iterator[Tuple[int, List[str]]]:
+    # line_num counts physical lines read so far; a quoted field can span
+    # several, so the row starts one past where the previous one ended
+    start = reader.line_num + 1
+    for values in reader:
+        yield start, values
+        start = reader.line_num + 1
+
+
+def read_csv(fh: BinaryIO, aliases: Optional[Dict[str, str]] = None) -> Iterator[Row]:
+    reader = csv.reader(codecs.iterdecode(fh, "utf-8-sig"))
+    header = next(reader, None)
+    if header is None:
+        return
+    yield from _rows_from(header, _csv_lines(reader), aliases or {})
+
+
+def read_xlsx(fh: BinaryIO, aliases: Optional[Dict[str, str]] = None) -> Iterator[Row]:
+    if load_workbook is None:
+        raise UnsupportedFile("XLSX import requires openpyxl; upload a CSV instead")
+    wb = load_workbook(fh, read_only=True, data_only=True)
+    try:
+        sheet = wb.active
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        yield from _rows_from(list(header), enumerate(rows, start=sheet.min_row + 1), aliases or {})
+    finally:
+        wb.close()
+
+
+def read_rows(filename: str, fh: BinaryIO, aliases: Optional[Dict[str, str]] = None) -> Iterator[Row]:
+    """(line, row) pairs of a CSV or XLSX upload: the file/sheet line number and a dict
+    keyed by normalized header. Streamed, not loaded whole."""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return read_csv(fh, aliases)
+    if name.endswith(".xlsx"):
+        return read_xlsx(fh, aliases)
+    raise UnsupportedFile("Upload a .csv or .xlsx file")
+
+
+def batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
@@ -0,0 +1,68 @@
+# core/imports/report.py
+import csv
+import io
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+@dataclass
+class RowError:
+    row: int  # 1-based line in the file, header being line 1
+    field: str
+    message: str
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    imported: int = 0
+    queued: int = 0  # held for manual review (e.g. unmatched statement lines)
+    skipped: int = 0  # already loaded by an earlier import (e.g. a repeated statement reference)
+    errors: List[RowError] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failed_rows(self) -> int:
+        return len({e.row for e in self.errors})
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.total / self.seconds, 1) if self.seconds else 0.0
+
+    def error_csv(self) -> str:
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["row", "field", "message"])
+        writer.writerows((e.row, e.field, e.message) for e in self.errors)
+        return out.getvalue()
+
+
+# ------------------------
+# Import metrics
+# Running totals and the last run per import kind, for /api/metrics/imports.
+# ------------------------
+_import_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def record_import(kind: str, report: ImportReport) -> None:
+    stats = _import_stats.setdefault(kind, {"runs": 0, "rows": 0, "imported": 0, "queued": 0, "skipped": 0, "failed": 0, "seconds": 0.0})
+    stats["runs"] += 1
+    stats["rows"] += report.total
+    stats["imported"] += report.imported
+    stats["queued"] += report.queued
+    stats["skipped"] += report.skipped
+    stats["failed"] += report.failed_rows
+    stats["seconds"] += report.seconds
+    stats["last_run"] = {
+        "at": datetime.utcnow().isoformat(),
+        "rows": report.total,
+        "rows_per_second": report.rows_per_second,
+    }
+
+
+def import_stats() -> Dict[str, Dict[str, Any]]:
+    return {
+        kind: {**stats, "rows_per_second": round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] else 0.0}
+        for kind, stats in _import_stats.items()
+    }
@@ -1,11 +1,13 @@
 # app/models/attendance.py
 from sqlmodel import SQLModel, Field, Relationship, Column, String
+from sqlalchemy import UniqueConstraint, Index, text
 from datetime import date as dt_date
 from uuid import uuid4, UUID
 from enum import Enum
 from typing import List, Optional
 from core.models.event import Event
 from core.models.event_session import EventSession
+from utils.ids import uuid7
 
 
 class AttendanceStatus(str, Enum):
@@ -16,11 +18,21 @@ class AttendanceStatus(str, Enum):
 
 class Attendance(SQLModel, table=True):
     __tablename__ = "attendance"
+    __table_args__ = (
+        # One mark per member per session per day; roster re-submits upsert onto it
+        UniqueConstraint("member_id", "session_id", "attendance_date", name="uq_attendance_member_session_date"),
+        # Date-sorted lists and windows; session/status included for rollup refreshes
+        Index("ix_attendance_date_id", "attendance_date", "id", postgresql_include=["session_id", "status"]),
+        # Status filters compare lower(status); stored casing varies
+        Index("ix_attendance_lower_status_date", text("lower(status)"), "attendance_date", "id"),
+        Index("ix_attendance_member_date", "member_id", "attendance_date", "id", postgresql_include=["status"]),
+        Index("ix_attendance_session_date", "session_id", "attendance_date"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, index=True)
     member_id: UUID = Field(foreign_key="members.id", nullable=False)
     session_id: UUID = Field(foreign_key="event_sessions.id", nullable=False)
-    attendance_date: dt_date = Field(nullable=False, index=True)
+    attendance_date: dt_date = Field(nullable=False)
     status: str | None = Field(default="present") 
     remarks: str | None = Field(default=None)
 
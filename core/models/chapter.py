@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional
 import uuid
 
@@ -7,9 +8,24 @@ class Chapters(SQLModel, table=True):
     name: str = Field(max_length=150, nullable=False)
     
     # Self-referencing foreign key to parent chapter
-    parent_id: Optional[uuid.UUID] = Field(default=None, foreign_key="chapter.id")
+    parent_id: Optional[uuid.UUID] = Field(default=None, foreign_key="chapters.id", index=True)
     
     type: Optional[str] = Field(default=None, max_length=20)  # national, region, district, center
     address: Optional[str] = Field(default=None)
     contact_phone: Optional[str] = Field(default=None, max_length=30)
     active: bool = Field(default=True)
+
+
+# Every (ancestor, descendant) pair in the chapter tree, including each
+# chapter with itself at depth 0; kept in step by core.crud.chapter. A
+# subtree is then one indexed lookup on ancestor_id instead of a recursive walk.
+class ChapterClosure(SQLModel, table=True):
+    __tablename__ = "chapter_closure"
+    __table_args__ = (
+        # Ancestors of a chapter (moves, breadcrumbs)
+        Index("ix_chapter_closure_descendant_depth", "descendant_id", "depth"),
+    )
+
+    ancestor_id: uuid.UUID = Field(foreign_key="chapters.id", primary_key=True)
+    descendant_id: uuid.UUID = Field(foreign_key="chapters.id", primary_key=True)
+    depth: int = Field(nullable=False)
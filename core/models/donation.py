@@ -7,7 +7,8 @@ from enum import Enum
 from typing import Optional, List
 import uuid
 from core.models.attendance import Attendance
-from sqlalchemy import Date  # ✅ import Date from SQLAlchemy
+from sqlalchemy import Date, Index, UniqueConstraint  # ✅ import Date from SQLAlchemy
+from utils.ids import uuid7
 
 class DonationType(str, Enum):
     tithe = "tithe"
@@ -17,13 +18,23 @@ class DonationType(str, Enum):
 
 class Donation(SQLModel, table=True):
     __tablename__ = "donations"
+    __table_args__ = (
+        # Date-sorted lists, dashboard windows and rollup refreshes
+        Index("ix_donations_date_id", "date", "id"),
+        Index("ix_donations_type_date", "donation_type", "date", "id"),
+        # A member's donations by date; amount/type included for index-only summaries
+        Index("ix_donations_member_date", "member_id", "date", "id", postgresql_include=["amount", "donation_type"]),
+        # Statement transaction id; a statement loaded twice is skipped line by line
+        UniqueConstraint("reference", name="uq_donations_reference"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
-    member_id: UUID = Field(foreign_key="members.id", nullable=True, index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True, index=True)
+    member_id: UUID = Field(foreign_key="members.id", nullable=True)
     amount: float = Field(nullable=False)
     donation_type: DonationType = Field(sa_column=Column(String, nullable=False, server_default=DonationType.sunday_donation.value), default=DonationType.sunday_donation.value)
     donation_date: date = Field(sa_column=Column("date", Date))
     remarks: str | None = Field(default=None)
+    reference: Optional[str] = Field(default=None, max_length=100)
 
     # Forward reference to Member
     member: Optional["Members"] = Relationship(back_populates="donations")
\ No newline at end of file
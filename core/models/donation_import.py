@@ -0,0 +1,35 @@
+# core/models/donation_import.py
+from sqlmodel import SQLModel, Field
+from sqlalchemy import UniqueConstraint
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+from utils.ids import uuid7
+
+
+# Statement lines that could not be matched to a member; staff assign them
+# from the review queue, which creates the donation.
+class UnmatchedDonation(SQLModel, table=True):
+    __tablename__ = "unmatched_donations"
+    __table_args__ = (
+        UniqueConstraint("reference", name="uq_unmatched_donations_reference"),
+    )
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    import_id: UUID = Field(nullable=False, index=True)
+    line: int = Field(nullable=False)
+    donation_date: date = Field(nullable=False)
+    amount: float = Field(nullable=False)
+    donation_type: str = Field(nullable=False, max_length=50)
+    payer_phone: Optional[str] = Field(default=None, max_length=30)
+    payer_national_id: Optional[str] = Field(default=None, max_length=50)
+    payer_code: Optional[str] = Field(default=None, max_length=50)
+    payer_name: Optional[str] = Field(default=None, max_length=200)
+    reference: Optional[str] = Field(default=None, max_length=100)  # statement transaction id
+    narration: Optional[str] = Field(default=None, max_length=200)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Set once a staff member assigns the line
+    resolved_member_id: Optional[UUID] = Field(default=None, foreign_key="members.id")
+    resolved_donation_id: Optional[UUID] = Field(default=None)
+    resolved_at: Optional[datetime] = Field(default=None, index=True)
@@ -3,6 +3,8 @@ from typing import Optional, List
 from datetime import date, datetime
 import uuid
 from enum import Enum
+from sqlalchemy import Sequence, Index
+from utils.ids import uuid7
 from .donation import Donation
 from core.models.attendance import Attendance
 
@@ -17,11 +19,23 @@ class Gender(str, Enum):
     male = "male"
     female = "female"
 
+# Numeric part of MEMnnnn member codes (see MemberCodeAllocator)
+member_code_seq = Sequence("member_code_seq", metadata=SQLModel.metadata)
+
 class Members(SQLModel, table=True):
     __tablename__ = "members"
+    __table_args__ = (
+        # List pages sort by created_at (id breaks ties for keyset paging), optionally per status/chapter
+        Index("ix_members_created_at_id", "created_at", "id"),
+        Index("ix_members_status_created_at", "status", "created_at", "id"),
+        Index("ix_members_chapter_created_at", "chapter_id", "created_at", "id"),
+        # Profile and dashboard lookups by the logged-in user
+        Index("ix_members_user_id", "user_id"),
+    )
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
-    user_id: uuid.UUID = Field(foreign_key="users.id")
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True, index=True)
+    # Members loaded by import or created by staff have no login yet
+    user_id: Optional[uuid.UUID] = Field(default=None, foreign_key="users.id")
     member_code: str = Field(unique=True, nullable=False, max_length=50)
 
     first_name: str = Field(max_length=100)
@@ -0,0 +1,54 @@
+# core/models/rollup.py
+from sqlmodel import SQLModel, Field
+from datetime import date
+from uuid import UUID
+
+
+# Daily pre-aggregates kept in step with donations/attendance by
+# core.crud.rollup; dashboards and reports read these instead of raw rows.
+class DonationDailyRollup(SQLModel, table=True):
+    __tablename__ = "donation_daily_rollup"
+
+    day: date = Field(primary_key=True)
+    donation_type: str = Field(primary_key=True, max_length=50)
+    total_amount: float = Field(default=0, nullable=False)
+    donation_count: int = Field(default=0, nullable=False)
+
+
+class AttendanceDailyRollup(SQLModel, table=True):
+    __tablename__ = "attendance_daily_rollup"
+
+    day: date = Field(primary_key=True)
+    session_id: UUID = Field(primary_key=True)
+    status: str = Field(primary_key=True, max_length=20)  # lower-cased
+    attendance_count: int = Field(default=0, nullable=False)
+
+
+# Per-chapter aggregates: counts for each chapter's own members only. Totals
+# for a region are the sum over its subtree (chapter_closure) at read time,
+# so moving a chapter needs no refresh here.
+class ChapterMemberRollup(SQLModel, table=True):
+    __tablename__ = "chapter_member_rollup"
+
+    chapter_id: UUID = Field(primary_key=True)
+    status: str = Field(primary_key=True, max_length=20)
+    member_count: int = Field(default=0, nullable=False)
+
+
+class ChapterDonationRollup(SQLModel, table=True):
+    __tablename__ = "chapter_donation_rollup"
+
+    chapter_id: UUID = Field(primary_key=True)
+    month: date = Field(primary_key=True)  # first day of the month
+    donation_type: str = Field(primary_key=True, max_length=50)
+    total_amount: float = Field(default=0, nullable=False)
+    donation_count: int = Field(default=0, nullable=False)
+
+
+class ChapterAttendanceRollup(SQLModel, table=True):
+    __tablename__ = "chapter_attendance_rollup"
+
+    chapter_id: UUID = Field(primary_key=True)
+    month: date = Field(primary_key=True)
+    status: str = Field(primary_key=True, max_length=20)  # lower-cased
+    attendance_count: int = Field(default=0, nullable=False)
@@ -2,6 +2,7 @@ from typing import List, Optional
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 import uuid
+from utils.ids import uuid7
 
 # Association table
 class UserRole(SQLModel, table=True):
@@ -22,7 +23,7 @@ class Role(SQLModel, table=True):
 class User(SQLModel, table=True):
     __tablename__ = "users"
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     username: str
     email: str = Field(nullable=False, unique=True, index=True)
     password_hash: str = Field(nullable=False)
@@ -2,49 +2,39 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 from core.schemas.attendance import AttendanceCreate, AttendanceUpdate, AttendanceRead
+from core.schemas.pagination import CursorPage
 from core.models.attendance import Attendance, AttendanceStatus
 from core.crud.attendance import attendance_crud
-from app.database import async_session
+from app.database import get_session
 from core.auth.deps import require_login, get_current_user_api
 import uuid
 
 router = APIRouter()
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # ------------------------
 # List attendances (API)
 # ------------------------
-@router.get("/", response_model=List[AttendanceRead])
-async def list_attendances(q: Optional[str] = Query(None), status: Optional[AttendanceStatus] = Query(None), page: int = Query(1, ge=1), page_size: int = Query(10, ge=1, le=100), dependencies=[Depends(get_current_user_api)], session: AsyncSession = Depends(get_session)):
-    # --- Convert empty strings to None ---
-    status = status.strip() if status and status.strip() else None
-
-    # --- Parse Enum safely ---
-    status_enum = None
-    if status:
-        try:
-            status_enum = AttendanceStatus(status.lower())
-        except ValueError:
-            status_enum = None
-
+@router.get("/", response_model=CursorPage[AttendanceRead])
+async def list_attendances(q: Optional[str] = Query(None), status: Optional[AttendanceStatus] = Query(None), chapter_id: Optional[uuid.UUID] = Query(None), cursor: Optional[str] = Query(None), page: int = Query(1, ge=1), page_size: int = Query(10, ge=1, le=100), dependencies=[Depends(get_current_user_api)], session: AsyncSession = Depends(get_session)):
     filters = {}
-    if status_enum:
-        filters["status"] = status_enum
-
-    stmt = attendance_crud.select_stmt(
-        q=q,
-        filters=filters,
-        search_fields=["attendance_date"],
-        page=page,
-        page_size=page_size,
-        order_by="attendance_date"
-    )
+    if status:
+        filters["status"] = status.value  # case-insensitive, see CRUDAttendance._filter_clause
+    if chapter_id:
+        filters["chapter_id"] = chapter_id  # members of this chapter and its sub-chapters
 
-    attendances = (await session.execute(stmt)).scalars().all()
-    return attendances
+    try:
+        return await attendance_crud.paginate_keyset(
+            session,
+            q=q,
+            filters=filters,
+            search_fields=["status", "remarks"],  # lower() has no date overload, so the date is not searchable
+            page=page,
+            page_size=page_size,
+            order_by="attendance_date",
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 # ------------------------
 # Get single attendance
@@ -60,9 +50,18 @@ async def get_attendance(member_id: uuid.UUID, session: AsyncSession = Depends(g
 # Create Attendance
 # ------------------------
 
-@router.post("/", response_model=AttendanceRead)
-async def create_attendance(member_in: AttendanceCreate, session: AsyncSession = Depends(get_session)):
-    return await attendance_crud.create(session, member_in.model_dump())
+@router.post("/")
+async def create_attendance(attendance_in: AttendanceCreate, session: AsyncSession = Depends(get_session)):
+    ids = await attendance_crud.mark_roster(
+        session,
+        session_id=attendance_in.session_id,
+        member_ids=attendance_in.member_ids,
+        attendance_date=attendance_in.attendance_date,
+        status=attendance_in.status,
+        remarks=attendance_in.remarks,
+        return_ids=True,
+    )
+    return {"marked": len(ids), "ids": ids}
 """
 
 @router.post("/create")
@@ -1,30 +1,34 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, func
-from app.database import async_session
+from app.database import get_session
 from core.models.member import Members
 from core.models.donation import Donation
 from core.models.attendance import Attendance
 from core.crud.user import UserCRUD
+from core.auth.deps import require_roles
+from core.crud.kpi import get_cached_dashboard_kpis, get_daily_trends, get_chapter_rollups, get_chapter_tree
+from core.schemas.dashboard import DashboardKPIs, ChapterRollup, ChapterTreeNode
+from typing import List
 
 
 router = APIRouter()
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
-@router.get("/stats")
+@router.get("/stats", response_model=DashboardKPIs)
 async def get_dashboard_stats(db: AsyncSession = Depends(get_session)):
-    total_members = (await db.execute(select(func.count()).select_from(Members))).scalar()
-    total_donations = (await db.execute(select(func.sum(Donation.amount)))).scalar() or 0
-    total_attendance = (await db.execute(select(func.count()).select_from(Attendance))).scalar()
+    return await get_cached_dashboard_kpis(db)
+
+@router.get("/trends")
+async def get_dashboard_trends(days: int = Query(30, ge=1, le=366), user=Depends(require_roles("staff")), db: AsyncSession = Depends(get_session)):
+    return await get_daily_trends(db, days)
+
+@router.get("/chapters", response_model=List[ChapterRollup])
+async def get_chapter_stats(type: str = Query("region"), months: int = Query(1, ge=1, le=60), user=Depends(require_roles("staff")), db: AsyncSession = Depends(get_session)):
+    return await get_chapter_rollups(db, type, months)
 
-    return {
-        "total_members": total_members,
-        "total_donations": total_donations,
-        "total_attendance": total_attendance,
-    }
+@router.get("/chapters/tree", response_model=List[ChapterTreeNode])
+async def get_chapter_tree_stats(months: int = Query(12, ge=1, le=60), user=Depends(require_roles("staff")), db: AsyncSession = Depends(get_session)):
+    return await get_chapter_tree(db, months)
 
 @router.get("/dashboard")
 async def dashboard(db: AsyncSession = Depends(get_session)):
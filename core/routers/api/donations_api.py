@@ -2,66 +2,51 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 from core.schemas.donation import DonationCreate, DonationUpdate, DonationRead
+from core.schemas.pagination import CursorPage
 from core.models.donation import Donation, DonationType
 from core.crud.donation import donation_crud
-from app.database import async_session
+from app.database import get_session
 from core.auth.deps import require_login, get_current_user_api
 import uuid
 
 router = APIRouter()
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # ------------------------
 # List donations (API)
 # ------------------------
-@router.get("/", response_model=List[DonationRead])
+@router.get("/", response_model=CursorPage[DonationRead])
 async def list_donations(
     q: Optional[str] = Query(None),
+    member_id: Optional[uuid.UUID] = Query(None),
     chapter_id: Optional[uuid.UUID] = Query(None),
     donation_type: Optional[DonationType] = Query(None),
+    cursor: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     dependencies=[Depends(get_current_user_api)],
     session: AsyncSession = Depends(get_session)
 ):
-    # --- Convert empty strings to None ---
-    chapter_id = chapter_id.strip() if chapter_id and chapter_id.strip() else None
-    status = status.strip() if status and status.strip() else None
+    filters = {}
+    if member_id:
+        filters["member_id"] = member_id
+    if chapter_id:
+        filters["chapter_id"] = chapter_id  # members of this chapter and its sub-chapters
+    if donation_type:
+        filters["donation_type"] = donation_type.value
 
-    # --- Parse UUID safely ---
     try:
-        chapter_id_uuid = UUID(chapter_id) if chapter_id else None
+        return await donation_crud.paginate_keyset(
+            session,
+            q=q,
+            filters=filters,
+            search_fields=["donation_type", "remarks"],
+            page=page,
+            page_size=page_size,
+            order_by="donation_date",
+            cursor=cursor,
+        )
     except ValueError:
-        chapter_id_uuid = None
-
-    # --- Parse Enum safely ---
-    status_enum = None
-    if status:
-        try:
-            status_enum = DonationStatus(status.lower())
-        except ValueError:
-            status_enum = None
-
-    filters = {}
-    if chapter_id_uuid:
-        filters["chapter_id"] = chapter_id_uuid
-    if status_enum:
-        filters["status"] = status_enum
-
-    stmt = donation_crud.select_stmt(
-        q=q,
-        filters=filters,
-        search_fields=["first_name", "last_name", "email", "phone", "member_code"],
-        page=page,
-        page_size=page_size,
-        order_by="created_at"
-    )
-
-    donations = (await session.execute(stmt)).scalars().all()
-    return donations
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 # ------------------------
 # Get single donation
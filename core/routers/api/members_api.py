@@ -2,66 +2,51 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 from core.schemas.member import MemberCreate, MemberUpdate, MemberRead
+from core.schemas.pagination import CursorPage
 from core.models.member import Members, MemberStatus
 from core.crud.member import member_crud
-from app.database import async_session
+from app.database import get_session
 from core.auth.deps import require_login, get_current_user_api
 import uuid
 
 router = APIRouter()
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # ------------------------
 # List Members (API)
 # ------------------------
-@router.get("/", response_model=List[MemberRead])
+@router.get("/", response_model=CursorPage[MemberRead])
 async def list_members(
     q: Optional[str] = Query(None),
     chapter_id: Optional[uuid.UUID] = Query(None),
     status: Optional[MemberStatus] = Query(None),
+    cursor: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     dependencies=[Depends(get_current_user_api)],
     session: AsyncSession = Depends(get_session)
 ):
-    # --- Convert empty strings to None ---
-    chapter_id = chapter_id.strip() if chapter_id and chapter_id.strip() else None
-    status = status.strip() if status and status.strip() else None
-
-    # --- Parse UUID safely ---
-    try:
-        chapter_id_uuid = UUID(chapter_id) if chapter_id else None
-    except ValueError:
-        chapter_id_uuid = None
-
-    # --- Parse Enum safely ---
-    status_enum = None
-    if status:
-        try:
-            status_enum = MemberStatus(status.lower())
-        except ValueError:
-            status_enum = None
-
     filters = {}
-    if chapter_id_uuid:
-        filters["chapter_id"] = chapter_id_uuid
-    if status_enum:
-        filters["status"] = status_enum
+    if chapter_id:
+        filters["chapter_id"] = chapter_id
+    if status:
+        filters["status"] = status
 
-    stmt = member_crud.select_stmt(
-        q=q,
-        filters=filters,
-        search_fields=["first_name", "last_name", "email", "phone", "member_code"],
-        page=page,
-        page_size=page_size,
-        order_by="created_at"
-    )
+    # Trigram match (served by ix_members_search_trgm) as a condition, so
+    # search results keep the same created_at keyset cursors as the plain list
+    conditions = [member_crud.search_condition(q)] if q and q.strip() else None
 
-    members = (await session.execute(stmt)).scalars().all()
-    return members
+    try:
+        return await member_crud.paginate_keyset(
+            session,
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            order_by="created_at",
+            cursor=cursor,
+            conditions=conditions,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 # ------------------------
 # Get single member
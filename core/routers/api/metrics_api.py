@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+from core.auth.deps import require_roles
+from core.crud.kpi import kpi_cache
+from core.auth.password_utils import password_hasher
+from core.auth.principal_cache import principal_cache
+from app.database import engine, engine_settings
+from app.db_settings import pool_stats
+from core.imports.report import import_stats
+
+router = APIRouter()
+
+# ------------------------
+# Cache metrics
+# ------------------------
+@router.get("/cache")
+async def cache_metrics(user=Depends(require_roles("admin"))):
+    return {"kpis": kpi_cache.stats(), "principals": principal_cache.stats()}
+
+# ------------------------
+# Password hashing pool
+# ------------------------
+@router.get("/password-hasher")
+async def password_hasher_metrics(user=Depends(require_roles("admin"))):
+    return password_hasher.metrics()
+
+# ------------------------
+# Database connection pool
+# ------------------------
+@router.get("/db-pool")
+async def db_pool_metrics(user=Depends(require_roles("admin"))):
+    return pool_stats(engine, engine_settings)
+
+# ------------------------
+# Bulk imports (members, bank statements)
+# ------------------------
+@router.get("/imports")
+async def import_metrics(user=Depends(require_roles("admin"))):
+    return import_stats()
@@ -7,19 +7,18 @@ from datetime import date, datetime
 from sqlalchemy.orm import selectinload
 from core.models.member import Members  # make sure you import Member
 from core.models.attendance import AttendanceStatus, Attendance
+from core.models.event_session import EventSession
 import uuid
-from core.auth.deps import require_login
+from core.auth.deps import require_login, require_roles
 from core.crud.attendance import attendance_crud
-from app.database import async_session
+from core.crud.member import member_crud
+from app.database import get_session
 from utils.templates import templates
+from utils.export import crud_rows, export_response
 
 router = APIRouter(include_in_schema=False)
 
 # Dependency to get async session
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 
 # ------------------------
 # List Attendance
@@ -37,30 +36,20 @@ async def attendance_list(request: Request, date: Optional[str] = Query(None), q
         except ValueError:
             filters["attendance_date"] = None
 
-    # Build select statement (sync)
-    stmt = attendance_crud.select_stmt(
+    # Page of attendance plus the filtered total in one query
+    result = await attendance_crud.select_page_with_total(
+        session,
         q=q,
         filters=filters,
-        search_fields=["attendance_date", "member_name"],  # adjust fields for search
+        search_fields=["status", "remarks"],
         page=page,
         page_size=page_size,
         order_by="attendance_date",
         descending=False,
-    ).options(selectinload(Attendance.member)) 
-
-    # Execute asynchronously
-    attendance_list = (await session.execute(stmt)).scalars().all()
-
-    # result = await session.execute(stmt)
-    # attendance_list = result.scalars().all()
-
-    # Count filtered total
-    total = await attendance_crud.count_filtered(
-        session,
-        q=q,
-        filters=filters,
-        search_fields=["status", "member_name"],
+        options=[selectinload(Attendance.member)],
+        estimate=True,
     )
+    attendance_list, total = result.items, result.total
 
     # Group by date and summarize
     grouped_attendance = {}
@@ -97,10 +86,26 @@ async def attendance_list(request: Request, date: Optional[str] = Query(None), q
             "page": page,
             "page_size": page_size,
             "total": total,
+            "total_exact": result.exact,
             "pages": (total // page_size) + (1 if total % page_size else 0),
         },
     )
 
+# ------------------------
+# Export (CSV / XLSX), same filters as the list
+# ------------------------
+@router.get("/export")
+async def attendance_export(date: Optional[str] = Query(None), q: Optional[str] = Query(None), format: str = Query("csv"), user=Depends(require_roles("staff"))):
+    filters = {}
+    if date:
+        try:
+            filters["attendance_date"] = datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError:
+            filters["attendance_date"] = None
+
+    rows = crud_rows(attendance_crud, q=q, filters=filters, search_fields=["status", "remarks"], order_by="attendance_date", descending=False)
+    return export_response(rows, attendance_crud.column_keys(), format, "attendance")
+
 # ------------------------
 # Add Attendance Form
 # ------------------------
@@ -113,9 +118,13 @@ async def attendance_create_page(request: Request, user=Depends(require_login),
     result = await session.execute(select(Members).order_by(Members.first_name))
     members = result.scalars().all()
 
+    # Fetch event sessions to record against
+    result = await session.execute(select(EventSession).order_by(EventSession.title))
+    sessions = result.scalars().all()
+
     return templates.TemplateResponse(
         "/admin/attendance/create.html",
-        {"request": request, "error": None, "members":members, "user": user, "attendance": None},
+        {"request": request, "error": None, "members":members, "sessions": sessions, "user": user, "attendance": None},
     )
 
 # ------------------------
@@ -125,6 +134,7 @@ async def attendance_create_page(request: Request, user=Depends(require_login),
 async def create_attendance(
     request: Request,
     member_ids: list[str] = Form(...),
+    session_id: uuid.UUID = Form(...),
     attendance_date: date = Form(...),
     user=Depends(require_login),
     status: str = Form(...),
@@ -138,17 +148,15 @@ async def create_attendance(
         )
     
     try:
-        created_records = []
-
-        for member_id in member_ids:
-            obj_in = {
-                "member_id": member_id,
-                "attendance_date": attendance_date,
-                "status": status,
-                "remarks": remarks
-            }
-            record = await attendance_crud.create(session, obj_in)
-            created_records.append(record)
+        # One upsert for the whole roster; re-submitting updates in place
+        await attendance_crud.mark_roster(
+            session,
+            session_id=session_id,
+            member_ids=[uuid.UUID(member_id) for member_id in member_ids],
+            attendance_date=attendance_date,
+            status=status,
+            remarks=remarks,
+        )
 
         return RedirectResponse(url="/attendance", status_code=303)
 
@@ -160,6 +168,7 @@ async def create_attendance(
                 "error": str(e),
                 "form_data": {
                     "member_ids": member_ids,
+                    "session_id": session_id,
                     "attendance_date": attendance_date,
                     "status": status,
                     "remarks": remarks
@@ -205,18 +214,6 @@ async def attendance_update(attendance_id: uuid.UUID, status: str = Form(...), a
 # ------------------------
 @router.get("/members/search")
 async def search_members(q: str = Query(..., min_length=1), limit: int = Query(20, le=100), session: AsyncSession = Depends(get_session)):
-    stmt = (
-        select(Member)
-        .where(
-            or_(
-                Member.first_name.ilike(f"%{q}%"),
-                Member.last_name.ilike(f"%{q}%"),
-                Member.member_code.ilike(f"%{q}%")
-            )
-        )
-        .limit(limit)
-    )
-    result = await session.execute(stmt)
-    members = result.scalars().all()
+    members = await member_crud.search(session, q, limit=limit)
 
     return [{"id": m.id, "name": f"{m.first_name} {m.last_name}"} for m in members]
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select, func, desc
-from datetime import date, datetime
-from app.database import async_session
+from datetime import date, datetime, timedelta
+from app.database import get_session
 from utils.templates import templates
 from core.models.member import Members
 from core.models.donation import Donation
@@ -10,14 +10,19 @@ from core.models.attendance import Attendance
 from core.models.user import User
 from core.auth.deps import get_current_user, require_roles
 from core.crud.user import UserCRUD
+from core.crud.kpi import get_cached_dashboard_kpis, get_activity_summary, get_chapter_rollups
+from core.crud.donation import donation_crud
+from core.crud.attendance import attendance_crud
 from uuid import UUID
 from sqlalchemy.orm import selectinload
 
 router = APIRouter(include_in_schema=False)
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
+# Dashboards only ever look at a bounded window of history
+DASHBOARD_PERIODS = (7, 30, 90, 365)
+DEFAULT_PERIOD_DAYS = 30
+DETAIL_PAGE_SIZE = 10
+REGION_PERIOD_MONTHS = 1  # region rollups are monthly; 1 = the current month
 
 #-----------------------------
 # ADMIN DASHBOARD SECTION
@@ -33,32 +38,19 @@ async def admin_dashboard(request: Request, user: User = Depends(require_roles("
     #-----------------
     # Everything else
     #-----------------
-    # Donations KPIs
-    donations = (await db.execute(select(Donation).order_by(desc(Donation.donation_date)))).scalars().all()
-    total_donations = (await db.execute(select(func.sum(Donation.amount)))).scalar() or 0
-    total_tithe = (await db.execute(select(func.sum(Donation.amount)).where(Donation.donation_type == "tithe"))).scalar() or 0
-    total_sunday = (await db.execute(select(func.sum(Donation.amount)).where(Donation.donation_type == "sunday donation"))).scalar() or 0
-    total_pledge = (await db.execute(select(func.sum(Donation.amount)).where(Donation.donation_type == "pledge"))).scalar() or 0
+    # All KPIs in a single aggregate query, served from the KPI cache
+    kpis = await get_cached_dashboard_kpis(db)
+
+    # Per-region totals over each region's whole chapter subtree (cached with the KPIs)
+    region_rollups = await get_chapter_rollups(db, "region", REGION_PERIOD_MONTHS)
+
+    # Donations
     recent_donations = (await db.execute(select(Donation).options(selectinload(Donation.member)).order_by(desc(Donation.donation_date)).limit(7))).scalars().all()
 
-    # Members KPIs
-    total_members = (await db.execute(select(func.count()).select_from(Members))).scalar()
-    active_members = (await db.execute(select(func.count()).select_from(Members).where(Members.status == 'active'))).scalar()
-    guest_members = (await db.execute(select(func.count()).select_from(Members).where(Members.status == 'guest'))).scalar()
+    # Members
     recent_members = (await db.execute(select(Members).order_by(desc(Members.created_at)).limit(5))).scalars().all()
 
-    # Attendance KPIs
-    attendance = (await db.execute(select(Attendance).order_by(desc(Attendance.attendance_date)))).scalars().all()
-    today = date.today()
-    attendance_today = (await db.execute(select(func.count()).where(Attendance.attendance_date == today))).scalar() or 0
-    present_today = (await db.execute(select(func.count()).where(Attendance.attendance_date == today, Attendance.status == 'present')
-    )).scalar() or 0
-    absent_today = (await db.execute(select(func.count()).where(Attendance.attendance_date == today, Attendance.status == 'absent')
-    )).scalar() or 0
-
-    total_attendance = (await db.execute(select(func.count()).select_from(Attendance))).scalar() or 0
-    total_present = (await db.execute(select(func.count()).where(Attendance.status == "present"))).scalar() or 0
-    total_absent = (await db.execute(select(func.count()).where(Attendance.status == "absent"))).scalar() or 0
+    # Attendance (ids are UUIDv7, so newest-first walks the primary key index)
     recent_attendance = (await db.execute(select(Attendance).options(selectinload(Attendance.member)).order_by(desc(Attendance.id)).limit(10))).scalars().all()
 
     return templates.TemplateResponse("/admin/dashboard.html",
@@ -66,21 +58,13 @@ async def admin_dashboard(request: Request, user: User = Depends(require_roles("
             "request": request,
             "user": user,
             "personal_info": personal_info,
-            "donations": donations,
-            "total_attendance": total_attendance,
-            "total_present": total_present,
-            "total_absent": total_absent,
             "recent_attendance": recent_attendance,
-            "total_members": total_members,
-            "active_members": active_members,
-            "guest_members": guest_members,
-            "present_today": present_today,
-            "absent_today": absent_today,
-            "total_donations": total_donations,
             "recent_members": recent_members,
             "recent_donations": recent_donations,
-            "total_tithe": total_tithe,
-            "total_sunday": total_sunday,
+            "kpis": kpis,
+            "region_rollups": region_rollups,
+            "region_period_months": REGION_PERIOD_MONTHS,
+            **kpis.model_dump(),
         },
     )
 
@@ -137,6 +121,9 @@ async def staff_dashboard(
 @router.get("/staff/dashboard")
 async def staff_dashboard(
     request: Request,
+    period: int = Query(DEFAULT_PERIOD_DAYS),
+    donations_page: int = Query(1, ge=1),
+    attendance_page: int = Query(1, ge=1),
     user: User = Depends(require_roles("staff")),
     db: AsyncSession = Depends(get_session),
 ):
@@ -146,21 +133,32 @@ async def staff_dashboard(
     result = await db.execute(member_query)
     member = result.scalar_one_or_none()
 
+    # Only the selected period is aggregated and paged; full history lives
+    # behind the paginated /donation and /attendance lists.
+    period = period if period in DASHBOARD_PERIODS else DEFAULT_PERIOD_DAYS
+    since = date.today() - timedelta(days=period)
+    summary = await get_activity_summary(db, since=since)
+
     # 2️⃣ Get department-specific info
     # Assume Staff model has department_id
-    result = await db.execute(
-        select(Donation)
-        # .where(Donation.department_id == user.department_id)  # filter by department
-        .order_by(desc(Donation.donation_date))
+    donations = await donation_crud.select_page_with_total(
+        db,
+        page=donations_page,
+        page_size=DETAIL_PAGE_SIZE,
+        order_by="donation_date",
+        options=[selectinload(Donation.member)],
+        conditions=[Donation.donation_date >= since],
+        # Donation.department_id == user.department_id  # filter by department
     )
-    donations = result.scalars().all()
-
-    result = await db.execute(
-        select(Attendance)
-        # .where(Attendance.department_id == user.department_id)  # filter by department
-        .order_by(desc(Attendance.attendance_date))
+    attendance = await attendance_crud.select_page_with_total(
+        db,
+        page=attendance_page,
+        page_size=DETAIL_PAGE_SIZE,
+        order_by="attendance_date",
+        options=[selectinload(Attendance.member)],
+        conditions=[Attendance.attendance_date >= since],
+        # Attendance.department_id == user.department_id  # filter by department
     )
-    attendance = result.scalars().all()
 
     roles = []
     # if your User model has is_admin, is_staff, etc.
@@ -176,8 +174,15 @@ async def staff_dashboard(
         {
             "request": request,
             "user": user,
-            "donations": donations,
-            "attendance": attendance,
+            "summary": summary,
+            "period": period,
+            "periods": DASHBOARD_PERIODS,
+            "donations": donations.items,
+            "donations_page": donations_page,
+            "donations_pages": -(-donations.total // DETAIL_PAGE_SIZE),
+            "attendance": attendance.items,
+            "attendance_page": attendance_page,
+            "attendance_pages": -(-attendance.total // DETAIL_PAGE_SIZE),
             "roles": roles,
             "member": member,
         },
@@ -187,7 +192,7 @@ async def staff_dashboard(
 # MEMBER DASHBOARD SECTION
 #-----------------------------
 @router.get("/member/dashboard")
-async def member_dashboard(request: Request, user: User = Depends(require_roles("member", "staff", "admin")), db: AsyncSession = Depends(get_session),):
+async def member_dashboard(request: Request, page: int = Query(1, ge=1), user: User = Depends(require_roles("member", "staff", "admin")), db: AsyncSession = Depends(get_session),):
     user_id = UUID(str(user.id))  # convert to UUID
 
     # Check if member exists
@@ -195,8 +200,12 @@ async def member_dashboard(request: Request, user: User = Depends(require_roles(
     result = await db.execute(member_query)
     member = result.scalar_one_or_none()
 
-    donations = (await db.execute(select(Donation).where(Donation.member_id == member.id).order_by(desc(Donation.donation_date)))).scalars().all()
-    attendance = (await db.execute(select(Attendance).where(Attendance.member_id == member.id).order_by(desc(Attendance.attendance_date)))).scalars().all()
+    summary, donations, attendance = None, [], []
+    if member:
+        # Totals are aggregated server-side; only one page of rows is loaded
+        summary = await get_activity_summary(db, member_id=member.id)
+        donations = (await db.execute(donation_crud.select_stmt(filters={"member_id": member.id}, page=page, page_size=DETAIL_PAGE_SIZE, order_by="donation_date"))).scalars().all()
+        attendance = (await db.execute(attendance_crud.select_stmt(filters={"member_id": member.id}, page=page, page_size=DETAIL_PAGE_SIZE, order_by="attendance_date"))).scalars().all()
     
     return templates.TemplateResponse(
         "/admin/members/dashboard.html",
@@ -204,6 +213,9 @@ async def member_dashboard(request: Request, user: User = Depends(require_roles(
             "request": request,
             "user": user,
             "member": member,
+            "summary": summary,
+            "page": page,
+            "page_size": DETAIL_PAGE_SIZE,
             "donations": donations,
             "attendance": attendance,
         },
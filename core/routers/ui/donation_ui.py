@@ -4,17 +4,12 @@
 from fastapi import APIRouter, Depends
 from core.crud.donation import create_donation, get_donations_by_member
 from core.schemas.donation import DonationCreate, DonationRead
-from app.database import async_session
+from app.database import get_session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from core.models.donation import Donation
 
 router = APIRouter(prefix="/donations", tags=["Donations"])
 
-# Dependency
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 @router.post("/", response_model=DonationRead)
 async def add_donation(donation: DonationCreate, db: AsyncSession = Depends(get_session)):
     don_obj = Donation(**donation.dict())
@@ -25,14 +20,20 @@ async def list_donations(member_id: str, db: AsyncSession = Depends(get_session)
     return await get_donations_by_member(db, member_id)
 """
 
-from fastapi import APIRouter, Request, Form, Depends, Query
+from fastapi import APIRouter, Request, Form, Depends, Query, UploadFile, File
 from fastapi.responses import RedirectResponse, HTMLResponse
 from core.models.donation import DonationType, Donation
-from core.auth.deps import require_login
-from app.database import async_session
+from core.auth.deps import require_login, require_roles
+from app.database import get_session
+from utils.export import crud_rows, export_response
+from core.imports.readers import read_rows, UnsupportedFile
+from core.imports.normalize import normalize_code
+from core.imports.donations import import_statement, resolve_unmatched, unmatched_donation_crud, STATEMENT_HEADER_ALIASES
+from core.models.donation_import import UnmatchedDonation
 from sqlmodel.ext.asyncio.session import AsyncSession
 from utils.templates import templates
 from core.crud.donation import donation_crud
+from core.crud.member import member_crud
 from typing import Optional
 from sqlmodel import select
 from uuid import UUID
@@ -43,10 +44,6 @@ from sqlalchemy.orm import selectinload
 
 router = APIRouter(include_in_schema=False)
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # ------------------------
 # List Donations
 # ------------------------
@@ -55,21 +52,18 @@ async def donations_list(request: Request, q: Optional[str] = Query(None), page:
     if isinstance(user, RedirectResponse):
         return user
 
-    # Load donations with their members
-    stmt = donation_crud.select_stmt(
+    # Load donations with their members and the filtered total in one query
+    result = await donation_crud.select_page_with_total(
+        session,
         q=q,
         search_fields=["donation_type", "remarks"],
         page=page,
         page_size=page_size,
-        order_by="date"
-    ).options(selectinload(Donation.member))  # <-- eager load member
-
-    donations = (await session.execute(stmt)).scalars().all()
-    total = await donation_crud.count_filtered(
-        session,
-        q=q,
-        search_fields=["donation_type", "remarks"]
+        order_by="donation_date",
+        options=[selectinload(Donation.member)],  # <-- eager load member
+        estimate=True,
     )
+    donations, total = result.items, result.total
 
     return templates.TemplateResponse(
         "/admin/donation/list.html",
@@ -81,10 +75,73 @@ async def donations_list(request: Request, q: Optional[str] = Query(None), page:
             "page": page,
             "page_size": page_size,
             "total": total,
+            "total_exact": result.exact,
             "pages": (total // page_size) + (1 if total % page_size else 0),
         },
     )
 
+# ------------------------
+# Export (CSV / XLSX), same search as the list
+# ------------------------
+@router.get("/export")
+async def donations_export(q: Optional[str] = Query(None), format: str = Query("csv"), user=Depends(require_roles("staff"))):
+    rows = crud_rows(donation_crud, q=q, search_fields=["donation_type", "remarks"], order_by="donation_date")
+    return export_response(rows, donation_crud.column_keys(), format, "donations")
+
+# ------------------------
+# Bank / mobile-money statement import
+# ------------------------
+@router.get("/import")
+async def donations_import_page(request: Request, user=Depends(require_roles("staff"))):
+    return templates.TemplateResponse("/admin/donation/import.html", {"request": request, "user": user, "report": None, "error": None, "donation_types": list(DonationType)})
+
+@router.post("/import", response_class=HTMLResponse)
+async def donations_import(request: Request, file: UploadFile = File(...), donation_type: DonationType = Form(DonationType.tithe), user=Depends(require_roles("staff")), session: AsyncSession = Depends(get_session)):
+    context = {"request": request, "user": user, "report": None, "error": None, "donation_types": list(DonationType)}
+    try:
+        rows = read_rows(file.filename, file.file, aliases=STATEMENT_HEADER_ALIASES)
+        context["report"] = await import_statement(session, rows, default_type=donation_type)
+    except (UnsupportedFile, ValueError) as e:
+        context["error"] = str(e)
+        return templates.TemplateResponse("/admin/donation/import.html", context, status_code=400)
+    return templates.TemplateResponse("/admin/donation/import.html", context)
+
+# ------------------------
+# Unmatched statement lines (review queue)
+# ------------------------
+@router.get("/unmatched")
+async def donations_unmatched(request: Request, page: int = Query(1, ge=1), page_size: int = Query(25, ge=1, le=100), user=Depends(require_roles("staff")), session: AsyncSession = Depends(get_session)):
+    result = await unmatched_donation_crud.select_page_with_total(
+        session,
+        page=page,
+        page_size=page_size,
+        order_by="id",
+        descending=False,
+        conditions=[UnmatchedDonation.resolved_at.is_(None)],
+    )
+    return templates.TemplateResponse(
+        "/admin/donation/unmatched.html",
+        {
+            "request": request,
+            "user": user,
+            "lines": result.items,
+            "page": page,
+            "page_size": page_size,
+            "total": result.total,
+            "pages": (result.total // page_size) + (1 if result.total % page_size else 0),
+            "error": request.query_params.get("error"),
+        },
+    )
+
+@router.post("/unmatched/{line_id}/assign")
+async def donations_unmatched_assign(line_id: UUID, member_code: str = Form(...), user=Depends(require_roles("staff")), session: AsyncSession = Depends(get_session)):
+    member = (await session.execute(select(Members.id).where(Members.member_code == normalize_code(member_code)))).scalar_one_or_none()
+    if not member:
+        return RedirectResponse(url="/donation/unmatched?error=Unknown+member+code", status_code=303)
+    if not await resolve_unmatched(session, line_id, member):
+        return RedirectResponse(url="/donation/unmatched?error=Line+already+resolved", status_code=303)
+    return RedirectResponse(url="/donation/unmatched", status_code=303)
+
 # ------------------------
 # Display Donation Form
 # ------------------------
@@ -174,12 +231,6 @@ async def search_members(q: str, session: AsyncSession = Depends(get_session), u
     if isinstance(user, RedirectResponse):
         return user
     
-    stmt = select(Members).where(
-        (Members.first_name.ilike(f"%{q}%")) |
-        (Members.last_name.ilike(f"%{q}%")) |
-        (Members.member_code.ilike(f"%{q}%"))
-    )
-    result = await session.execute(stmt)
-    members = result.scalars().all()
+    members = await member_crud.search(session, q, limit=20)
 
     return [{"id": str(m.id), "user": user, "name": f"{m.first_name} {m.last_name}"} for m in members]
\ No newline at end of file
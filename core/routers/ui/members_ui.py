@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Request, Form, Depends, Query
+from fastapi import APIRouter, Request, Form, Depends, Query, UploadFile, File
 from fastapi.responses import RedirectResponse, HTMLResponse
 from core.models.member import MemberStatus, Members, Gender
 from core.schemas.user import UserRead
 from core.schemas.member import MemberCreate, MemberUpdate
-from core.auth.deps import require_login, get_current_user
-from app.database import async_session
+from core.auth.deps import require_login, get_current_user, require_roles
+from app.database import get_session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from utils.templates import templates
-from core.crud.member import member_crud
+from utils.export import crud_rows, export_response
+from core.imports.readers import read_rows, UnsupportedFile
+from core.imports.members import import_members, MEMBER_HEADER_ALIASES
+from core.crud.member import member_crud, member_code_allocator
+from core.crud.chapter import chapter_crud
 from typing import Optional
 from uuid import UUID
 from datetime import date
@@ -19,19 +23,11 @@ from sqlalchemy import or_, func
 
 router = APIRouter(include_in_schema=False)
 
-async def get_session() -> AsyncSession:
-    async with async_session() as session:
-        yield session
-
 # ------------------------
 # Read Members
 # ------------------------
 
-@router.get("/")
-async def members_list(request: Request, q: Optional[str] = Query(None), chapter_id: Optional[str] = Query(None), status: Optional[str] = Query(None), page: int = Query(1, ge=1), page_size: int = Query(10, ge=1, le=100), user=Depends(require_login), session: AsyncSession = Depends(get_session),):
-    if isinstance(user, RedirectResponse):
-        return user
-
+def _member_filters(chapter_id: Optional[str], status: Optional[str]) -> dict:
     # --- Convert empty strings to None ---
     chapter_id = chapter_id.strip() if chapter_id and chapter_id.strip() else None
     status = status.strip() if status and status.strip() else None
@@ -55,24 +51,28 @@ async def members_list(request: Request, q: Optional[str] = Query(None), chapter
         filters["chapter_id"] = chapter_id_uuid
     if status_enum:
         filters["status"] = status_enum
+    return filters
 
-    members = (await session.execute(
-        member_crud.select_stmt(
-            q=q,
+@router.get("/")
+async def members_list(request: Request, q: Optional[str] = Query(None), chapter_id: Optional[str] = Query(None), status: Optional[str] = Query(None), page: int = Query(1, ge=1), page_size: int = Query(10, ge=1, le=100), user=Depends(require_login), session: AsyncSession = Depends(get_session),):
+    if isinstance(user, RedirectResponse):
+        return user
+
+    filters = _member_filters(chapter_id, status)
+
+    if q and q.strip():
+        # Ranked trigram search, capped at MEMBER_SEARCH_LIMIT matches
+        result = await member_crud.search_page(session, q, filters=filters, page=page, page_size=page_size)
+    else:
+        result = await member_crud.select_page_with_total(
+            session,
             filters=filters,
-            search_fields=["first_name", "last_name", "email", "phone", "member_code"],
             page=page,
             page_size=page_size,
-            order_by="created_at"
+            order_by="created_at",
+            estimate=True,
         )
-    )).scalars().all()
-
-    total = await member_crud.count_filtered(
-        session,
-        q=q,
-        filters=filters,
-        search_fields=["first_name", "last_name", "email", "phone", "member_code"]
-    )
+    members, total = result.items, result.total
 
     return templates.TemplateResponse(
         "/admin/members/list.html",
@@ -81,16 +81,46 @@ async def members_list(request: Request, q: Optional[str] = Query(None), chapter
             "user": user, 
             "members": members,
             "q": q or "",
-            "selected_chapter": str(chapter_id_uuid) if chapter_id_uuid else "",
-            "selected_status": status_enum.value if status_enum else "",
-            "chapters": [],  # optional: add chapter list
+            "selected_chapter": str(filters["chapter_id"]) if "chapter_id" in filters else "",
+            "selected_status": filters["status"].value if "status" in filters else "",
+            "chapters": await chapter_crud.list_by_type(session),  # filtering by a chapter includes its sub-chapters
             "page": page,
             "page_size": page_size,
             "total": total,
+            "total_exact": result.exact,
             "pages": (total // page_size) + (1 if total % page_size else 0),
         },
     )
 
+# ------------------------
+# Export (CSV / XLSX), same filters as the list
+# ------------------------
+@router.get("/export")
+async def members_export(q: Optional[str] = Query(None), chapter_id: Optional[str] = Query(None), status: Optional[str] = Query(None), format: str = Query("csv"), user=Depends(require_roles("staff"))):
+    # Unlike the list, search here is not capped at MEMBER_SEARCH_LIMIT
+    conditions = [member_crud.search_condition(q)] if q and q.strip() else None
+    rows = crud_rows(member_crud, filters=_member_filters(chapter_id, status), conditions=conditions, order_by="created_at")
+    return export_response(rows, member_crud.column_keys(), format, "members")
+
+# ------------------------
+# Bulk import (CSV / XLSX)
+# ------------------------
+@router.get("/import")
+async def members_import_page(request: Request, user=Depends(require_roles("staff"))):
+    return templates.TemplateResponse("/admin/members/import.html", {"request": request, "user": user, "report": None, "error": None})
+
+@router.post("/import", response_class=HTMLResponse)
+async def members_import(request: Request, file: UploadFile = File(...), chapter_id: Optional[str] = Form(None), user=Depends(require_roles("staff")), session: AsyncSession = Depends(get_session)):
+    context = {"request": request, "user": user, "report": None, "error": None}
+    try:
+        chapter_uuid = UUID(chapter_id) if chapter_id and chapter_id.strip() else None
+        rows = read_rows(file.filename, file.file, aliases=MEMBER_HEADER_ALIASES)
+        context["report"] = await import_members(session, rows, chapter_id=chapter_uuid)
+    except (UnsupportedFile, ValueError) as e:
+        context["error"] = str(e)
+        return templates.TemplateResponse("/admin/members/import.html", context, status_code=400)
+    return templates.TemplateResponse("/admin/members/import.html", context)
+
 # ------------------------
 # Create Member
 # ------------------------
@@ -134,20 +164,6 @@ async def generate_member_code(db: AsyncSession) -> str:
     return f"MEM{next_num:04d}"
 """
 
-async def generate_member_code(db: AsyncSession) -> str:
-    """
-    Generates the next member code in the format MEM0001, MEM0002, etc.
-    Uses database to get the current max to avoid fetching all codes.
-    """
-    # Get the maximum numeric part of existing member codes
-    result = await db.execute(
-        select(func.max(func.cast(func.substring(Members.member_code, 4), Integer)))
-    )
-    max_num = result.scalar()  # None if no members exist yet
-
-    next_num = (max_num or 0) + 1
-    return f"MEM{next_num:04d}"
-
 #----------------------------
 # Profile Editing
 #----------------------------
@@ -190,33 +206,22 @@ async def edit_profile_post(
     member = result.scalar_one_or_none()
 
     try:
-                # Create member with generated member_code
-        for _ in range(5):  # retry up to 5 times in case of collision
-            try:
-                member = Members(
-                    id=uuid.uuid4(),
-                    user_id=user_id,
-                    member_code=await generate_member_code(db),
-                    first_name=first_name,
-                    last_name=last_name,
-                    other_names=other_names,
-                    phone=phone,
-                    gender=gender,
-                    email=email,
-                    status=MemberStatus.active.value,
-                    join_date=date.today(),
-                )
-                db.add(member)
-                await db.commit()
-                await db.refresh(member)
-                break
-            except IntegrityError as e:
-                await db.rollback()
-                # If it's a duplicate member_code, retry
-                if "members_member_code_key" in str(e.orig):
-                    continue
-                # Otherwise, raise
-                raise e
+        # Create member with a sequence-allocated member_code (no retries needed)
+        member = Members(
+            user_id=user_id,
+            member_code=await member_code_allocator.allocate(db),
+            first_name=first_name,
+            last_name=last_name,
+            other_names=other_names,
+            phone=phone,
+            gender=gender,
+            email=email,
+            status=MemberStatus.active.value,
+            join_date=date.today(),
+        )
+        db.add(member)
+        await db.commit()
+        await db.refresh(member)
 
     except IntegrityError as e:
         await db.rollback()
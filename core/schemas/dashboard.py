@@ -0,0 +1,88 @@
+# core/schemas/dashboard.py
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Dict, List, Optional
+from uuid import UUID
+
+
+class DashboardKPIs(BaseModel):
+    # Donations
+    total_donations: float = 0
+    total_tithe: float = 0
+    total_sunday: float = 0
+    total_pledge: float = 0
+    total_other: float = 0
+    donation_count: int = 0
+
+    # Members
+    total_members: int = 0
+    active_members: int = 0
+    inactive_members: int = 0
+    alumni_members: int = 0
+    guest_members: int = 0
+
+    # Attendance
+    total_attendance: int = 0
+    total_present: int = 0
+    total_absent: int = 0
+    attendance_today: int = 0
+    present_today: int = 0
+    absent_today: int = 0
+
+
+class ActivitySummary(BaseModel):
+    """Donation and attendance totals over a bounded window (and optionally one member)."""
+    since: Optional[date] = None
+
+    total_donations: float = 0
+    total_tithe: float = 0
+    total_sunday: float = 0
+    total_pledge: float = 0
+    total_other: float = 0
+    donation_count: int = 0
+
+    total_attendance: int = 0
+    total_present: int = 0
+    total_absent: int = 0
+    total_excused: int = 0
+    total_online: int = 0
+
+
+class ChapterRollup(BaseModel):
+    """Totals for one chapter and every chapter beneath it."""
+    chapter_id: UUID
+    name: str
+    type: Optional[str] = None
+
+    total_members: int = 0
+    active_members: int = 0
+
+    total_donations: float = 0
+    donation_count: int = 0
+
+    total_attendance: int = 0
+    total_present: int = 0
+
+
+class ChapterMetrics(BaseModel):
+    """A chapter's figures including every chapter beneath it, over the requested months."""
+    total_members: int = 0
+    members_by_status: Dict[str, int] = Field(default_factory=dict)
+
+    total_donations: float = 0
+    donation_count: int = 0
+    donations_by_type: Dict[str, float] = Field(default_factory=dict)
+    donations_by_month: Dict[str, float] = Field(default_factory=dict)  # "YYYY-MM"
+
+    total_attendance: int = 0
+    total_present: int = 0
+    attendance_rate: Optional[float] = None  # present / all records, None without records
+
+
+class ChapterTreeNode(BaseModel):
+    id: UUID
+    name: str
+    type: Optional[str] = None
+    parent_id: Optional[UUID] = None
+    metrics: ChapterMetrics = Field(default_factory=ChapterMetrics)
+    children: List["ChapterTreeNode"] = Field(default_factory=list)
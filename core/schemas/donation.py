@@ -28,6 +28,7 @@ class DonationRead(BaseModel):
     donation_date: date
     donation_type: Optional[DonationType] = DonationType.sunday_donation
     remarks: Optional[str] = None
+    reference: Optional[str] = None
 
     class Config:
         # orm_mode = True
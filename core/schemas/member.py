@@ -37,7 +37,7 @@ class MemberUpdate(BaseModel):
 
 class MemberRead(BaseModel):
     id: uuid.UUID
-    user_id: uuid.UUID
+    user_id: Optional[uuid.UUID] = None
     member_code: str
     first_name: str
     last_name: str
@@ -0,0 +1,10 @@
+# core/schemas/pagination.py
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
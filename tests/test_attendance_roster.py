@@ -0,0 +1,59 @@
+# tests/test_attendance_roster.py
+"""
+Re-marking a roster must update the existing rows in place. Needs a
+disposable Postgres database in TEST_DATABASE_URL (postgresql+asyncpg://...);
+its tables are created and dropped by the test.
+"""
+import asyncio
+import os
+from datetime import date
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+
+async def _mark_same_roster_twice():
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel, select
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from core.models import user, chapter, event, event_session, member, donation, attendance, rollup, donation_import  # noqa: F401 (register tables)
+    from core.models.event import Event
+    from core.models.event_session import EventSession
+    from core.models.member import Members
+    from core.models.attendance import Attendance
+    from core.crud.attendance import attendance_crud
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            event_row = Event(title="Sunday service")
+            service = EventSession(event_id=event_row.id, title="Morning")
+            members = [Members(member_code=f"MEM{n:04d}", first_name="Test", last_name=str(n)) for n in (1, 2)]
+            session.add_all([event_row, service, *members])
+            await session.commit()
+
+            roster = dict(session_id=service.id, member_ids=[m.id for m in members], attendance_date=date(2026, 1, 4))
+            first = await attendance_crud.mark_roster(session, status="present", return_ids=True, **roster)
+            second = await attendance_crud.mark_roster(session, status="absent", remarks="late list", return_ids=True, **roster)
+
+            assert len(first) == 2
+            assert set(second) == set(first)
+
+            rows = (await session.execute(select(Attendance.id, Attendance.status, Attendance.remarks))).all()
+            assert {r.id for r in rows} == set(first)
+            assert {(r.status, r.remarks) for r in rows} == {("absent", "late list")}
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await engine.dispose()
+
+
+def test_mark_roster_twice_updates_in_place():
+    asyncio.run(_mark_same_roster_twice())
@@ -0,0 +1,47 @@
+# tests/test_cursor.py
+"""Keyset cursor tokens: round-trip of every key type and rejection of bad tokens."""
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("sqlmodel")
+
+from core.crud.base import decode_cursor, encode_cursor  # noqa: E402
+
+
+@pytest.mark.parametrize("sort_value", [
+    datetime(2026, 5, 17, 9, 30, 15, 123456),
+    date(2026, 5, 17),
+    uuid.UUID("0192f1e0-7c3a-7000-8000-000000000001"),
+    Decimal("150000.50"),
+    "Okello",
+    42,
+    None,
+])
+@pytest.mark.parametrize("direction", ["next", "prev"])
+def test_cursor_round_trip(sort_value, direction):
+    row_id = uuid.uuid4()
+    token = encode_cursor(sort_value, row_id, direction)
+    assert "=" not in token  # url-safe, padding stripped
+    assert decode_cursor(token) == (sort_value, row_id, direction)
+
+
+def _token(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("token", [
+    "",
+    "not-a-cursor",
+    _token({"k": ["d", "2026-05-17"]}),  # no id
+    _token({"k": ["d", "not a date"], "id": ["v", 1]}),
+    _token({"k": ["v", 1], "id": ["v", 1], "d": "sideways"}),
+    _token(["v", 1]),
+])
+def test_malformed_cursor_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
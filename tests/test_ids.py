@@ -0,0 +1,41 @@
+# tests/test_ids.py
+"""UUIDv7 generation: layout, ordering and timestamp round-trip."""
+import time
+from datetime import datetime, timedelta, timezone
+
+from utils.ids import uuid7, uuid7_lower_bound, uuid7_timestamp
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_monotonic_within_a_millisecond():
+    ids = [uuid7() for _ in range(5000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_uuid7_orders_by_creation_time():
+    first = uuid7()
+    time.sleep(0.002)
+    assert uuid7() > first
+
+
+def test_uuid7_timestamp_round_trip():
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    stamp = uuid7_timestamp(uuid7())
+    after = datetime.now(timezone.utc) + timedelta(milliseconds=1)
+    assert before <= stamp <= after
+
+
+def test_uuid7_lower_bound():
+    moment = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+    bound = uuid7_lower_bound(moment)
+    assert uuid7_timestamp(bound) == moment
+    assert uuid7_lower_bound(moment + timedelta(milliseconds=1)) > bound
+    # Naive datetimes are taken as UTC
+    assert uuid7_lower_bound(moment.replace(tzinfo=None)) == bound
+    assert uuid7() > uuid7_lower_bound(datetime.now(timezone.utc) - timedelta(seconds=1))
@@ -0,0 +1,30 @@
+# tests/test_normalize.py
+"""Phone normalization for imported member and statement rows."""
+import pytest
+
+from core.imports.normalize import normalize_phone
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("0772123456", "+256772123456"),
+    ("0772 123 456", "+256772123456"),
+    ("+256772123456", "+256772123456"),
+    ("+256 772-123-456", "+256772123456"),
+    ("00256772123456", "+256772123456"),
+    ("256772123456", "+256772123456"),
+    ("772123456", "+256772123456"),
+    # XLSX hands numeric cells over as floats, with the leading zero already gone
+    (772123456.0, "+256772123456"),
+    (256772123456.0, "+256772123456"),
+])
+def test_normalize_phone(value, expected):
+    assert normalize_phone(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "   ", "12345", "n/a"])
+def test_normalize_phone_rejects_blanks_and_short_numbers(value):
+    assert normalize_phone(value) is None
+
+
+def test_normalize_phone_other_country_code():
+    assert normalize_phone("0712345678", country_code="254") == "+254712345678"
@@ -0,0 +1,46 @@
+# tests/test_roles.py
+"""Role requirements compile to the mask of every role that satisfies them."""
+import pytest
+
+pytest.importorskip("sqlmodel")
+
+from core.auth.roles import ROLE_BITS, compile_requirement, role_mask  # noqa: E402
+
+MEMBER, STAFF, ADMIN = ROLE_BITS["member"], ROLE_BITS["staff"], ROLE_BITS["admin"]
+
+
+def test_role_mask():
+    assert role_mask([]) == 0
+    assert role_mask(None) == 0
+    assert role_mask(["member"]) == MEMBER
+    assert role_mask(["Staff", "ADMIN"]) == STAFF | ADMIN
+    assert role_mask(["member", "unknown"]) == MEMBER
+
+
+@pytest.mark.parametrize("allowed, expected", [
+    (("member",), MEMBER | STAFF | ADMIN),
+    (("staff",), STAFF | ADMIN),
+    (("admin",), ADMIN),
+    (("Staff",), STAFF | ADMIN),
+    (("member", "admin"), MEMBER | STAFF | ADMIN),
+    ((), 0),
+])
+def test_compile_requirement(allowed, expected):
+    assert compile_requirement(*allowed) == expected
+
+
+@pytest.mark.parametrize("user_roles, allowed, passes", [
+    (["member"], ("staff",), False),
+    (["staff"], ("staff",), True),
+    (["admin"], ("staff",), True),
+    (["staff"], ("admin",), False),
+    (["member"], ("member",), True),
+    ([], ("member",), False),
+])
+def test_requirement_check(user_roles, allowed, passes):
+    assert bool(role_mask(user_roles) & compile_requirement(*allowed)) is passes
+
+
+def test_unknown_role_is_rejected():
+    with pytest.raises(ValueError):
+        compile_requirement("superuser")
@@ -0,0 +1,99 @@
+# utils/cache.py
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small in-process async cache.
+    - entries expire after `ttl` seconds or when invalidated
+    - with `maxsize`, the least recently used entry is evicted first
+    - concurrent misses on one key share a single computation
+    - hit / miss / invalidation counts and entry age for metrics, per key,
+      or rolled up under "*" when `per_key_stats` is off (many keys)
+    """
+
+    def __init__(self, ttl: float, name: str = "cache", maxsize: Optional[int] = None, per_key_stats: bool = True):
+        self.ttl = ttl
+        self.name = name
+        self.maxsize = maxsize
+        self.per_key_stats = per_key_stats
+        self._entries: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._stats: Dict[Hashable, Dict[str, Any]] = {}
+        self.evictions = 0
+
+    def _key_stats(self, key: Hashable) -> Dict[str, Any]:
+        key = key if self.per_key_stats else "*"
+        return self._stats.setdefault(key, {"hits": 0, "misses": 0, "invalidations": 0, "last_refresh": None})
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[1] < self.ttl:
+            self._entries.move_to_end(key)
+            return entry[0]
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                old_key, _ = self._entries.popitem(last=False)
+                self._locks.pop(old_key, None)
+                self.evictions += 1
+
+    async def get_or_set(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        stats = self._key_stats(key)
+        value = self.get(key)
+        if value is not None:
+            stats["hits"] += 1
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have refilled it while we waited
+            value = self.get(key)
+            if value is not None:
+                stats["hits"] += 1
+                return value
+            stats["misses"] += 1
+            value = await factory()
+            if value is not None:
+                self.set(key, value)
+                stats["last_refresh"] = time.time()
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every key when called without one."""
+        keys = [key] if key is not None else list(self._entries)
+        for k in keys:
+            if self._entries.pop(k, None) is not None:
+                self._key_stats(k)["invalidations"] += 1
+            self._locks.pop(k, None)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        keys = {}
+        for key, stats in self._stats.items():
+            if not self.per_key_stats:
+                keys[str(key)] = dict(stats)
+                continue
+            entry = self._entries.get(key)
+            age = now - entry[1] if entry else None
+            keys[str(key)] = {
+                **stats,
+                "cached": entry is not None and age < self.ttl,
+                "age_seconds": round(age, 3) if age is not None else None,
+                "stale": entry is not None and age >= self.ttl,
+            }
+        return {
+            "name": self.name,
+            "ttl_seconds": self.ttl,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "evictions": self.evictions,
+            "keys": keys,
+        }
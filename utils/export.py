@@ -0,0 +1,102 @@
+# utils/export.py
+import asyncio
+import csv
+import io
+import os
+import tempfile
+from datetime import date
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.database import async_session
+
+try:  # optional: only needed for format=xlsx
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+# Rows buffered per CSV chunk sent to the client
+EXPORT_FLUSH_ROWS = int(os.getenv("EXPORT_FLUSH_ROWS", 500))
+# Excel's sheet limit is 1,048,576 rows including the header; overflow goes to the next sheet
+XLSX_MAX_ROWS = 1_048_575
+CHUNK_BYTES = 64 * 1024
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _cell(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def crud_rows(crud, **query) -> AsyncIterator[Dict[str, Any]]:
+    """CRUDBase.stream on its own session: a StreamingResponse body outlives the request's dependencies."""
+    async with async_session() as session:
+        async for row in crud.stream(session, **query):
+            yield row
+
+
+# ------------------------
+# Writers
+# ------------------------
+async def csv_chunks(rows: AsyncIterator[Dict[str, Any]], columns: List[str]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    async for row in rows:
+        writer.writerow([_cell(row.get(c)) for c in columns])
+        pending += 1
+        if pending >= EXPORT_FLUSH_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+async def xlsx_chunks(rows: AsyncIterator[Dict[str, Any]], columns: List[str], title: str = "Export") -> AsyncIterator[bytes]:
+    # Write-only mode spools rows to a temp file as they are appended; the
+    # finished workbook (a zip) is then sent in chunks.
+    wb = Workbook(write_only=True)
+    sheet, written, sheets = None, XLSX_MAX_ROWS, 0
+    async for row in rows:
+        if written >= XLSX_MAX_ROWS:
+            sheets += 1
+            sheet = wb.create_sheet(title if sheets == 1 else f"{title} {sheets}")
+            sheet.append(columns)
+            written = 0
+        sheet.append([_cell(row.get(c)) for c in columns])
+        written += 1
+    if sheet is None:
+        wb.create_sheet(title).append(columns)
+
+    with tempfile.TemporaryFile() as fh:
+        await asyncio.to_thread(wb.save, fh)
+        fh.seek(0)
+        while chunk := await asyncio.to_thread(fh.read, CHUNK_BYTES):
+            yield chunk
+
+
+def export_response(rows: AsyncIterator[Dict[str, Any]], columns: List[str], fmt: str, name: str) -> StreamingResponse:
+    if fmt == "xlsx":
+        if Workbook is None:
+            raise HTTPException(status_code=501, detail="XLSX export requires openpyxl")
+        body = xlsx_chunks(rows, columns, title=name.title())
+    elif fmt == "csv":
+        body = csv_chunks(rows, columns)
+    else:
+        raise HTTPException(status_code=400, detail="Unsupported export format")
+
+    filename = f"{name}-{date.today().isoformat()}.{fmt}"
+    return StreamingResponse(body, media_type=MEDIA_TYPES[fmt], headers={"Content-Disposition": f'attachment; filename="{filename}"'})
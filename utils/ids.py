@@ -0,0 +1,57 @@
+# utils/ids.py
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+# ---------------------------
+# UUIDv7 (RFC 9562)
+# 48-bit unix ms timestamp, then a 12-bit counter (rand_a) that keeps ids
+# generated in the same millisecond monotonic, then 62 random bits.
+# New rows land at the right-hand edge of the primary key btree instead of
+# a random page, and ordering by id follows insert time.
+# ---------------------------
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def _build(ms: int, rand_a: int, rand_b: int) -> uuid.UUID:
+    value = (ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76                 # version 7
+    value |= (rand_a & 0xFFF) << 64
+    value |= 0b10 << 62                # RFC 4122 variant
+    value |= rand_b & ((1 << 62) - 1)
+    return uuid.UUID(int=value)
+
+
+def uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF  # leave headroom in the 12 bits
+        else:
+            # Same (or earlier, if the clock stepped back) millisecond: bump the counter,
+            # borrowing the next millisecond when it overflows
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+            ms = _last_ms
+        rand_a = _counter
+    return _build(ms, rand_a, int.from_bytes(os.urandom(8), "big"))
+
+
+def uuid7_lower_bound(moment: datetime) -> uuid.UUID:
+    """Smallest UUIDv7 for `moment`, for `id >= ...` range scans on time-ordered keys."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return _build(int(moment.timestamp() * 1000), 0, 0)
+
+
+def uuid7_timestamp(value: uuid.UUID) -> datetime:
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc)
+